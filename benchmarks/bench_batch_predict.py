@@ -0,0 +1,102 @@
+"""
+Throughput of POST /predict (one posting per call) vs POST /predict/batch.
+
+Fits the TF-IDF vectorizer and a LogisticRegression on synthetic postings,
+exports them in the serving formats, and drives the Flask app through its
+test client against a temporary SQLite database (prediction logging
+included). Sends every posting once through /predict, then through
+/predict/batch at several batch sizes, and checks that both endpoints
+return the same result for every posting.
+
+Usage:
+    python benchmarks/bench_batch_predict.py [n_postings]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / 'module3_web_interface'))
+
+import config.config as config
+from benchmarks.synthetic_data import make_postings
+
+BATCH_SIZES = [10, 100, 1000]
+
+
+def build_artifacts(tmp, n_train=5000):
+    """Fit on synthetic postings and load the serving artifacts."""
+    from sklearn.linear_model import LogisticRegression
+    from module1_data_preprocessing.data_loader import merge_text_columns
+    from module1_data_preprocessing.text_preprocessor import preprocess_dataframe
+    from module1_data_preprocessing.feature_extractor import create_tfidf_vectorizer
+    from module1_data_preprocessing.vectorizer_store import export_vectorizer, load_compact_vectorizer
+    from module2_model_training.linear_model_store import export_linear_model, load_linear_model
+    
+    train = merge_text_columns(make_postings(n_train), verbose=False, drop_columns=True)
+    train = preprocess_dataframe(train, text_column='text', cache=False, verbose=False)
+    vectorizer = create_tfidf_vectorizer()
+    model = LogisticRegression(max_iter=1000).fit(vectorizer.fit_transform(train['text_cleaned']),
+                                                  train[config.TARGET_COLUMN])
+    export_vectorizer(vectorizer, Path(tmp) / 'vectorizer.npz')
+    export_linear_model(model, Path(tmp) / 'linear_model.npz')
+    return (load_linear_model(Path(tmp) / 'linear_model.npz'),
+            load_compact_vectorizer(Path(tmp) / 'vectorizer.npz'))
+
+
+def main():
+    n_postings = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    requests = make_postings(n_postings, seed=7).fillna('')
+    postings = [{'job_description': d, 'requirements': r, 'benefits': b}
+                for d, r, b in zip(requests['description'], requests['requirements'],
+                                   requests['benefits'])]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # Log to a throwaway database; must be set before the app is imported
+        config.DATABASE_URI = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        model, vectorizer = build_artifacts(tmp)
+        
+        import app as web_app
+        from prediction_service import PredictionService
+        from module4_dashboard.database import PredictionLog
+        
+        # Uncached, as every posting is sent several times
+        web_app.prediction_service = PredictionService(model, vectorizer, cache=False)
+        # Log synchronously, so the timings include the database writes
+        if web_app.log_writer is not None:
+            web_app.log_writer.close()
+            web_app.log_writer = None
+        client = web_app.app.test_client()
+        
+        start = time.perf_counter()
+        single = [client.post('/predict', json=posting).get_json() for posting in postings]
+        single_time = time.perf_counter() - start
+        
+        runs = []
+        for batch_size in BATCH_SIZES:
+            start = time.perf_counter()
+            batched = []
+            for i in range(0, n_postings, batch_size):
+                response = client.post('/predict/batch', json={'postings': postings[i:i + batch_size]})
+                batched.extend(response.get_json()['results'])
+            runs.append((batch_size, time.perf_counter() - start, batched == single))
+        
+        with web_app.app.app_context():
+            logged = PredictionLog.query.count()
+    
+    print("="*60)
+    print(f"BATCH PREDICTION THROUGHPUT ({n_postings} postings, logging included)")
+    print("="*60)
+    print(f"  POST /predict         {n_postings / single_time:8.0f} postings/s  "
+          f"({single_time * 1000 / n_postings:.3f} ms each)")
+    for batch_size, elapsed, identical in runs:
+        print(f"  POST /predict/batch   {n_postings / elapsed:8.0f} postings/s  batch {batch_size:<5} "
+              f"speedup {single_time / elapsed:4.1f}x  identical={identical}")
+    print(f"  Rows logged: {logged} (expected {n_postings * (1 + len(BATCH_SIZES))})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Time and memory of GET /admin/export/csv, buffered vs streamed.
+
+Fills an SQLite database with synthetic prediction logs spread over 90
+days, then, for each variant in a fresh interpreter, downloads the export
+through the Flask test client as a logged-in admin. The response is read
+chunk by chunk and hashed rather than kept, so peak RSS reflects what the
+server side holds. Reports time to first byte, total time, peak RSS above
+the interpreter's footprint before the request, response size, and whether
+every variant produced the same CSV.
+
+- buffered: the previous handler, all rows loaded as ORM objects and the
+  CSV built in one string
+- streaming: the current handler, keyset batches written as they are read
+- gzip: the current handler with ?gzip=1
+
+Usage:
+    python benchmarks/bench_csv_export.py [n_rows]
+"""
+
+import csv
+import hashlib
+import io
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import config.config as config
+from benchmarks.bench_database import populate
+
+VARIANTS = ['buffered', 'streaming', 'gzip']
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (ru_maxrss is in KB on Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_variant(variant, path):
+    """Download the export once and print a RESULT line."""
+    config.DATABASE_URI = f"sqlite:///{path}"
+    
+    from flask import Flask, Response
+    from module4_dashboard.database import init_db, PredictionLog
+    from module4_dashboard.admin_routes import admin_bp
+    
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = 'bench'
+    init_db(app)
+    app.register_blueprint(admin_bp)
+    
+    @app.route('/export/buffered')
+    def export_buffered():
+        predictions = PredictionLog.query.order_by(PredictionLog.timestamp.desc()).all()
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow([
+            'ID', 'Prediction', 'Confidence', 'Real Probability', 
+            'Fake Probability', 'Timestamp', 'IP Address'
+        ])
+        for pred in predictions:
+            writer.writerow([
+                pred.id,
+                'Fake' if pred.prediction == 1 else 'Real',
+                pred.confidence,
+                pred.probability_real,
+                pred.probability_fake,
+                pred.timestamp.isoformat(),
+                pred.ip_address or ''
+            ])
+        return Response(output.getvalue(), mimetype='text/csv')
+    
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['admin_logged_in'] = True
+    url = {'buffered': '/export/buffered', 'streaming': '/admin/export/csv',
+           'gzip': '/admin/export/csv?gzip=1'}[variant]
+    
+    before = peak_rss_mb()
+    digest = hashlib.sha256()
+    decompressor = zlib.decompressobj(wbits=31) if variant == 'gzip' else None
+    size = 0
+    first_byte = None
+    start = time.perf_counter()
+    response = client.get(url)
+    for chunk in response.response:
+        if first_byte is None:
+            first_byte = time.perf_counter() - start
+        size += len(chunk)
+        digest.update(decompressor.decompress(chunk) if decompressor else chunk)
+    elapsed = time.perf_counter() - start
+    response.close()
+    assert response.status_code == 200, response.status_code
+    
+    print(f"RESULT {variant} {first_byte * 1000:.1f} {elapsed:.3f} "
+          f"{peak_rss_mb() - before:.1f} {size} {digest.hexdigest()}")
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--variant':
+        run_variant(sys.argv[2], sys.argv[3])
+        return
+    
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'bench.db'
+        populate(path, n_rows)
+        for variant in VARIANTS:
+            out = subprocess.run(
+                [sys.executable, __file__, '--variant', variant, str(path)],
+                capture_output=True, text=True, check=True
+            ).stdout
+            rows.append([l for l in out.splitlines() if l.startswith('RESULT')][-1].split()[1:])
+    
+    print("="*60)
+    print(f"CSV EXPORT ({n_rows} rows)")
+    print("="*60)
+    digests = {row[-1] for row in rows}
+    for variant, first_byte, elapsed, rss, size, _ in rows:
+        print(f"  {variant:<10} first byte {float(first_byte):8.1f} ms  total {float(elapsed):6.2f} s  "
+              f"peak RSS +{float(rss):6.1f} MB  {int(size) / 1e6:6.1f} MB sent")
+    print(f"  Identical CSV: {len(digests) == 1}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Mixed read/write load on the prediction log database, before and after
+the SQLite tuning (WAL journal, NORMAL sync, busy timeout, indexes).
+
+Fills an SQLite database with synthetic prediction logs spread over 90
+days, then, for each variant in a fresh interpreter and on its own copy,
+runs writer threads that log one prediction per commit (the synchronous
+/predict path) alongside reader threads that load the admin dashboard
+(prediction stats, 30 days of daily counts, recent predictions) for a
+fixed time. Reports throughput and p50/p99 latency of writes and
+dashboard loads, and how many operations failed with "database is locked".
+Then times each dashboard query on its own, next to the queries the
+dashboard ran before its aggregate tables: three COUNTs for the stats and
+a GROUP BY over 30 days of raw logs for the daily counts.
+
+- baseline: rollback journal, synchronous=FULL, no indexes on prediction_logs
+- tuned: the configured pragmas and indexes
+
+Usage:
+    python benchmarks/bench_database.py [n_rows] [seconds]
+"""
+
+import contextlib
+import io
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import config.config as config
+
+WRITERS = 4
+READERS = 2
+
+
+def populate(path, n_rows, seed=0):
+    """Create prediction_logs with n_rows rows over the last 90 days."""
+    rng = np.random.default_rng(seed)
+    now = datetime.utcnow()
+    offsets = np.sort(rng.uniform(0, 90 * 86400, n_rows))[::-1]
+    fake = rng.random(n_rows) < 0.3
+    confidence = rng.uniform(50, 100, n_rows).round(2)
+    
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE prediction_logs (id INTEGER PRIMARY KEY, job_description TEXT NOT NULL, "
+        "requirements TEXT, benefits TEXT, prediction INTEGER NOT NULL, confidence FLOAT NOT NULL, "
+        "probability_real FLOAT NOT NULL, probability_fake FLOAT NOT NULL, "
+        "timestamp DATETIME NOT NULL, ip_address VARCHAR(45))"
+    )
+    conn.executemany(
+        "INSERT INTO prediction_logs (job_description, prediction, confidence, probability_real, "
+        "probability_fake, timestamp, ip_address) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        ((f"Synthetic posting {i} " * 20, int(f), float(c),
+          float(100 - c if f else c), float(c if f else 100 - c),
+          (now - timedelta(seconds=float(o))).isoformat(sep=' '), '127.0.0.1')
+         for i, (o, f, c) in enumerate(zip(offsets, fake, confidence)))
+    )
+    conn.commit()
+    conn.close()
+
+
+def run_variant(variant, path, seconds):
+    """Run the mixed workload against one database copy and print a RESULT line."""
+    if variant == 'baseline':
+        config.SQLITE_JOURNAL_MODE = "DELETE"
+        config.SQLITE_SYNCHRONOUS = "FULL"
+    config.DATABASE_URI = f"sqlite:///{path}"
+    
+    from flask import Flask
+    from module4_dashboard.database import (
+        init_db, db, log_prediction, get_prediction_stats, PredictionLog
+    )
+    from module4_dashboard.dashboard import get_daily_predictions, get_recent_predictions
+    
+    app = Flask(__name__)
+    init_db(app)
+    if variant == 'baseline':
+        with app.app_context():
+            db.session.execute(db.text("DROP INDEX ix_prediction_logs_timestamp_id"))
+            db.session.execute(db.text("DROP INDEX ix_prediction_logs_prediction_timestamp_id"))
+            db.session.commit()
+    
+    result = {'prediction': 1, 'confidence': 91.5, 'probabilities': {'real': 8.5, 'fake': 91.5}}
+    times = {'write': [], 'read': []}
+    failed_writes = [0]
+    deadline = time.monotonic() + seconds
+    
+    def writer():
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            with app.app_context():
+                ok = log_prediction("Benchmark posting " * 20, "", "", result, '127.0.0.1')
+            times['write'].append(time.perf_counter() - start)
+            if ok is None:
+                failed_writes[0] += 1
+    
+    def reader():
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            with app.app_context():
+                get_prediction_stats()
+                get_daily_predictions(days=30)
+                get_recent_predictions(limit=10)
+            times['read'].append(time.perf_counter() - start)
+    
+    # The query helpers print and swallow their errors; count them from the output
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        threads = ([threading.Thread(target=writer) for _ in range(WRITERS)]
+                   + [threading.Thread(target=reader) for _ in range(READERS)])
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    locked = output.getvalue().count('database is locked')
+    
+    fields = [variant]
+    for kind in ['write', 'read']:
+        ms = np.array(times[kind]) * 1000
+        fields += [f"{len(ms) / elapsed:.1f}", f"{np.percentile(ms, 50):.2f}",
+                   f"{np.percentile(ms, 99):.2f}"]
+    print("RESULT " + " ".join(fields) + f" {failed_writes[0]} {locked}")
+    
+    def count_queries():
+        PredictionLog.query.count()
+        PredictionLog.query.filter_by(prediction=1).count()
+        PredictionLog.query.filter_by(prediction=0).count()
+    
+    def group_by_day():
+        day = db.func.date(PredictionLog.timestamp)
+        db.session.query(
+            day, db.func.count(PredictionLog.id),
+            db.func.sum(db.func.cast(PredictionLog.prediction == 0, db.Integer)),
+            db.func.sum(db.func.cast(PredictionLog.prediction == 1, db.Integer))
+        ).filter(
+            PredictionLog.timestamp >= datetime.utcnow() - timedelta(days=30)
+        ).group_by(day).order_by(day).all()
+    
+    queries = [('stats_counts', count_queries), ('stats', get_prediction_stats),
+               ('daily_group_by', group_by_day),
+               ('daily_30', lambda: get_daily_predictions(days=30)),
+               ('daily_3650', lambda: get_daily_predictions(days=3650)),
+               ('recent_10', lambda: get_recent_predictions(limit=10))]
+    for name, query in queries:
+        samples = []
+        for _ in range(5):
+            start = time.perf_counter()
+            with app.app_context():
+                query()
+            samples.append(time.perf_counter() - start)
+        print(f"QUERY {variant} {name} {np.median(samples) * 1000:.2f}")
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--variant':
+        run_variant(sys.argv[2], sys.argv[3], float(sys.argv[4]))
+        return
+    
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+    
+    rows, queries = [], {}
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / 'source.db'
+        populate(source, n_rows)
+        for variant in ['baseline', 'tuned']:
+            path = Path(tmp) / f'{variant}.db'
+            shutil.copy(source, path)
+            out = subprocess.run(
+                [sys.executable, __file__, '--variant', variant, str(path), str(seconds)],
+                capture_output=True, text=True, check=True
+            ).stdout
+            rows.append([l for l in out.splitlines() if l.startswith('RESULT')][-1].split()[1:])
+            for line in out.splitlines():
+                if line.startswith('QUERY'):
+                    _, _, name, ms = line.split()
+                    queries.setdefault(name, {})[variant] = float(ms)
+    
+    print("="*60)
+    print(f"DATABASE MIXED LOAD ({n_rows} rows, {WRITERS} writers, {READERS} dashboard "
+          f"readers, {seconds:.0f}s)")
+    print("="*60)
+    for variant, w_rate, w_p50, w_p99, r_rate, r_p50, r_p99, failed, locked in rows:
+        print(f"  {variant:<9} writes {float(w_rate):7.1f}/s  p50 {float(w_p50):7.2f} ms  "
+              f"p99 {float(w_p99):8.2f} ms | dashboard {float(r_rate):6.1f}/s  "
+              f"p50 {float(r_p50):7.2f} ms  p99 {float(r_p99):8.2f} ms | locked errors {locked}")
+    print()
+    labels = {'stats_counts': 'stats via 3 COUNTs (previous)', 'stats': 'get_prediction_stats',
+              'daily_group_by': '30 days via GROUP BY (previous)',
+              'daily_30': 'get_daily_predictions(30)', 'daily_3650': 'get_daily_predictions(3650)',
+              'recent_10': 'get_recent_predictions(10)'}
+    for name, times in queries.items():
+        print(f"  {labels[name]:<32} baseline {times['baseline']:8.2f} ms  tuned {times['tuned']:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Feature-matrix cache: re-vectorizing vs loading a joblib pickle vs memory-mapping .npz.
+
+Cleans synthetic postings once, then times how Module 2 can get the
+feature matrix: fitting the vectorizer again, loading the joblib dict the
+pipeline used to store, and loading the feature_store .npz (memory-mapped
+and read). Also checks that the loaded matrix equals the fitted one.
+
+Usage:
+    python benchmarks/bench_feature_cache.py [n_rows]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import joblib
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic_data import make_postings
+from config.config import TARGET_COLUMN
+from module1_data_preprocessing.data_loader import merge_text_columns
+from module1_data_preprocessing.text_preprocessor import preprocess_dataframe
+from module1_data_preprocessing.feature_extractor import extract_features
+from module1_data_preprocessing.feature_store import save_features, load_features, features_metadata
+
+
+def timed(func, repeat=3):
+    """Best wall time of func() over `repeat` runs, with its last result."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    df = merge_text_columns(make_postings(n_rows), verbose=False, drop_columns=True)
+    df = preprocess_dataframe(df, text_column='text', cache=False, verbose=False)
+    
+    fit_time, (X, vectorizer) = timed(lambda: extract_features(df), repeat=1)
+    features = {'X': X, 'y': df[TARGET_COLUMN].values, 'row_ids': df.index.values,
+                'vectorizer': vectorizer}
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        joblib_path = Path(tmp) / 'vectorize.joblib'
+        npz_path = Path(tmp) / 'features.npz'
+        joblib.dump(features, joblib_path)
+        save_features(features, npz_path, metadata=features_metadata(df, target_column=TARGET_COLUMN))
+        
+        joblib_time, _ = timed(lambda: joblib.load(joblib_path))
+        mmap_time, (loaded, _) = timed(lambda: load_features(npz_path))
+        read_time, _ = timed(lambda: load_features(npz_path, memory_map=False))
+        digest_time, _ = timed(lambda: features_metadata(df, target_column=TARGET_COLUMN))
+        identical = (loaded['X'] != X).nnz == 0
+        joblib_mb = joblib_path.stat().st_size / 1024 / 1024
+        npz_mb = npz_path.stat().st_size / 1024 / 1024
+    
+    print("="*60)
+    print(f"FEATURE CACHE ({n_rows} rows, {X.shape[1]} features, {X.nnz} non-zeros)")
+    print("="*60)
+    print(f"  re-vectorize (extract_features)  {fit_time * 1000:9.1f} ms")
+    print(f"  joblib dict load                 {joblib_time * 1000:9.1f} ms  {joblib_mb:6.1f} MB")
+    print(f"  .npz read                        {read_time * 1000:9.1f} ms  {npz_mb:6.1f} MB")
+    print(f"  .npz memory-mapped               {mmap_time * 1000:9.1f} ms")
+    print(f"  inputs digest (staleness check)  {digest_time * 1000:9.1f} ms")
+    print(f"  Identical matrix: {identical}")
+
+
+if __name__ == "__main__":
+    main()
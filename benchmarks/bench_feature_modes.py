@@ -0,0 +1,113 @@
+"""
+Feature-mode comparison: vocabulary TF-IDF vs hashing TF-IDF.
+
+Uses a synthetic cleaned-text corpus with a Zipfian vocabulary (so the
+TF-IDF vocabulary grows like it does on real postings) and labels planted
+from a handful of signal terms. For each mode it reports fit time,
+transform throughput, peak traced memory while fitting, artifact size and
+load time, and the accuracy/F1 of a logistic regression on a held-out split.
+
+Usage:
+    python benchmarks/bench_feature_modes.py [n_docs]
+"""
+
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import joblib
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import train_test_split
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from module1_data_preprocessing.feature_extractor import create_vectorizer
+
+SIGNAL_TERMS = ['earn', 'fast', 'weekly', 'wire', 'fee', 'guaranteed']
+
+
+def make_corpus(n_docs, seed=42, vocab_size=50000):
+    """
+    Build cleaned documents and labels.
+    
+    Returns:
+        tuple: (list of documents, label array)
+    """
+    rng = np.random.default_rng(seed)
+    vocab = np.array([f"w{i}" for i in range(vocab_size)])
+    # Zipf-like term frequencies, like natural text
+    weights = 1.0 / np.arange(1, vocab_size + 1)
+    weights /= weights.sum()
+    
+    labels = (rng.random(n_docs) < 0.1).astype(int)
+    docs = []
+    for label in labels:
+        words = list(rng.choice(vocab, size=rng.integers(80, 300), p=weights))
+        # Fake postings use signal terms more often; real ones occasionally do
+        n_signal = rng.poisson(4 if label else 0.8)
+        words += list(rng.choice(SIGNAL_TERMS, size=n_signal))
+        rng.shuffle(words)
+        docs.append(' '.join(words))
+    return docs, labels
+
+
+def run_mode(mode, train_docs, test_docs, y_train, y_test):
+    """Fit, measure and evaluate one feature mode."""
+    vectorizer = create_vectorizer(mode)
+    tracemalloc.start()
+    start = time.perf_counter()
+    X_train = vectorizer.fit_transform(train_docs)
+    fit_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    start = time.perf_counter()
+    X_test = vectorizer.transform(test_docs)
+    transform_rate = len(test_docs) / (time.perf_counter() - start)
+    
+    buffer = io.BytesIO()
+    joblib.dump(vectorizer, buffer)
+    artifact_bytes = buffer.tell()
+    buffer.seek(0)
+    start = time.perf_counter()
+    joblib.load(buffer)
+    load_time = time.perf_counter() - start
+    
+    model = LogisticRegression(max_iter=1000).fit(X_train, y_train)
+    y_pred = model.predict(X_test)
+    return {
+        'fit_time': fit_time,
+        'transform_rate': transform_rate,
+        'peak_mb': peak / 1024 / 1024,
+        'artifact_mb': artifact_bytes / 1024 / 1024,
+        'load_ms': load_time * 1000,
+        'accuracy': accuracy_score(y_test, y_pred),
+        'f1': f1_score(y_test, y_pred),
+    }
+
+
+def main():
+    n_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    docs, labels = make_corpus(n_docs)
+    train_docs, test_docs, y_train, y_test = train_test_split(
+        docs, labels, test_size=0.2, random_state=42, stratify=labels
+    )
+    
+    print("="*60)
+    print(f"FEATURE MODES ({n_docs} documents)")
+    print("="*60)
+    for mode in ['tfidf', 'hashing']:
+        r = run_mode(mode, train_docs, test_docs, y_train, y_test)
+        print(f"  {mode:<8} fit {r['fit_time']:6.2f}s  transform {r['transform_rate']:8.0f} docs/s  "
+              f"fit peak {r['peak_mb']:7.1f} MB")
+        print(f"  {'':<8} artifact {r['artifact_mb']:7.2f} MB  load {r['load_ms']:7.1f} ms  "
+              f"accuracy {r['accuracy']:.4f}  F1 {r['f1']:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Batch vs out-of-core training.
+
+Cleans synthetic postings once into an Arrow processed-data file, then runs
+each variant in a fresh subprocess:
+
+- batch: load the whole file, build the full TF-IDF matrix, split, and fit
+  LogisticRegression (what prepare_data() + train_logistic_regression() do)
+- incremental: stream memory-mapped chunks, fit the vectorizer in one pass
+  and train SGDClassifier with partial_fit (incremental_trainer)
+- incremental-hashing: the same with the hashing feature mode, whose fit
+  only keeps document frequencies
+
+Labels are planted from a few scam phrases plus noise, since the synthetic
+postings' own labels are random. Reports wall time, peak RSS and holdout
+accuracy/F1 of the fake class.
+
+Usage:
+    python benchmarks/bench_incremental_training.py [n_rows] [chunksize]
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic_data import make_postings
+
+SIGNAL_TERMS = {'earn', 'money', 'fast', 'weekly', 'pay'}
+
+
+def peak_rss_mb():
+    """High-water RSS of this process (ru_maxrss survives exec)."""
+    with open('/proc/self/status') as f:
+        return next(int(line.split()[1]) for line in f if line.startswith('VmHWM')) / 1024
+
+
+def build_processed(path, n_rows, seed=42):
+    """Clean synthetic postings and write them as Arrow processed data."""
+    from config.config import TARGET_COLUMN
+    from module1_data_preprocessing.data_loader import merge_text_columns
+    from module1_data_preprocessing.text_preprocessor import preprocess_dataframe
+    from module1_data_preprocessing.processed_store import save_processed_data
+    
+    df = merge_text_columns(make_postings(n_rows, seed=seed), verbose=False, drop_columns=True)
+    df = preprocess_dataframe(df, text_column='text', cache=False, verbose=False)
+    rng = np.random.default_rng(seed)
+    signal = np.array([sum(t in SIGNAL_TERMS for t in text.split()) / max(len(text.split()), 1)
+                       for text in df['text_cleaned']])
+    threshold = np.quantile(signal, 0.9)
+    labels = (signal > threshold) ^ (rng.random(len(df)) < 0.02)
+    df[TARGET_COLUMN] = labels.astype(int)
+    save_processed_data(df[['text_cleaned', TARGET_COLUMN]], path, fmt='arrow')
+
+
+def run_variant(variant, path, chunksize):
+    """Train one way and print time, peak RSS and holdout metrics."""
+    from sklearn.metrics import accuracy_score, f1_score
+    
+    start = time.perf_counter()
+    if variant == 'batch':
+        from sklearn.model_selection import train_test_split
+        from config.config import TEST_SIZE, RANDOM_STATE, TARGET_COLUMN
+        from module1_data_preprocessing.processed_store import load_processed_data
+        from module1_data_preprocessing.feature_extractor import extract_features
+        from module2_model_training.model_trainer import train_logistic_regression
+        
+        df, _ = load_processed_data(path, fmt='arrow')
+        X, _ = extract_features(df, text_column='text_cleaned', fit=True)
+        y = df[TARGET_COLUMN].values
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE, stratify=y
+        )
+        model = train_logistic_regression(X_train, y_train)
+        y_pred = model.predict(X_test)
+    else:
+        from module1_data_preprocessing.processed_store import iter_processed_chunks
+        from module1_data_preprocessing.feature_extractor import create_vectorizer
+        from module1_data_preprocessing.streaming import fit_vectorizer_streaming, iter_feature_chunks
+        from module2_model_training.incremental_trainer import train_incremental, holdout_mask
+        
+        def chunk_source():
+            return iter_processed_chunks(path, chunksize=chunksize)
+        
+        mode = 'hashing' if variant == 'incremental-hashing' else 'tfidf'
+        vectorizer = fit_vectorizer_streaming(chunk_source(), create_vectorizer(mode))
+        model = train_incremental(chunk_source, vectorizer)
+        y_test, y_pred = [], []
+        for X, y, rows in iter_feature_chunks(chunk_source(), vectorizer):
+            test = holdout_mask(rows, y)
+            y_test.append(y[test])
+            y_pred.append(model.predict(X[test]))
+        y_test, y_pred = np.concatenate(y_test), np.concatenate(y_pred)
+    elapsed = time.perf_counter() - start
+    
+    print(f"RESULT {variant} {elapsed:.2f} {peak_rss_mb():.1f} "
+          f"{accuracy_score(y_test, y_pred):.4f} {f1_score(y_test, y_pred):.4f} {len(y_test)}")
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--variant':
+        run_variant(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+        return
+    
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    chunksize = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'processed.arrow'
+        build_processed(path, n_rows)
+        
+        results = []
+        for variant in ['batch', 'incremental', 'incremental-hashing']:
+            out = subprocess.run(
+                [sys.executable, __file__, '--variant', variant, str(path), str(chunksize)],
+                capture_output=True, text=True, check=True
+            ).stdout
+            line = [l for l in out.splitlines() if l.startswith('RESULT')][-1]
+            _, name, elapsed, peak, accuracy, f1, n_test = line.split()
+            results.append((name, float(elapsed), float(peak), float(accuracy), float(f1), int(n_test)))
+    
+    print("="*60)
+    print(f"BATCH VS OUT-OF-CORE TRAINING ({n_rows} rows, {chunksize}-row chunks)")
+    print("="*60)
+    for name, elapsed, peak, accuracy, f1, n_test in results:
+        print(f"  {name:<20} {elapsed:7.2f}s  peak RSS {peak:7.1f} MB  "
+              f"accuracy {accuracy:.4f}  F1 {f1:.4f}  (holdout {n_test})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+End-to-end PredictionService.predict() latency, and a check that the fused
+path returns what the previous path returned.
+
+Cleans synthetic postings, fits the TF-IDF vectorizer and a
+LogisticRegression, and then predicts held-out postings one at a time,
+from raw fields to the result dict, in two ways:
+
+- reference: the previous predict() path, i.e. the sklearn vectorizer's
+  transform() followed by separate model.predict() and
+  model.predict_proba() calls
+- fused: PredictionService with the compact vectorizer and exported linear
+  weights, which counts, weights and scores each document in one pass
+
+The check compares labels and rounded probabilities for every posting.
+The script exits non-zero if any result differs or if the fused p50/p99
+latency exceeds PREDICT_LATENCY_P50_MS / PREDICT_LATENCY_P99_MS.
+
+Usage:
+    python benchmarks/bench_inference_latency.py [n_train] [n_requests]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic_data import make_postings
+from config.config import PREDICT_LATENCY_P50_MS, PREDICT_LATENCY_P99_MS, TARGET_COLUMN
+
+
+def reference_predict(service, job_description, requirements="", benefits=""):
+    """PredictionService.predict() as it was before the fused path."""
+    combined_text = f"{job_description} {requirements} {benefits}".strip()
+    tokens = service.preprocess_tokens(combined_text)
+    X = service.vectorizer.transform([tokens])
+    prediction = service.model.predict(X)[0]
+    probabilities = service.model.predict_proba(X)[0]
+    return {
+        'prediction': int(prediction),
+        'label': "Fake" if prediction == 1 else "Real",
+        'confidence': round(max(probabilities) * 100, 2),
+        'probabilities': {
+            'real': round(probabilities[0] * 100, 2),
+            'fake': round(probabilities[1] * 100, 2)
+        }
+    }
+
+
+def timed_requests(predict, postings):
+    """Run predict on every posting; return results and latencies in ms."""
+    results, times = [], []
+    for fields in postings:
+        start = time.perf_counter()
+        results.append(predict(*fields))
+        times.append(time.perf_counter() - start)
+    return results, np.array(times) * 1000
+
+
+def main():
+    from sklearn.linear_model import LogisticRegression
+    from module1_data_preprocessing.data_loader import merge_text_columns
+    from module1_data_preprocessing.text_preprocessor import preprocess_dataframe
+    from module1_data_preprocessing.feature_extractor import create_tfidf_vectorizer
+    from module1_data_preprocessing.vectorizer_store import export_vectorizer, load_compact_vectorizer
+    from module2_model_training.linear_model_store import export_linear_model, load_linear_model
+    from module3_web_interface.prediction_service import PredictionService
+    
+    n_train = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    n_requests = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    
+    train = merge_text_columns(make_postings(n_train), verbose=False, drop_columns=True)
+    train = preprocess_dataframe(train, text_column='text', cache=False, verbose=False)
+    vectorizer = create_tfidf_vectorizer()
+    model = LogisticRegression(max_iter=1000).fit(vectorizer.fit_transform(train['text_cleaned']),
+                                                  train[TARGET_COLUMN])
+    
+    requests = make_postings(n_requests, seed=7).fillna('')
+    postings = list(zip(requests['description'], requests['requirements'], requests['benefits']))
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        export_vectorizer(vectorizer, Path(tmp) / 'vectorizer.npz')
+        export_linear_model(model, Path(tmp) / 'linear_model.npz')
+        # Uncached, so every request is vectorized and scored
+        fused = PredictionService(load_linear_model(Path(tmp) / 'linear_model.npz'),
+                                  load_compact_vectorizer(Path(tmp) / 'vectorizer.npz'),
+                                  cache=False)
+        reference = PredictionService(model, vectorizer, cache=False)
+        
+        # Warm up both paths (first-call allocations, lazy imports)
+        for fields in postings[:20]:
+            fused.predict(*fields)
+            reference_predict(reference, *fields)
+        
+        expected, reference_ms = timed_requests(
+            lambda *fields: reference_predict(reference, *fields), postings)
+        actual, fused_ms = timed_requests(fused.predict, postings)
+        
+        # Cleaning is shared by both paths; time it alone to show what is left
+        _, cleaning_ms = timed_requests(
+            lambda *fields: fused.preprocess_tokens(' '.join(fields).strip()), postings)
+    
+    mismatches = sum(a != e for a, e in zip(actual, expected))
+    p50, p99 = np.percentile(fused_ms, 50), np.percentile(fused_ms, 99)
+    
+    print("="*60)
+    print(f"PREDICT LATENCY ({n_train} training postings, {n_requests} requests)")
+    print("="*60)
+    for name, times in [('reference (sklearn)', reference_ms), ('fused', fused_ms),
+                        ('  of which cleaning', cleaning_ms)]:
+        print(f"  {name:<22} p50 {np.percentile(times, 50):6.3f} ms  "
+              f"p99 {np.percentile(times, 99):6.3f} ms  mean {times.mean():6.3f} ms")
+    print(f"  Results differing from the reference path: {mismatches}")
+    print(f"  Targets: p50 <= {PREDICT_LATENCY_P50_MS} ms, p99 <= {PREDICT_LATENCY_P99_MS} ms")
+    
+    if mismatches:
+        print("✗ Fused predictions differ from the reference path")
+        sys.exit(1)
+    if p50 > PREDICT_LATENCY_P50_MS or p99 > PREDICT_LATENCY_P99_MS:
+        print("✗ Latency target missed")
+        sys.exit(1)
+    print("✓ Fused path matches the reference and meets the latency targets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Per-request scoring: sklearn LogisticRegression vs the exported LinearScorer.
+
+Fits the TF-IDF vectorizer and a LogisticRegression on a synthetic corpus,
+exports the model with float32 and float64 weights, and scores held-out
+documents one row at a time, as the web app does. Reports p50/p99 latency
+of the scoring call alone (features already extracted), the largest
+probability difference from sklearn and label agreement. Then loads each
+artifact in a fresh interpreter and reports load time, RSS added and
+whether scikit-learn got imported.
+
+Usage:
+    python benchmarks/bench_linear_scoring.py [n_docs]
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+def rss_mb():
+    """Current resident set size of this process."""
+    with open('/proc/self/status') as f:
+        return next(int(line.split()[1]) for line in f if line.startswith('VmRSS')) / 1024
+
+
+def latencies(func, rows):
+    """Wall time of func(row) for every row, in microseconds."""
+    times = []
+    for row in rows:
+        start = time.perf_counter()
+        func(row)
+        times.append(time.perf_counter() - start)
+    return np.array(times) * 1e6
+
+
+def run_variant(variant, path):
+    """Load one model artifact and print load time, RSS growth and sklearn use."""
+    before = rss_mb()
+    start = time.perf_counter()
+    if variant == 'pickle':
+        from module2_model_training.model_trainer import load_model
+        load_model(path)
+    else:
+        from module2_model_training.linear_model_store import load_linear_model
+        load_linear_model(path)
+    elapsed = time.perf_counter() - start
+    print(f"RESULT {variant} {elapsed:.4f} {rss_mb() - before:.1f} {int('sklearn' in sys.modules)}")
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--variant':
+        run_variant(sys.argv[2], sys.argv[3])
+        return
+    
+    from sklearn.linear_model import LogisticRegression
+    from benchmarks.bench_feature_modes import make_corpus
+    from module1_data_preprocessing.feature_extractor import create_tfidf_vectorizer
+    from module2_model_training.model_trainer import save_model
+    from module2_model_training.linear_model_store import export_linear_model, load_linear_model
+    
+    n_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    docs, labels = make_corpus(n_docs)
+    held_out, _ = make_corpus(2000, seed=7)
+    vectorizer = create_tfidf_vectorizer()
+    model = LogisticRegression(max_iter=1000).fit(vectorizer.fit_transform(docs), labels)
+    X = vectorizer.transform(held_out)
+    rows = [X[i] for i in range(X.shape[0])]
+    expected = model.predict_proba(X)
+    
+    def sklearn_score(row):
+        return model.predict(row), model.predict_proba(row)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {'pickle': Path(tmp) / 'best_model.pkl'}
+        save_model(model, paths['pickle'], "Logistic Regression")
+        timings = [('sklearn predict + predict_proba', latencies(sklearn_score, rows), 0.0, 1.0)]
+        for dtype in ['float32', 'float64']:
+            path = paths[dtype] = Path(tmp) / f'linear_{dtype}.npz'
+            export_linear_model(model, path, dtype=dtype)
+            scorer = load_linear_model(path)
+            error = np.abs(scorer.predict_proba(X) - expected).max()
+            agreement = (scorer.predict(X) == model.predict(X)).mean()
+            timings.append((f'LinearScorer {dtype} predict_proba',
+                            latencies(scorer.predict_proba, rows), error, agreement))
+            timings.append((f'LinearScorer {dtype} score_row',
+                            latencies(lambda row: scorer.score_row(row.indices, row.data), rows),
+                            error, agreement))
+        
+        loads = []
+        for variant in ['pickle', 'float64', 'float32']:
+            out = subprocess.run(
+                [sys.executable, __file__, '--variant', variant, str(paths[variant])],
+                capture_output=True, text=True, check=True
+            ).stdout
+            line = [l for l in out.splitlines() if l.startswith('RESULT')][-1]
+            _, name, elapsed, rss, sklearn = line.split()
+            loads.append((name, paths[variant].stat().st_size / 1024, float(elapsed), float(rss),
+                          sklearn == '1'))
+    
+    print("="*60)
+    print(f"LINEAR SCORING ({n_docs} training documents, {X.shape[1]} features, "
+          f"{len(rows)} requests)")
+    print("="*60)
+    for name, times, error, agreement in timings:
+        print(f"  {name:<36} p50 {np.percentile(times, 50):7.1f} us  "
+              f"p99 {np.percentile(times, 99):7.1f} us  max |dp| {error:.1e}  "
+              f"labels {agreement * 100:.1f}%")
+    print()
+    for name, size_kb, elapsed, rss, sklearn in loads:
+        print(f"  load {name:<8} {size_kb:7.1f} KB  {elapsed * 1000:7.1f} ms  "
+              f"+RSS {rss:6.1f} MB  sklearn imported={sklearn}")
+
+
+if __name__ == "__main__":
+    main()
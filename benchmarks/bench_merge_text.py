@@ -0,0 +1,81 @@
+"""
+merge_text_columns() comparison: row-wise ' '.join vs column-wise concatenation.
+
+Each variant runs in a fresh subprocess that reads the same CSV, merges the
+text columns and reports the merge time, the frame's memory afterwards and
+the process's peak RSS.
+
+Usage:
+    python benchmarks/bench_merge_text.py [n_rows]
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic_data import write_postings_csv
+
+
+def run_variant(variant, csv_path):
+    """Merge in-process and print timing, frame memory and peak RSS."""
+    import hashlib
+    from config.config import TEXT_COLUMNS
+    from module1_data_preprocessing.data_loader import load_dataset, merge_text_columns
+    
+    df = load_dataset(csv_path)
+    start = time.perf_counter()
+    if variant == 'row-join':
+        # The previous implementation
+        df['text'] = df[TEXT_COLUMNS].fillna('').agg(' '.join, axis=1)
+    elif variant == 'columnwise':
+        df = merge_text_columns(df, verbose=False)
+    elif variant == 'columnwise+drop':
+        df = merge_text_columns(df, verbose=False, drop_columns=True)
+    elapsed = time.perf_counter() - start
+    
+    # ru_maxrss survives exec, so read the high-water mark of this address space
+    with open('/proc/self/status') as f:
+        peak_kb = next(int(line.split()[1]) for line in f if line.startswith('VmHWM'))
+    frame_mb = df.memory_usage(deep=True).sum() / 1024 / 1024
+    digest = hashlib.blake2b()
+    for text in df['text']:
+        digest.update(text.encode('utf-8') + b'\0')
+    digest = digest.hexdigest()[:16]
+    print(f"RESULT {variant} {elapsed:.3f} {frame_mb:.1f} {peak_kb / 1024:.1f} {digest}")
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--variant':
+        run_variant(sys.argv[2], sys.argv[3])
+        return
+    
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / 'postings.csv'
+        write_postings_csv(csv_path, n_rows)
+        
+        results = []
+        for variant in ['row-join', 'columnwise', 'columnwise+drop']:
+            out = subprocess.run(
+                [sys.executable, __file__, '--variant', variant, str(csv_path)],
+                capture_output=True, text=True, check=True
+            ).stdout
+            line = [l for l in out.splitlines() if l.startswith('RESULT')][-1]
+            _, name, elapsed, frame_mb, peak, digest = line.split()
+            results.append((name, float(elapsed), float(frame_mb), float(peak), digest))
+    
+    print("="*60)
+    print(f"MERGE TEXT COLUMNS ({n_rows} rows)")
+    print("="*60)
+    for name, elapsed, frame_mb, peak, digest in results:
+        print(f"  {name:<16} {elapsed:7.3f}s  frame {frame_mb:7.1f} MB  peak RSS {peak:7.1f} MB")
+    print(f"  Identical merged text: {len({r[-1] for r in results}) == 1}")
+
+
+if __name__ == "__main__":
+    main()
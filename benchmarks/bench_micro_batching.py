@@ -0,0 +1,105 @@
+"""
+Throughput vs latency of PredictionService.predict() called directly and
+through the MicroBatcher, under concurrent callers.
+
+Fits the TF-IDF vectorizer and a LogisticRegression on synthetic postings
+and loads the serving artifacts. For each number of concurrent client
+threads, every thread predicts its share of the postings one at a time,
+either calling predict() directly or going through a MicroBatcher with a
+given max batch size (N) and max wait (T). Reports throughput, p50/p99
+latency per request and the mean batch size the batcher formed, and
+checks that every result equals the direct one.
+
+Usage:
+    python benchmarks/bench_micro_batching.py [n_postings]
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / 'module3_web_interface'))
+
+from benchmarks.synthetic_data import make_postings
+from benchmarks.bench_batch_predict import build_artifacts
+
+CONCURRENCY = [1, 4, 16, 64]
+# (max_batch_size, max_wait_ms)
+SETTINGS = [(8, 1), (32, 5), (128, 20)]
+
+
+def drive(predict, postings, n_threads):
+    """
+    Predict every posting from n_threads client threads.
+    
+    Returns:
+        tuple: (results in posting order, latencies in ms, elapsed seconds)
+    """
+    results = [None] * len(postings)
+    latencies = [0.0] * len(postings)
+    
+    def client(offset):
+        for i in range(offset, len(postings), n_threads):
+            start = time.perf_counter()
+            results[i] = predict(postings[i])
+            latencies[i] = time.perf_counter() - start
+    
+    threads = [threading.Thread(target=client, args=(offset,)) for offset in range(n_threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, np.array(latencies) * 1000, time.perf_counter() - start
+
+
+def main():
+    from prediction_service import PredictionService
+    from micro_batcher import MicroBatcher
+    
+    n_postings = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    requests = make_postings(n_postings, seed=7).fillna('')
+    postings = [{'job_description': d, 'requirements': r, 'benefits': b}
+                for d, r, b in zip(requests['description'], requests['requirements'],
+                                   requests['benefits'])]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # Uncached, as every posting is predicted in every run
+        service = PredictionService(*build_artifacts(tmp), cache=False)
+    
+    def direct(posting):
+        return service.predict(posting['job_description'], posting['requirements'],
+                               posting['benefits'])
+    
+    expected = [direct(posting) for posting in postings]
+    
+    rows = []
+    for n_threads in CONCURRENCY:
+        _, times, elapsed = drive(direct, postings, n_threads)
+        rows.append((n_threads, 'direct', times, elapsed, None, True))
+        for max_batch_size, max_wait_ms in SETTINGS:
+            batcher = MicroBatcher(service.predict_batch, max_batch_size, max_wait_ms)
+            results, times, elapsed = drive(
+                lambda posting: batcher.submit(posting).result(), postings, n_threads)
+            batcher.close()
+            rows.append((n_threads, f'N={max_batch_size} T={max_wait_ms}ms', times, elapsed,
+                         batcher.stats()['mean_batch_size'], results == expected))
+    
+    print("="*60)
+    print(f"MICRO-BATCHING ({n_postings} postings per run)")
+    print("="*60)
+    for n_threads, name, times, elapsed, mean_batch, identical in rows:
+        batch = f"{mean_batch:6.1f}" if mean_batch is not None else "     -"
+        print(f"  clients {n_threads:<3} {name:<16} {n_postings / elapsed:7.0f} postings/s  "
+              f"p50 {np.percentile(times, 50):7.2f} ms  p99 {np.percentile(times, 99):7.2f} ms  "
+              f"batch {batch}  identical={identical}")
+
+
+if __name__ == "__main__":
+    main()
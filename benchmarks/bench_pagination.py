@@ -0,0 +1,113 @@
+"""
+Page latency of /admin/api/predictions by depth, OFFSET vs keyset.
+
+Fills an SQLite database with synthetic prediction logs spread over 90
+days and opens it with init_db(), which creates the (timestamp, id) and
+(prediction, timestamp, id) indexes. For pages of 50 rows starting at
+increasing depths, times the previous way to reach deep rows (a LIMIT
+large enough to include the page, as /admin/api/predictions?limit= did),
+an OFFSET page, and get_predictions_page() with a cursor, all with and
+without a label filter. Checks that the keyset page holds the same rows
+as the OFFSET page and prints the query plan of the keyset query.
+
+Usage:
+    python benchmarks/bench_pagination.py [n_rows]
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import config.config as config
+from benchmarks.bench_database import populate
+
+PAGE_SIZE = 50
+DEPTHS = [0, 1000, 10000, 50000, 100000, 190000]
+# The unpaged LIMIT loads every row above the page; skip it deeper than this
+UNPAGED_MAX_DEPTH = 10000
+REPEATS = 5
+
+
+def median_ms(fn):
+    """Median wall time of fn() over REPEATS runs, in ms, and its last result."""
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - start)
+    return np.median(samples) * 1000, result
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'bench.db'
+        populate(path, n_rows)
+        config.DATABASE_URI = f"sqlite:///{path}"
+        
+        from flask import Flask
+        from module4_dashboard.database import init_db, db, PredictionLog
+        from module4_dashboard.dashboard import get_predictions_page, encode_cursor, _newest_first
+        
+        app = Flask(__name__)
+        with contextlib.redirect_stdout(io.StringIO()):
+            init_db(app)
+        
+        rows = []
+        with app.app_context():
+            for label in [None, 1]:
+                base = PredictionLog.query
+                if label is not None:
+                    base = base.filter(PredictionLog.prediction == label)
+                ordered = _newest_first(base)
+                matching = base.count()
+                
+                for depth in [depth for depth in DEPTHS if depth + PAGE_SIZE <= matching]:
+                    # Cursor of the row just above the page, as the previous page returns it
+                    cursor = None
+                    if depth:
+                        above = ordered.offset(depth - 1).first()
+                        cursor = encode_cursor(above.timestamp, above.id)
+                    
+                    unpaged_ms = None
+                    if depth <= UNPAGED_MAX_DEPTH:
+                        unpaged_ms, _ = median_ms(
+                            lambda: [p.to_dict() for p in ordered.limit(depth + PAGE_SIZE).all()])
+                    offset_ms, offset_page = median_ms(
+                        lambda: [p.to_dict() for p in ordered.offset(depth).limit(PAGE_SIZE).all()])
+                    keyset_ms, keyset_page = median_ms(
+                        lambda: get_predictions_page(PAGE_SIZE, cursor, label)['predictions'])
+                    rows.append((label, depth, unpaged_ms, offset_ms, keyset_ms,
+                                 offset_page == keyset_page))
+            
+            above = ordered.offset(matching // 2).first()
+            keyset = _newest_first(base, (above.timestamp, above.id)).limit(PAGE_SIZE + 1)
+            compiled = keyset.statement.compile(db.engine)
+            plan = db.session.connection().exec_driver_sql(
+                "EXPLAIN QUERY PLAN " + str(compiled),
+                tuple(str(compiled.params[name]) for name in compiled.positiontup)
+            ).fetchall()
+    
+    print("="*60)
+    print(f"PREDICTION PAGING ({n_rows} rows, {PAGE_SIZE} per page, median of {REPEATS})")
+    print("="*60)
+    for label, depth, unpaged_ms, offset_ms, keyset_ms, identical in rows:
+        name = 'all' if label is None else 'fake'
+        unpaged = f"{unpaged_ms:9.2f} ms" if unpaged_ms is not None else f"{'-':>12}"
+        print(f"  {name:<5} depth {depth:>7}  limit=depth+page {unpaged}  "
+              f"OFFSET {offset_ms:8.2f} ms  keyset {keyset_ms:6.2f} ms  identical={identical}")
+    print()
+    print("  Keyset plan (label=fake): " + "; ".join(row[-1] for row in plan))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Scaling benchmark for multi-core preprocess_dataframe().
+
+Usage:
+    python benchmarks/bench_parallel_preprocessing.py [n_rows]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic_data import make_postings
+from module1_data_preprocessing.data_loader import merge_text_columns
+from module1_data_preprocessing.text_preprocessor import preprocess_dataframe
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    df = merge_text_columns(make_postings(n_rows))
+    cpus = os.cpu_count() or 1
+    job_counts = sorted({1, 2, 4, 8, 16, 32, cpus})
+    job_counts = [n for n in job_counts if n <= cpus]
+    
+    results = []
+    baseline = None
+    for n_jobs in job_counts:
+        start = time.perf_counter()
+        out = preprocess_dataframe(df.copy(), text_column='text', n_jobs=n_jobs)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline = (elapsed, out['text_cleaned'].tolist())
+        results.append((n_jobs, elapsed, out['text_cleaned'].tolist() == baseline[1]))
+    
+    print("\n" + "="*60)
+    print(f"PARALLEL PREPROCESSING SCALING ({n_rows} rows, {cpus} CPUs)")
+    print("="*60)
+    for n_jobs, elapsed, same in results:
+        print(f"  n_jobs={n_jobs:<3} {elapsed:7.2f}s  {n_rows / elapsed:8.0f} rows/s  "
+              f"speedup {baseline[0] / elapsed:4.1f}x  identical={same}")
+
+
+if __name__ == "__main__":
+    main()
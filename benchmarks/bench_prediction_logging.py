@@ -0,0 +1,99 @@
+"""
+POST /predict latency with synchronous vs write-behind prediction logging.
+
+Fits the TF-IDF vectorizer and a LogisticRegression on synthetic postings,
+exports them in the serving formats, and drives the Flask app through its
+test client against a temporary SQLite database. Sends every posting once
+with synchronous logging (one commit per request) and once with the
+write-behind PredictionLogWriter, then checks that every prediction was
+logged. Finally queues a burst larger than the writer's queue to show the
+drop policy.
+
+Usage:
+    python benchmarks/bench_prediction_logging.py [n_postings]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / 'module3_web_interface'))
+
+import config.config as config
+from benchmarks.synthetic_data import make_postings
+from benchmarks.bench_batch_predict import build_artifacts
+
+
+def drive(client, postings):
+    """POST every posting to /predict; return latencies in ms and elapsed seconds."""
+    times = []
+    start = time.perf_counter()
+    for posting in postings:
+        t = time.perf_counter()
+        client.post('/predict', json=posting)
+        times.append(time.perf_counter() - t)
+    return np.array(times) * 1000, time.perf_counter() - start
+
+
+def main():
+    n_postings = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    requests = make_postings(n_postings, seed=7).fillna('')
+    postings = [{'job_description': d, 'requirements': r, 'benefits': b}
+                for d, r, b in zip(requests['description'], requests['requirements'],
+                                   requests['benefits'])]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # Log to a throwaway database; must be set before the app is imported
+        config.DATABASE_URI = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        model, vectorizer = build_artifacts(tmp)
+        
+        import app as web_app
+        from prediction_service import PredictionService
+        from module4_dashboard.database import PredictionLog
+        from module4_dashboard.log_writer import PredictionLogWriter
+        
+        web_app.prediction_service = PredictionService(model, vectorizer, cache=False)
+        client = web_app.app.test_client()
+        writer = web_app.log_writer or PredictionLogWriter(web_app.app)
+        
+        def logged():
+            with web_app.app.app_context():
+                return PredictionLog.query.count()
+        
+        runs = []
+        for name, log_writer in [('synchronous', None), ('write-behind', writer)]:
+            web_app.log_writer = log_writer
+            before = logged()
+            times, elapsed = drive(client, postings)
+            if log_writer is not None:
+                log_writer.flush()
+            runs.append((name, times, elapsed, logged() - before))
+        stats = writer.stats()
+        writer.close()
+        
+        # A burst twice the queue size, queued faster than it can be written
+        burst = PredictionLogWriter(web_app.app, queue_size=1000)
+        result = web_app.prediction_service.predict(**postings[0])
+        burst.log_many([(postings[0], result)] * 2000)
+        burst.close()
+        burst_stats = burst.stats()
+    
+    print("="*60)
+    print(f"PREDICTION LOGGING ({n_postings} requests to POST /predict)")
+    print("="*60)
+    for name, times, elapsed, rows in runs:
+        print(f"  {name:<13} {n_postings / elapsed:6.0f} req/s  p50 {np.percentile(times, 50):6.3f} ms  "
+              f"p99 {np.percentile(times, 99):6.3f} ms  rows logged {rows}/{n_postings}")
+    print(f"  Write-behind: {stats['batches']} batches, lag last {stats['last_lag_ms']} ms "
+          f"max {stats['max_lag_ms']} ms, dropped {stats['dropped']}, failed {stats['failed']}")
+    print(f"  Burst of 2000 rows into a 1000-row queue: written {burst_stats['written']}, "
+          f"dropped {burst_stats['dropped']}")
+
+
+if __name__ == "__main__":
+    main()
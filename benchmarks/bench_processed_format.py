@@ -0,0 +1,93 @@
+"""
+Processed-data format comparison: CSV vs columnar Arrow IPC.
+
+Builds processed data once, saves it as the legacy full-dataframe CSV, a CSV
+of only the training columns and an Arrow IPC file, then reports file size,
+load time and peak RSS for each. Each load runs in a fresh subprocess.
+
+Usage:
+    python benchmarks/bench_processed_format.py [n_rows]
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic_data import make_postings
+
+
+def run_variant(variant, file_path):
+    """Load processed data in-process and print its timing and peak RSS."""
+    import pandas as pd
+    from module1_data_preprocessing.processed_store import load_processed_data
+    
+    start = time.perf_counter()
+    if variant.startswith('csv'):
+        df = pd.read_csv(file_path)
+    else:
+        df, _ = load_processed_data(file_path, fmt='arrow', memory_map=(variant == 'arrow-mmap'))
+    # Touch every string so lazily materialized columns are counted
+    chars = int(df['text_cleaned'].str.len().sum())
+    elapsed = time.perf_counter() - start
+    
+    # ru_maxrss survives exec from this (large) parent, so read the high-water
+    # mark of the fresh address space instead
+    with open('/proc/self/status') as f:
+        peak_kb = next(int(line.split()[1]) for line in f if line.startswith('VmHWM'))
+    peak_mb = peak_kb / 1024
+    print(f"RESULT {variant} {len(df)} {elapsed:.3f} {peak_mb:.1f} {chars}")
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--variant':
+        run_variant(sys.argv[2], sys.argv[3])
+        return
+    
+    from config.config import TARGET_COLUMN
+    from module1_data_preprocessing.data_loader import merge_text_columns
+    from module1_data_preprocessing.text_preprocessor import preprocess_dataframe
+    from module1_data_preprocessing.processed_store import save_processed_data
+    
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    df = merge_text_columns(make_postings(n_rows), verbose=False)
+    df = preprocess_dataframe(df, cache=False, verbose=False)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        files = {
+            'csv-full': Path(tmp) / 'processed_full.csv',
+            'csv-columns': Path(tmp) / 'processed_columns.csv',
+            'arrow': Path(tmp) / 'processed.arrow',
+        }
+        save_processed_data(df, files['csv-full'], fmt='csv')
+        save_processed_data(df[['text_cleaned', TARGET_COLUMN]], files['csv-columns'], fmt='csv')
+        save_processed_data(df, files['arrow'], fmt='arrow')
+        
+        results = []
+        for variant in ['csv-full', 'csv-columns', 'arrow-read', 'arrow-mmap']:
+            file_path = files.get(variant, files['arrow'])
+            out = subprocess.run(
+                [sys.executable, __file__, '--variant', variant, str(file_path)],
+                capture_output=True, text=True, check=True
+            ).stdout
+            line = [l for l in out.splitlines() if l.startswith('RESULT')][-1]
+            _, name, rows, elapsed, peak, chars = line.split()
+            size_mb = file_path.stat().st_size / 1024 / 1024
+            results.append((name, int(rows), size_mb, float(elapsed), float(peak), int(chars)))
+    
+    print("="*60)
+    print(f"PROCESSED DATA FORMAT ({n_rows} rows)")
+    print("="*60)
+    for name, rows, size_mb, elapsed, peak, chars in results:
+        print(f"  {name:<12} {rows:>7} rows  {size_mb:7.1f} MB  load {elapsed:6.3f}s  "
+              f"peak RSS {peak:7.1f} MB")
+    same = len({(rows, chars) for _, rows, _, _, _, chars in results}) == 1
+    print(f"  Same rows and text in every format: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+PredictionService.predict() throughput with and without the result cache,
+on traffic where many postings are reposts of earlier ones.
+
+Fits the TF-IDF vectorizer and a LogisticRegression on synthetic postings
+and loads the serving artifacts. Builds a request stream in which a share
+of the requests repost an earlier posting with different markup and
+whitespace, so the raw text differs but the cleaned text is the same.
+Predicts the stream without a cache, with the in-memory cache (unbounded
+and with a small memory bound) and with the shared SQLite cache, and
+checks that every cached run returns the uncached results.
+
+Usage:
+    python benchmarks/bench_result_cache.py [n_requests] [repost_share]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / 'module3_web_interface'))
+
+from benchmarks.synthetic_data import make_postings
+from benchmarks.bench_batch_predict import build_artifacts
+
+
+def repost(fields):
+    """The same posting with other markup and whitespace."""
+    description, requirements, benefits = fields
+    return f"<div><p>{description}</p></div>", f"  {requirements}\n", benefits.replace(' ', '  ')
+
+
+def make_traffic(n_requests, repost_share, seed=0):
+    """Request stream where repost_share of the requests repeat an earlier posting."""
+    rng = np.random.default_rng(seed)
+    n_unique = max(1, int(n_requests * (1 - repost_share)))
+    frame = make_postings(n_unique, seed=7).fillna('')
+    unique = list(zip(frame['description'], frame['requirements'], frame['benefits']))
+    
+    traffic = list(unique)
+    for _ in range(n_requests - n_unique):
+        # Popular postings get reposted more often
+        index = min(int(rng.zipf(1.5)) - 1, n_unique - 1)
+        traffic.append(repost(unique[index]))
+    order = rng.permutation(len(traffic))
+    return [traffic[i] for i in order]
+
+
+def run(service, traffic):
+    """Predict the stream; return results, latencies in ms and elapsed seconds."""
+    results, times = [], []
+    start = time.perf_counter()
+    for fields in traffic:
+        t = time.perf_counter()
+        results.append(service.predict(*fields))
+        times.append(time.perf_counter() - t)
+    return results, np.array(times) * 1000, time.perf_counter() - start
+
+
+def main():
+    from prediction_service import PredictionService
+    from result_cache import LocalResultCache, SQLiteResultCache
+    
+    n_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repost_share = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    traffic = make_traffic(n_requests, repost_share)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        model, vectorizer = build_artifacts(tmp)
+        caches = [
+            ('no cache', False),
+            ('memory', LocalResultCache(max_entries=10 ** 6, max_bytes=1 << 30)),
+            ('memory, 256 KB bound', LocalResultCache(max_bytes=256 * 1024)),
+            ('sqlite (shared)', SQLiteResultCache(Path(tmp) / 'result_cache.db')),
+        ]
+        
+        rows, expected = [], None
+        for name, cache in caches:
+            service = PredictionService(model, vectorizer, cache=cache, model_version='bench')
+            results, times, elapsed = run(service, traffic)
+            if expected is None:
+                expected = results
+            stats = service.cache_stats() or {}
+            rows.append((name, times, elapsed, stats, results == expected))
+    
+    print("="*60)
+    print(f"RESULT CACHE ({n_requests} requests, {repost_share:.0%} reposts)")
+    print("="*60)
+    for name, times, elapsed, stats, identical in rows:
+        cache = (f"hit rate {stats['hit_rate'] * 100:5.1f}%  {stats['entries']:5} entries "
+                 f"{stats['bytes'] / 1024:7.1f} KB  evictions {stats['evictions']}"
+                 if stats else "")
+        print(f"  {name:<22} {n_requests / elapsed:6.0f} req/s  p50 {np.percentile(times, 50):6.3f} ms  "
+              f"p99 {np.percentile(times, 99):6.3f} ms  identical={identical}  {cache}")
+
+
+if __name__ == "__main__":
+    main()
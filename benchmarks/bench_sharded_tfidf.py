@@ -0,0 +1,66 @@
+"""
+Scaling benchmark for sharded TF-IDF fitting.
+
+Compares TfidfVectorizer.fit_transform() in one process with
+fit_transform_sharded() at n_jobs = 1, 2, 4, ... up to the CPU count (or
+max_jobs), on a corpus with a Zipfian vocabulary, and checks that the
+vocabulary, IDF weights and feature matrix match (the matrix against
+fit().transform(), which sklearn's fit_transform() matches to within 1 ulp).
+
+Usage:
+    python benchmarks/bench_sharded_tfidf.py [n_docs] [max_jobs]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.bench_feature_modes import make_corpus
+from module1_data_preprocessing.feature_extractor import create_tfidf_vectorizer
+from module1_data_preprocessing.sharded_tfidf import fit_transform_sharded
+
+
+def main():
+    n_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    cpus = os.cpu_count() or 1
+    max_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else cpus
+    docs, _ = make_corpus(n_docs)
+    job_counts = [n for n in sorted({1, 2, 4, 8, 16, 32, max_jobs}) if n <= max_jobs]
+    
+    # Baseline is what extract_features() runs in one process
+    reference = create_tfidf_vectorizer()
+    start = time.perf_counter()
+    reference.fit_transform(docs)
+    baseline = time.perf_counter() - start
+    # fit_transform() itself differs from fit().transform() in the last bit,
+    # so the sharded matrix is compared with the latter
+    X_reference = reference.transform(docs)
+    
+    results = []
+    for n_jobs in job_counts:
+        start = time.perf_counter()
+        X, vectorizer = fit_transform_sharded(docs, create_tfidf_vectorizer(), n_jobs)
+        elapsed = time.perf_counter() - start
+        same = (vectorizer.vocabulary_ == reference.vocabulary_
+                and np.array_equal(vectorizer.idf_, reference.idf_)
+                and (X != X_reference).nnz == 0)
+        results.append((n_jobs, elapsed, same))
+    
+    print("\n" + "="*60)
+    print(f"SHARDED TF-IDF SCALING ({n_docs} documents, {cpus} CPUs)")
+    print("="*60)
+    print(f"  single process  {baseline:7.2f}s  {n_docs / baseline:8.0f} docs/s  "
+          f"vocabulary {len(reference.vocabulary_)}")
+    for n_jobs, elapsed, same in results:
+        print(f"  n_jobs={n_jobs:<8} {elapsed:7.2f}s  {n_docs / elapsed:8.0f} docs/s  "
+              f"speedup {baseline / elapsed:4.1f}x  identical={same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Peak-RSS comparison: whole-file load_dataset() vs streaming iter_dataset().
+
+Each variant runs in a fresh subprocess so its peak RSS is measured in
+isolation. The last variants also fit the TF-IDF vectorizer: on the loaded
+dataframe, on the stream through TfidfVectorizer.fit() (which builds the
+whole document-term matrix), and with fit_vectorizer_streaming(), which
+merges per-chunk counts.
+
+Usage:
+    python benchmarks/bench_streaming_ingest.py [n_rows]
+"""
+
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic_data import write_postings_csv
+
+
+def count_rows(chunks, seen):
+    """Pass chunks through, adding their row counts to seen[0]."""
+    for chunk in chunks:
+        seen[0] += len(chunk)
+        yield chunk
+
+
+def run_variant(variant, csv_path):
+    """Run one variant in-process and print its timing and peak RSS."""
+    from module1_data_preprocessing.data_loader import load_dataset, iter_dataset, merge_text_columns
+    from module1_data_preprocessing.text_preprocessor import preprocess_dataframe
+    from module1_data_preprocessing.streaming import iter_cleaned_chunks, fit_vectorizer_streaming
+    from module1_data_preprocessing.feature_extractor import create_tfidf_vectorizer
+    
+    start = time.perf_counter()
+    rows = 0
+    seen = [0]
+    if variant == 'imports-only':
+        pass
+    elif variant == 'load':
+        df = load_dataset(csv_path)
+        rows = len(df)
+    elif variant == 'stream':
+        for chunk in iter_dataset(csv_path):
+            rows += len(chunk)
+    elif variant == 'load+clean':
+        df = merge_text_columns(load_dataset(csv_path), verbose=False)
+        df = preprocess_dataframe(df, cache=False, verbose=False)
+        rows = len(df)
+    elif variant == 'stream+clean':
+        for chunk in iter_cleaned_chunks(csv_path, cache=False):
+            rows += len(chunk)
+    elif variant == 'load+clean+fit':
+        df = merge_text_columns(load_dataset(csv_path), verbose=False)
+        df = preprocess_dataframe(df, cache=False, verbose=False)
+        create_tfidf_vectorizer().fit(df['text_cleaned'])
+        rows = len(df)
+    elif variant == 'stream+fit(sklearn)':
+        chunks = count_rows(iter_cleaned_chunks(csv_path, cache=False), seen)
+        create_tfidf_vectorizer().fit(text for chunk in chunks for text in chunk['text_cleaned'])
+        rows = seen[0]
+    elif variant == 'stream+fit':
+        chunks = count_rows(iter_cleaned_chunks(csv_path, cache=False), seen)
+        fit_vectorizer_streaming(chunks, create_tfidf_vectorizer())
+        rows = seen[0]
+    elapsed = time.perf_counter() - start
+    
+    # ru_maxrss is in kilobytes on Linux
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"RESULT {variant} {rows} {elapsed:.2f} {peak_mb:.1f}")
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--variant':
+        run_variant(sys.argv[2], sys.argv[3])
+        return
+    
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / 'postings.csv'
+        write_postings_csv(csv_path, n_rows)
+        size_mb = csv_path.stat().st_size / 1024 / 1024
+        
+        results = []
+        for variant in ['imports-only', 'load', 'stream', 'load+clean', 'stream+clean',
+                        'load+clean+fit', 'stream+fit(sklearn)', 'stream+fit']:
+            out = subprocess.run(
+                [sys.executable, __file__, '--variant', variant, str(csv_path)],
+                capture_output=True, text=True, check=True
+            ).stdout
+            line = [l for l in out.splitlines() if l.startswith('RESULT')][-1]
+            _, name, rows, elapsed, peak = line.split()
+            results.append((name, int(rows), float(elapsed), float(peak)))
+    
+    print("="*60)
+    print(f"STREAMING INGESTION ({n_rows} rows, {size_mb:.0f} MB CSV)")
+    print("="*60)
+    for name, rows, elapsed, peak in results:
+        print(f"  {name:<19} {rows:>8} rows  {elapsed:7.2f}s  peak RSS {peak:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Throughput comparison: per-row clean_text() vs the batch clean_texts() engine.
+
+Usage:
+    python benchmarks/bench_text_cleaning.py [n_rows]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic_data import make_postings
+from module1_data_preprocessing.data_loader import merge_text_columns
+from module1_data_preprocessing.text_preprocessor import clean_text, clean_texts
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    df = merge_text_columns(make_postings(n_rows))
+    texts = df['text'].tolist()
+    
+    print("="*60)
+    print(f"TEXT CLEANING THROUGHPUT ({n_rows} rows)")
+    print("="*60)
+    
+    start = time.perf_counter()
+    baseline = [clean_text(text) for text in texts]
+    baseline_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    batch = clean_texts(texts)
+    batch_time = time.perf_counter() - start
+    
+    print(f"  clean_text (per row): {baseline_time:8.2f}s  {n_rows / baseline_time:10.0f} rows/s")
+    print(f"  clean_texts (batch):  {batch_time:8.2f}s  {n_rows / batch_time:10.0f} rows/s")
+    print(f"  Speedup: {baseline_time / batch_time:.1f}x")
+    print(f"  Identical output: {baseline == batch}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Vectorizer artifact: joblib pickle vs compact .npz export.
+
+Fits the TF-IDF vectorizer on a synthetic corpus, saves it both ways, then
+loads each artifact in a fresh subprocess (as a web worker would) and
+reports file size, load time including imports, load time of the
+artifact alone, resident memory added by the load and whether
+scikit-learn got imported. Also checks that the
+compact vectorizer transforms held-out documents identically.
+
+Usage:
+    python benchmarks/bench_vectorizer_artifact.py [n_docs]
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+def rss_mb():
+    """Current resident set size of this process."""
+    with open('/proc/self/status') as f:
+        return next(int(line.split()[1]) for line in f if line.startswith('VmRSS')) / 1024
+
+
+def load(variant, path):
+    """Load one artifact, importing what it needs."""
+    if variant == 'pickle':
+        import joblib
+        return joblib.load(path)
+    from module1_data_preprocessing.vectorizer_store import load_compact_vectorizer
+    return load_compact_vectorizer(path)
+
+
+def run_variant(variant, path):
+    """Load one artifact and print load time, RSS growth and sklearn use."""
+    before = rss_mb()
+    start = time.perf_counter()
+    vectorizer = load(variant, path)
+    elapsed = time.perf_counter() - start
+    after = rss_mb()
+    
+    # Loading again, with the modules already imported, times the artifact itself
+    start = time.perf_counter()
+    load(variant, path)
+    warm = time.perf_counter() - start
+    
+    # First transform, which touches the vocabulary and IDF pages
+    start = time.perf_counter()
+    vectorizer.transform(['software engineer python data'])
+    first = time.perf_counter() - start
+    print(f"RESULT {variant} {elapsed:.4f} {warm:.4f} {after - before:.1f} {first:.4f} "
+          f"{int('sklearn' in sys.modules)}")
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--variant':
+        run_variant(sys.argv[2], sys.argv[3])
+        return
+    
+    from benchmarks.bench_feature_modes import make_corpus
+    from module1_data_preprocessing.feature_extractor import create_tfidf_vectorizer, save_vectorizer
+    from module1_data_preprocessing.vectorizer_store import load_compact_vectorizer
+    
+    n_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    docs, _ = make_corpus(n_docs)
+    held_out, _ = make_corpus(1000, seed=7)
+    vectorizer = create_tfidf_vectorizer().fit(docs)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {'pickle': Path(tmp) / 'tfidf_vectorizer.pkl', 'compact': Path(tmp) / 'vectorizer.npz'}
+        save_vectorizer(vectorizer, paths['pickle'], paths['compact'])
+        compact = load_compact_vectorizer(paths['compact'])
+        identical = (compact.transform(held_out) != vectorizer.transform(held_out)).nnz == 0
+        
+        results = []
+        for variant, path in paths.items():
+            # Best of three cold loads, each in a new interpreter
+            runs = []
+            for _ in range(3):
+                out = subprocess.run(
+                    [sys.executable, __file__, '--variant', variant, str(path)],
+                    capture_output=True, text=True, check=True
+                ).stdout
+                line = [l for l in out.splitlines() if l.startswith('RESULT')][-1]
+                _, name, elapsed, warm, rss, first, sklearn = line.split()
+                runs.append((float(elapsed), float(warm), float(rss), float(first), sklearn == '1'))
+            results.append((variant, path.stat().st_size / 1024) + min(runs))
+    
+    print("="*60)
+    print(f"VECTORIZER ARTIFACT ({n_docs} documents, {len(vectorizer.vocabulary_)} terms)")
+    print("="*60)
+    for variant, size_kb, elapsed, warm, rss, first, sklearn in results:
+        print(f"  {variant:<8} {size_kb:7.1f} KB  cold load {elapsed * 1000:7.1f} ms  "
+              f"(artifact {warm * 1000:5.1f} ms)  +RSS {rss:6.1f} MB  "
+              f"first transform {first * 1000:5.2f} ms  sklearn imported={sklearn}")
+    print(f"  Identical transform: {identical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Synthetic job postings for benchmarks.
+Generates data shaped like the Fake Job Postings dataset so benchmarks can
+run without downloading it.
+"""
+
+import random
+import pandas as pd
+
+WORDS = (
+    "we are looking for a motivated software engineer data analyst sales "
+    "manager to join our growing team you will work with customers python "
+    "sql excel communication skills experience degree required salary "
+    "benefits health insurance remote work from home earn money fast no "
+    "experience needed apply now weekly pay training provided office london "
+    "new york marketing design product support the and of to in with on"
+).split()
+
+MARKUP = ['<p>', '</p>', '<br>', '<li>', '</li>', '<strong>', '</strong>', '&amp;', '&nbsp;']
+
+
+def make_text(rng, n_words, markup=True):
+    """
+    Build one text field.
+    
+    Args:
+        rng (random.Random): Random generator
+        n_words (int): Number of words
+        markup (bool): Sprinkle HTML tags and entities into the text
+    
+    Returns:
+        str: Generated text
+    """
+    out = []
+    for _ in range(n_words):
+        word = rng.choice(WORDS)
+        if rng.random() < 0.1:
+            word = word.capitalize() + rng.choice(['.', ',', '!', ':'])
+        if markup and rng.random() < 0.05:
+            word = rng.choice(MARKUP) + word
+        out.append(word)
+    return ' '.join(out)
+
+
+def write_postings_csv(file_path, n_rows=10000, seed=42, chunk_rows=10000):
+    """
+    Write synthetic postings to a CSV file in batches.
+    
+    Args:
+        file_path (str): Output CSV path
+        n_rows (int): Number of postings
+        seed (int): Random seed
+        chunk_rows (int): Postings generated per batch
+    """
+    for start in range(0, n_rows, chunk_rows):
+        df = make_postings(min(chunk_rows, n_rows - start), seed=seed + start)
+        df['job_id'] += start
+        df.to_csv(file_path, mode='w' if start == 0 else 'a', header=start == 0, index=False)
+
+
+def make_postings(n_rows=10000, seed=42, markup=True):
+    """
+    Build a dataframe of synthetic job postings.
+    
+    Args:
+        n_rows (int): Number of postings
+        seed (int): Random seed
+        markup (bool): Include HTML markup in the text fields
+    
+    Returns:
+        pd.DataFrame: Postings with description, requirements, benefits,
+                      fraudulent and a few unused columns
+    """
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        'job_id': range(1, n_rows + 1),
+        'title': [make_text(rng, 4, markup=False) for _ in range(n_rows)],
+        'description': [make_text(rng, rng.randint(80, 250), markup) for _ in range(n_rows)],
+        'requirements': [make_text(rng, rng.randint(0, 80), markup) if rng.random() > 0.15 else None
+                         for _ in range(n_rows)],
+        'benefits': [make_text(rng, rng.randint(0, 40), markup) if rng.random() > 0.4 else None
+                     for _ in range(n_rows)],
+        'fraudulent': [int(rng.random() < 0.05) for _ in range(n_rows)],
+        # Columns present in the real dataset but unused by the pipeline
+        'company_profile': [make_text(rng, rng.randint(20, 120), markup) for _ in range(n_rows)],
+        'location': [rng.choice(['US, NY, New York', 'GB, LND, London', 'US, CA, San Francisco'])
+                     for _ in range(n_rows)],
+        'salary_range': [rng.choice(['', '40000-60000', '60000-90000']) for _ in range(n_rows)],
+        'employment_type': [rng.choice(['Full-time', 'Part-time', 'Contract']) for _ in range(n_rows)],
+    })
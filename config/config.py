@@ -13,13 +13,32 @@ PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 RAW_DATA_PATH = DATA_DIR / "fake_job_postings.csv"
 PROCESSED_DATA_PATH = DATA_DIR / "processed_data.csv"
+PROCESSED_DATA_ARROW_PATH = DATA_DIR / "processed_data.arrow"
+
+# Processed-data format: "arrow" (columnar, memory-mappable; needs pyarrow) or "csv"
+PROCESSED_DATA_FORMAT = "arrow"
 
 # Model paths
 MODELS_DIR = PROJECT_ROOT / "models"
 TFIDF_VECTORIZER_PATH = MODELS_DIR / "tfidf_vectorizer.pkl"
+# Vocabulary, IDF and analyzer settings only (uncompressed .npz, memory-mapped by the web app)
+COMPACT_VECTORIZER_PATH = MODELS_DIR / "vectorizer.npz"
 LOGISTIC_REGRESSION_MODEL_PATH = MODELS_DIR / "logistic_regression_model.pkl"
 RANDOM_FOREST_MODEL_PATH = MODELS_DIR / "random_forest_model.pkl"
 BEST_MODEL_PATH = MODELS_DIR / "best_model.pkl"
+SGD_MODEL_PATH = MODELS_DIR / "sgd_model.pkl"
+# Best model as weights plus intercept when it is linear (uncompressed .npz, served without sklearn)
+LINEAR_MODEL_PATH = MODELS_DIR / "linear_model.npz"
+# float64 matches sklearn's probabilities to rounding error (~1e-15); float32
+# halves the file and stays within ~1e-6
+LINEAR_MODEL_DTYPE = "float64"
+
+# Dataset columns used downstream (everything else is pruned when streaming)
+TEXT_COLUMNS = ['description', 'requirements', 'benefits']
+TARGET_COLUMN = 'fraudulent'
+
+# Streaming ingestion: rows per CSV chunk
+STREAM_CHUNK_SIZE = 5000
 
 # Logs path
 LOGS_DIR = PROJECT_ROOT / "logs"
@@ -29,27 +48,115 @@ TEST_SIZE = 0.2
 RANDOM_STATE = 42
 TARGET_ACCURACY = 0.90
 
+# Model hyperparameters (random_state comes from RANDOM_STATE)
+LOGISTIC_REGRESSION_PARAMS = {'max_iter': 1000}
+RANDOM_FOREST_PARAMS = {'n_estimators': 100}
+
+# Out-of-core training (SGDClassifier.partial_fit over streamed chunks)
+SGD_PARAMS = {'loss': 'log_loss', 'alpha': 1e-5}
+INCREMENTAL_EPOCHS = 5
+
 # TF-IDF Configuration
 MAX_FEATURES = 5000
 NGRAM_RANGE = (1, 2)
 MIN_DF = 2
 MAX_DF = 0.95
 
+# Feature mode: "tfidf" (fitted vocabulary) or "hashing" (stateless, no vocabulary)
+FEATURE_MODE = "tfidf"
+HASHING_N_FEATURES = 2 ** 18
+HASHING_USE_IDF = True
+
 # Text Preprocessing Configuration
 REMOVE_STOPWORDS = True
 LOWERCASE = True
 REMOVE_PUNCTUATION = True
 REMOVE_HTML = True
 
+# Parallel preprocessing (n_jobs=-1 uses every CPU, 1 disables the process pool)
+PREPROCESS_N_JOBS = 1
+PREPROCESS_CHUNK_SIZE = 1000
+
+# Cleaned-text cache (reused across module 1 and module 2 runs)
+CLEANED_TEXT_CACHE_ENABLED = True
+CLEANED_TEXT_CACHE_PATH = DATA_DIR / "cleaned_text_cache.db"
+CLEANED_TEXT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Incremental pipeline: stage artifacts keyed by fingerprint, newest N kept per stage
+PIPELINE_CACHE_DIR = DATA_DIR / "pipeline_cache"
+PIPELINE_CACHE_KEEP = 2
+
 # Web Application Configuration
 FLASK_HOST = "0.0.0.0"
 FLASK_PORT = 5000
 FLASK_DEBUG = True
 
+# Per-request predict() latency targets (benchmarks/bench_inference_latency.py)
+PREDICT_LATENCY_P50_MS = 1.0
+PREDICT_LATENCY_P99_MS = 5.0
+
+# Most postings accepted by one POST /predict/batch request
+PREDICT_BATCH_MAX_ITEMS = 1000
+
+# Micro-batching of concurrent POST /predict calls (opt-in): a batch is scored
+# once it holds MAX_SIZE postings or MAX_WAIT_MS after its first one arrived
+MICRO_BATCH_ENABLED = os.environ.get("MICRO_BATCH_ENABLED", "0") == "1"
+MICRO_BATCH_MAX_SIZE = 32
+MICRO_BATCH_MAX_WAIT_MS = 5
+# Longest a /predict request waits for its batch before answering 503
+MICRO_BATCH_TIMEOUT_SECONDS = 10
+
+# Prediction result cache, keyed on cleaned text and model version:
+# "memory" (per worker), "sqlite" (shared by the workers on one host) or "none"
+RESULT_CACHE_BACKEND = os.environ.get("RESULT_CACHE_BACKEND", "memory")
+RESULT_CACHE_PATH = DATA_DIR / "result_cache.db"
+RESULT_CACHE_MAX_ENTRIES = 10000
+RESULT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+RESULT_CACHE_TTL_SECONDS = 3600
+# A shared-cache hit refreshes its LRU timestamp at most this often, so
+# read-heavy traffic does not take SQLite's write lock on every hit
+RESULT_CACHE_TOUCH_INTERVAL_SECONDS = 60
+# How often the web app checks models/ for new artifacts and reloads them
+ARTIFACT_CHECK_INTERVAL_SECONDS = 5
+
 # Database Configuration
 DATABASE_PATH = PROJECT_ROOT / "jobcheck.db"
 DATABASE_URI = f"sqlite:///{DATABASE_PATH}"
 
+# SQLite pragmas applied to every connection: WAL lets dashboard reads run
+# alongside prediction writes, and NORMAL sync skips an fsync per commit
+# (a power loss can lose the last commits, never corrupt the database)
+SQLITE_JOURNAL_MODE = "WAL"
+SQLITE_SYNCHRONOUS = "NORMAL"
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+# Connection pool (SQLAlchemy QueuePool)
+DATABASE_POOL_SIZE = 5
+DATABASE_MAX_OVERFLOW = 10
+DATABASE_POOL_TIMEOUT = 30
+DATABASE_POOL_RECYCLE = 3600
+
+# Write-behind prediction logging: requests queue their log rows and a
+# background thread inserts them in bulk every BATCH_SIZE rows or FLUSH_INTERVAL_MS.
+# Rows still queued are lost if the process is killed; see module4_dashboard/README.md
+PREDICTION_LOG_WRITE_BEHIND = os.environ.get("PREDICTION_LOG_WRITE_BEHIND", "1") == "1"
+PREDICTION_LOG_QUEUE_SIZE = 10000
+PREDICTION_LOG_BATCH_SIZE = 500
+PREDICTION_LOG_FLUSH_INTERVAL_MS = 200
+# When the queue is full: "drop" the new rows (requests never wait) or "block" until there is room
+PREDICTION_LOG_OVERFLOW = "drop"
+
+# Admin dashboard trend window in days (default, and most allowed via /admin/api/trends?days=)
+DASHBOARD_TREND_DAYS = 30
+DASHBOARD_TREND_MAX_DAYS = 3650
+
+# Rows fetched per query while streaming /admin/export/csv
+EXPORT_BATCH_SIZE = 1000
+
+# Page size of /admin/api/predictions: default, and the most a ?limit= can ask for
+PREDICTIONS_PAGE_SIZE = 10
+PREDICTIONS_MAX_PAGE_SIZE = 500
+
 # JWT Configuration
 JWT_SECRET_KEY = os.environ.get("JWT_SECRET_KEY", "your-secret-key-change-in-production")
 JWT_ACCESS_TOKEN_EXPIRES = 3600  # 1 hour
@@ -10,16 +10,30 @@ import sys
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
-from config.config import RAW_DATA_PATH, DATA_DIR
+from config.config import (
+    RAW_DATA_PATH,
+    DATA_DIR,
+    TEXT_COLUMNS,
+    TARGET_COLUMN,
+    STREAM_CHUNK_SIZE
+)
 
+# Compact dtypes for the columns kept by the streaming loader
+STREAM_DTYPES = {
+    **{col: 'object' for col in TEXT_COLUMNS},
+    TARGET_COLUMN: 'int8',
+}
 
-def load_dataset(file_path=None):
+
+def load_dataset(file_path=None, usecols=None, dtype=None):
     """
     Load the Fake Job Postings dataset from CSV.
     
     Args:
         file_path (str, optional): Path to the CSV file. 
                                    Defaults to config.RAW_DATA_PATH
+        usecols (list, optional): Columns to keep. Defaults to all columns
+        dtype (dict, optional): Column dtypes passed to pd.read_csv
     
     Returns:
         pd.DataFrame: Loaded dataset
@@ -28,7 +42,7 @@ def load_dataset(file_path=None):
         file_path = RAW_DATA_PATH
     
     try:
-        df = pd.read_csv(file_path)
+        df = pd.read_csv(file_path, usecols=usecols, dtype=dtype)
         print(f"✓ Dataset loaded successfully: {len(df)} rows, {len(df.columns)} columns")
         return df
     except FileNotFoundError:
@@ -40,6 +54,43 @@ def load_dataset(file_path=None):
         return None
 
 
+def iter_dataset(file_path=None, chunksize=None, usecols=None, dtype=None):
+    """
+    Stream the dataset from CSV in chunks, keeping only the needed columns.
+    
+    Peak memory is bounded by the chunk size rather than the file size.
+    
+    Args:
+        file_path (str, optional): Path to the CSV file.
+                                   Defaults to config.RAW_DATA_PATH
+        chunksize (int, optional): Rows per chunk. Defaults to config.STREAM_CHUNK_SIZE
+        usecols (list, optional): Columns to keep.
+                                  Defaults to the text columns and the target
+        dtype (dict, optional): Column dtypes. Defaults to STREAM_DTYPES
+    
+    Yields:
+        pd.DataFrame: Successive chunks of the dataset
+    """
+    if file_path is None:
+        file_path = RAW_DATA_PATH
+    if chunksize is None:
+        chunksize = STREAM_CHUNK_SIZE
+    if usecols is None:
+        usecols = TEXT_COLUMNS + [TARGET_COLUMN]
+    if dtype is None:
+        dtype = {col: STREAM_DTYPES[col] for col in usecols if col in STREAM_DTYPES}
+    
+    # Only keep columns that exist, so datasets without labels still stream
+    header = pd.read_csv(file_path, nrows=0).columns
+    usecols = [col for col in usecols if col in header]
+    dtype = {col: kind for col, kind in dtype.items() if col in usecols}
+    
+    reader = pd.read_csv(file_path, usecols=usecols, dtype=dtype, chunksize=chunksize)
+    with reader:
+        for chunk in reader:
+            yield chunk
+
+
 def inspect_dataset(df):
     """
     Perform basic data inspection and display statistics.
@@ -78,20 +129,28 @@ def inspect_dataset(df):
         print(df['fraudulent'].value_counts(normalize=True) * 100)
 
 
-def merge_text_columns(df, columns=None):
+def merge_text_columns(df, columns=None, verbose=True, drop_columns=False):
     """
     Merge important textual fields into a single column.
     
+    The columns are concatenated column-wise, which runs as a handful of
+    vectorized string operations instead of one Python call per row. With
+    drop_columns=True each source column is removed from the frame as soon
+    as it has been appended, so the sources and the merged text are never
+    all alive at once.
+    
     Args:
-        df (pd.DataFrame): Input dataframe
+        df (pd.DataFrame): Input dataframe (modified in place)
         columns (list, optional): List of column names to merge.
-                                 Defaults to ['description', 'requirements', 'benefits']
+                                 Defaults to config.TEXT_COLUMNS
+        verbose (bool): Print progress information
+        drop_columns (bool): Drop the source columns from the result
     
     Returns:
         pd.DataFrame: Dataframe with merged 'text' column
     """
     if columns is None:
-        columns = ['description', 'requirements', 'benefits']
+        columns = TEXT_COLUMNS
     
     # Check which columns exist
     available_columns = [col for col in columns if col in df.columns]
@@ -100,13 +159,30 @@ def merge_text_columns(df, columns=None):
         print("✗ Warning: No text columns found to merge")
         return df
     
-    print(f"\nMerging columns: {available_columns}")
-    
-    # Fill NaN values with empty strings and merge
-    df['text'] = df[available_columns].fillna('').agg(' '.join, axis=1)
-    
-    print(f"✓ Text column created with {len(df)} entries")
-    print(f"  Average text length: {df['text'].str.len().mean():.0f} characters")
+    if verbose:
+        print(f"\nMerging columns: {available_columns}")
+        source_bytes = df[available_columns].memory_usage(deep=True, index=False).sum()
+    
+    # Same result as fillna('') + ' '.join per row: missing values become
+    # empty strings but keep their separator
+    merged = None
+    for col in available_columns:
+        part = df.pop(col) if drop_columns else df[col]
+        part = part.fillna('')
+        merged = part if merged is None else merged + ' ' + part
+        del part
+    df['text'] = merged
+    
+    if verbose:
+        text_bytes = df['text'].memory_usage(deep=True, index=False)
+        print(f"✓ Text column created with {len(df)} entries")
+        print(f"  Average text length: {df['text'].str.len().mean():.0f} characters")
+        if drop_columns:
+            print(f"  Memory: merged text {text_bytes / 1024**2:.1f} MB, "
+                  f"{source_bytes / 1024**2:.1f} MB saved by dropping source columns")
+        else:
+            print(f"  Memory: merged text adds {text_bytes / 1024**2:.1f} MB; "
+                  f"drop_columns=True would free {source_bytes / 1024**2:.1f} MB of source columns")
     
     return df
 
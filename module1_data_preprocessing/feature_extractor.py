@@ -1,12 +1,15 @@
 """
 Feature extraction module using TF-IDF vectorization.
-Converts cleaned text into numerical feature vectors.
+Converts cleaned text into numerical feature vectors, either with a fitted
+vocabulary (TfidfVectorizer) or with the stateless hashing trick
+(HashingTfidfVectorizer), selected by config.FEATURE_MODE.
+
+scikit-learn and joblib are imported on first use, so loading a compact
+vectorizer (vectorizer_store) for serving does not import them.
 """
 
-import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-import joblib
+import scipy.sparse as sp
 import sys
 from pathlib import Path
 
@@ -14,17 +17,74 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 from config.config import (
     TFIDF_VECTORIZER_PATH, 
+    COMPACT_VECTORIZER_PATH,
     MAX_FEATURES, 
     NGRAM_RANGE, 
     MIN_DF, 
-    MAX_DF
+    MAX_DF,
+    FEATURE_MODE,
+    HASHING_N_FEATURES,
+    HASHING_USE_IDF
 )
 
+# Bump when TokenAnalyzer or the vectorizers change the features they produce
+FEATURES_VERSION = 3
+
+
+class TokenAnalyzer:
+    """
+    Vectorizer analyzer for text already tokenized by TextCleaner.
+    
+    Cleaning has already tokenized the text and removed stopwords, so the
+    analyzer only splits on whitespace (or takes a token list directly),
+    drops tokens shorter than min_token_length like sklearn's default token
+    pattern, and builds n-grams. No second tokenizer or stopword list runs.
+    """
+    
+    def __init__(self, ngram_range=(1, 1), min_token_length=2):
+        """
+        Args:
+            ngram_range (tuple): Range of n-grams to produce
+            min_token_length (int): Shortest token kept
+        """
+        self.ngram_range = tuple(ngram_range)
+        self.min_token_length = min_token_length
+    
+    def __call__(self, doc):
+        """
+        Turn one cleaned document into terms.
+        
+        Args:
+            doc (str or list): Cleaned text, or tokens from TextCleaner.clean_tokens()
+        
+        Returns:
+            list: Unigrams and higher n-grams
+        """
+        tokens = doc.split() if isinstance(doc, str) else doc
+        min_length = self.min_token_length
+        if min_length > 1:
+            tokens = [token for token in tokens if len(token) >= min_length]
+        
+        min_n, max_n = self.ngram_range
+        if max_n == 1:
+            return tokens
+        terms = list(tokens) if min_n == 1 else []
+        for n in range(max(min_n, 2), max_n + 1):
+            terms.extend(map(' '.join, zip(*(tokens[i:] for i in range(n)))))
+        return terms
+    
+    def __repr__(self):
+        return f"TokenAnalyzer(ngram_range={self.ngram_range}, min_token_length={self.min_token_length})"
+
 
 def create_tfidf_vectorizer(max_features=None, ngram_range=None, min_df=None, max_df=None):
     """
     Create and configure TF-IDF vectorizer.
     
+    The vectorizer consumes text cleaned by TextCleaner through a
+    TokenAnalyzer, so documents are not re-tokenized or stopword-filtered
+    a second time.
+    
     Args:
         max_features (int): Maximum number of features
         ngram_range (tuple): Range of n-grams to use
@@ -34,6 +94,8 @@ def create_tfidf_vectorizer(max_features=None, ngram_range=None, min_df=None, ma
     Returns:
         TfidfVectorizer: Configured vectorizer
     """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    
     if max_features is None:
         max_features = MAX_FEATURES
     if ngram_range is None:
@@ -44,46 +106,292 @@ def create_tfidf_vectorizer(max_features=None, ngram_range=None, min_df=None, ma
         max_df = MAX_DF
     
     vectorizer = TfidfVectorizer(
+        analyzer=TokenAnalyzer(ngram_range),
         max_features=max_features,
-        ngram_range=ngram_range,
         min_df=min_df,
         max_df=max_df,
-        stop_words='english'
+        lowercase=False,
+        token_pattern=None
     )
     
     return vectorizer
 
 
-def extract_features(df, text_column='text_cleaned', vectorizer=None, fit=True):
+class HashingTfidfVectorizer:
+    """
+    TF-IDF over hashed features, with no vocabulary.
+    
+    Terms are hashed into n_features columns, so transform needs no fitted
+    state beyond the optional IDF weights, and chunks can be vectorized
+    independently (e.g. in parallel workers). IDF is learned from document
+    frequencies that partial_fit() accumulates chunk by chunk; weights and
+    normalization match TfidfVectorizer (smooth IDF, l2 norm). Columns seen
+    in fewer than min_df documents are dropped, like TfidfVectorizer's
+    min_df, since without a vocabulary nothing else prunes rare n-grams.
+    """
+    
+    def __init__(self, n_features=2 ** 18, ngram_range=(1, 1), use_idf=True, min_df=1):
+        """
+        Args:
+            n_features (int): Number of hashed feature columns
+            ngram_range (tuple): Range of n-grams to use
+            use_idf (bool): Reweight term counts by inverse document frequency
+            min_df (int or float): Minimum document frequency of a column (a
+                                   float is a fraction of documents); needs use_idf
+        """
+        self.n_features = n_features
+        self.ngram_range = tuple(ngram_range)
+        self.use_idf = use_idf
+        self.min_df = min_df
+        self.analyzer = TokenAnalyzer(ngram_range)
+        self.n_docs_ = 0
+        self.df_ = np.zeros(n_features, dtype=np.int64)
+        self._idf = None
+    
+    def _counts(self, docs):
+        """Hash documents into a term-count matrix."""
+        from sklearn.feature_extraction.text import HashingVectorizer
+        
+        if not hasattr(docs, '__len__'):
+            docs = list(docs)
+        if len(docs) == 0:
+            return sp.csr_matrix((0, self.n_features))
+        hasher = HashingVectorizer(analyzer=self.analyzer, n_features=self.n_features,
+                                   alternate_sign=False, norm=None)
+        counts = hasher.transform(docs)
+        counts.sum_duplicates()
+        return counts
+    
+    def _update_df(self, counts):
+        """Add a count matrix's document frequencies."""
+        self.df_ += np.bincount(counts.indices, minlength=self.n_features)
+        self.n_docs_ += counts.shape[0]
+        self._idf = None
+    
+    @property
+    def idf_(self):
+        """
+        Smoothed IDF weights, as TfidfTransformer(smooth_idf=True) computes
+        them, and 0 for columns below min_df.
+        """
+        if self._idf is None:
+            idf = np.log((1 + self.n_docs_) / (1 + self.df_)) + 1
+            min_df = self.min_df
+            if isinstance(min_df, float):
+                min_df = int(np.ceil(min_df * self.n_docs_))
+            if min_df > 1:
+                idf[self.df_ < min_df] = 0
+            self._idf = idf
+        return self._idf
+    
+    def _weight(self, counts):
+        """Apply IDF weights and l2-normalize rows in place."""
+        from sklearn.preprocessing import normalize
+        
+        if self.use_idf:
+            counts.data *= self.idf_[counts.indices]
+            counts.eliminate_zeros()
+        return normalize(counts, norm='l2', copy=False)
+    
+    def partial_fit(self, docs):
+        """
+        Accumulate document frequencies from one chunk.
+        
+        Args:
+            docs (iterable): Cleaned texts or token lists
+        
+        Returns:
+            HashingTfidfVectorizer: self
+        """
+        if self.use_idf:
+            self._update_df(self._counts(docs))
+        return self
+    
+    def fit(self, docs):
+        """
+        Learn IDF weights from scratch.
+        
+        Args:
+            docs (iterable): Cleaned texts or token lists
+        
+        Returns:
+            HashingTfidfVectorizer: self
+        """
+        self.n_docs_ = 0
+        self.df_ = np.zeros(self.n_features, dtype=np.int64)
+        return self.partial_fit(docs)
+    
+    def transform(self, docs):
+        """
+        Vectorize documents.
+        
+        Args:
+            docs (iterable): Cleaned texts or token lists
+        
+        Returns:
+            scipy.sparse.csr_matrix: TF-IDF features
+        """
+        return self._weight(self._counts(docs))
+    
+    def fit_transform(self, docs):
+        """
+        Learn IDF weights and vectorize in a single pass over the documents.
+        
+        Args:
+            docs (iterable): Cleaned texts or token lists
+        
+        Returns:
+            scipy.sparse.csr_matrix: TF-IDF features
+        """
+        self.n_docs_ = 0
+        self.df_ = np.zeros(self.n_features, dtype=np.int64)
+        counts = self._counts(docs)
+        if self.use_idf:
+            self._update_df(counts)
+        return self._weight(counts)
+    
+    def __getstate__(self):
+        # Store document frequencies sparsely; most hashed columns are empty
+        state = self.__dict__.copy()
+        columns = np.flatnonzero(self.df_)
+        state['df_'] = (columns.astype(np.int32), self.df_[columns])
+        state['_idf'] = None
+        return state
+    
+    def __setstate__(self, state):
+        columns, counts = state['df_']
+        df = np.zeros(state['n_features'], dtype=np.int64)
+        df[columns] = counts
+        state['df_'] = df
+        self.__dict__.update(state)
+    
+    def __repr__(self):
+        return (f"HashingTfidfVectorizer(n_features={self.n_features}, "
+                f"ngram_range={self.ngram_range}, use_idf={self.use_idf}, "
+                f"min_df={self.min_df})")
+
+
+def create_hashing_vectorizer(n_features=None, ngram_range=None, use_idf=None, min_df=None):
+    """
+    Create and configure a hashing TF-IDF vectorizer.
+    
+    Args:
+        n_features (int): Number of hashed feature columns
+        ngram_range (tuple): Range of n-grams to use
+        use_idf (bool): Reweight by inverse document frequency
+        min_df (int or float): Minimum document frequency of a column
+    
+    Returns:
+        HashingTfidfVectorizer: Configured vectorizer
+    """
+    if n_features is None:
+        n_features = HASHING_N_FEATURES
+    if ngram_range is None:
+        ngram_range = NGRAM_RANGE
+    if use_idf is None:
+        use_idf = HASHING_USE_IDF
+    if min_df is None:
+        min_df = MIN_DF
+    
+    return HashingTfidfVectorizer(n_features=n_features, ngram_range=ngram_range,
+                                  use_idf=use_idf, min_df=min_df)
+
+
+def create_vectorizer(mode=None):
+    """
+    Create the vectorizer for a feature mode.
+    
+    Args:
+        mode (str, optional): "tfidf" or "hashing". Defaults to config.FEATURE_MODE
+    
+    Returns:
+        TfidfVectorizer or HashingTfidfVectorizer: Configured vectorizer
+    """
+    if mode is None:
+        mode = FEATURE_MODE
+    if mode == 'tfidf':
+        return create_tfidf_vectorizer()
+    if mode == 'hashing':
+        return create_hashing_vectorizer()
+    raise ValueError(f"Unknown feature mode: {mode!r} (expected 'tfidf' or 'hashing')")
+
+
+def vectorizer_config():
+    """
+    Config values a fitted vectorizer (and the features it produces) depends on.
+    
+    Returns:
+        dict: Config name -> value
+    """
+    return {
+        'FEATURE_MODE': FEATURE_MODE,
+        'NGRAM_RANGE': NGRAM_RANGE,
+        'MAX_FEATURES': MAX_FEATURES,
+        'MIN_DF': MIN_DF,
+        'MAX_DF': MAX_DF,
+        'HASHING_N_FEATURES': HASHING_N_FEATURES,
+        'HASHING_USE_IDF': HASHING_USE_IDF,
+    }
+
+
+def describe_vectorizer(vectorizer):
+    """One-line summary of a fitted vectorizer's feature space."""
+    if isinstance(vectorizer, HashingTfidfVectorizer):
+        summary = f"{vectorizer.n_features} hashed features"
+        if vectorizer.use_idf:
+            summary += f", IDF from {vectorizer.n_docs_} documents"
+        return summary
+    return f"Vocabulary size: {len(vectorizer.vocabulary_)}"
+
+
+def extract_features(df, text_column='text_cleaned', vectorizer=None, fit=True, n_jobs=1):
     """
     Extract TF-IDF features from text data.
     
     Args:
         df (pd.DataFrame): Dataframe with cleaned text
         text_column (str): Name of the text column
-        vectorizer (TfidfVectorizer, optional): Pre-fitted vectorizer
+        vectorizer (optional): Pre-fitted vectorizer. Defaults to a new one
+                               for config.FEATURE_MODE
         fit (bool): Whether to fit the vectorizer (True for training, False for prediction)
+        n_jobs (int, optional): Worker processes (-1 for all CPUs, None for
+                                config.PREPROCESS_N_JOBS). Above 1, fitting and
+                                transforming are sharded across processes with
+                                the same result as a single process
     
     Returns:
         tuple: (feature_matrix, vectorizer)
     """
+    from module1_data_preprocessing.text_preprocessor import resolve_n_jobs
+    
     if text_column not in df.columns:
         print(f"✗ Error: Column '{text_column}' not found")
         return None, None
     
     if vectorizer is None:
-        vectorizer = create_tfidf_vectorizer()
+        vectorizer = create_vectorizer()
+    n_jobs = resolve_n_jobs(n_jobs)
     
     print(f"\nExtracting TF-IDF features from '{text_column}'...")
     print(f"  Rows: {len(df)}")
     
+    if n_jobs > 1:
+        from module1_data_preprocessing.sharded_tfidf import fit_transform_sharded, transform_sharded
+        print(f"  Sharding across {n_jobs} worker processes")
+    
     if fit:
         print("  Fitting vectorizer on training data...")
-        feature_matrix = vectorizer.fit_transform(df[text_column])
-        print(f"✓ Vectorizer fitted. Vocabulary size: {len(vectorizer.vocabulary_)}")
+        if n_jobs > 1:
+            feature_matrix, vectorizer = fit_transform_sharded(df[text_column], vectorizer, n_jobs)
+        else:
+            feature_matrix = vectorizer.fit_transform(df[text_column])
+        print(f"✓ Vectorizer fitted. {describe_vectorizer(vectorizer)}")
     else:
         print("  Transforming using pre-fitted vectorizer...")
-        feature_matrix = vectorizer.transform(df[text_column])
+        if n_jobs > 1:
+            feature_matrix = transform_sharded(df[text_column], vectorizer, n_jobs)
+        else:
+            feature_matrix = vectorizer.transform(df[text_column])
         print(f"✓ Features extracted.")
     
     print(f"  Feature matrix shape: {feature_matrix.shape}")
@@ -91,33 +399,74 @@ def extract_features(df, text_column='text_cleaned', vectorizer=None, fit=True):
     return feature_matrix, vectorizer
 
 
-def save_vectorizer(vectorizer, file_path=None):
+def save_vectorizer(vectorizer, file_path=None, compact_path=None):
     """
     Save TF-IDF vectorizer to disk.
     
+    Besides the pickle, the vectorizer is exported in the compact format
+    (vectorizer_store) that load_vectorizer() and the web app prefer.
+    
     Args:
         vectorizer (TfidfVectorizer): Vectorizer to save
         file_path (str, optional): Path to save file
+        compact_path (str, optional): Path of the compact export. Defaults to
+                                      config.COMPACT_VECTORIZER_PATH
     """
+    import joblib
+    from module1_data_preprocessing.vectorizer_store import export_vectorizer
+    
     if file_path is None:
         file_path = TFIDF_VECTORIZER_PATH
+    if compact_path is None:
+        compact_path = COMPACT_VECTORIZER_PATH
     
     joblib.dump(vectorizer, file_path)
     print(f"✓ Vectorizer saved to {file_path}")
+    
+    try:
+        export_vectorizer(vectorizer, compact_path)
+        print(f"✓ Compact vectorizer saved to {compact_path}")
+    except ValueError as e:
+        # A stale export would be loaded instead of the new pickle
+        Path(compact_path).unlink(missing_ok=True)
+        print(f"⚠ Warning: Compact vectorizer not exported: {e}")
 
 
-def load_vectorizer(file_path=None):
+def load_vectorizer(file_path=None, compact_path=None):
     """
     Load TF-IDF vectorizer from disk.
     
+    With no file_path, the compact export is loaded when it is at least as
+    new as the pickle; it memory-maps its arrays and transforms identically.
+    A file_path ending in .npz is read as a compact export.
+    
     Args:
         file_path (str, optional): Path to vectorizer file
+        compact_path (str, optional): Path of the compact export. Defaults to
+                                      config.COMPACT_VECTORIZER_PATH
     
     Returns:
-        TfidfVectorizer: Loaded vectorizer
+        TfidfVectorizer or CompactVectorizer: Loaded vectorizer
     """
+    from module1_data_preprocessing.vectorizer_store import load_compact_vectorizer
+    
     if file_path is None:
         file_path = TFIDF_VECTORIZER_PATH
+        compact_path = Path(compact_path or COMPACT_VECTORIZER_PATH)
+        pickle_path = Path(file_path)
+        if compact_path.exists() and (not pickle_path.exists()
+                                      or compact_path.stat().st_mtime >= pickle_path.stat().st_mtime):
+            file_path = compact_path
+    
+    if Path(file_path).suffix == '.npz':
+        vectorizer = load_compact_vectorizer(file_path)
+        if vectorizer is None:
+            print(f"✗ Error: No compact vectorizer at {file_path}")
+            return None
+        print(f"✓ Vectorizer loaded from {file_path}")
+        return vectorizer
+    
+    import joblib
     
     try:
         vectorizer = joblib.load(file_path)
@@ -129,6 +478,8 @@ def load_vectorizer(file_path=None):
 
 
 if __name__ == "__main__":
+    import pandas as pd
+    
     # Test feature extraction
     test_data = pd.DataFrame({
         'text_cleaned': [
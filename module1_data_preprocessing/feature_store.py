@@ -0,0 +1,188 @@
+"""
+Feature-matrix storage module.
+Saves the sparse feature matrix, labels, row ids and fitted vectorizer in
+one uncompressed .npz file whose arrays are memory-mapped on load. The
+pipeline's vectorize stage stores its artifact this way, so Module 2 gets
+its features in milliseconds instead of re-vectorizing.
+"""
+
+import hashlib
+import json
+import pickle
+import struct
+import sys
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+# Bump when the stored layout changes
+FORMAT_VERSION = 1
+
+# Size of a zip local file header before its name and extra field
+_LOCAL_HEADER_SIZE = 30
+
+
+def inputs_digest(texts, y=None, row_ids=None):
+    """
+    Hash the vectorizer's inputs, so features built from other text are detected.
+    
+    Args:
+        texts (iterable): Cleaned texts
+        y (np.ndarray, optional): Labels
+        row_ids (np.ndarray, optional): Row ids
+    
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for text in texts:
+        digest.update(text.encode('utf-8'))
+        digest.update(b'\0')
+    for array in (y, row_ids):
+        if array is not None:
+            digest.update(np.ascontiguousarray(array, dtype=np.int64).tobytes())
+    return digest.hexdigest()
+
+
+def features_metadata(df, text_column='text_cleaned', target_column=None):
+    """
+    Describe what a feature matrix was built from.
+    
+    Args:
+        df (pd.DataFrame): Dataframe the features are extracted from
+        text_column (str): Name of the cleaned text column
+        target_column (str, optional): Name of the label column
+    
+    Returns:
+        dict: Code versions of the cleaning and feature extraction, vectorizer
+              config and inputs digest
+    """
+    from module1_data_preprocessing.feature_extractor import vectorizer_config, FEATURES_VERSION
+    from module1_data_preprocessing.text_preprocessor import cleaning_key
+    
+    y = df[target_column].values if target_column in df.columns else None
+    return {
+        'code': {'features_version': FEATURES_VERSION, 'cleaning': cleaning_key()},
+        'vectorizer': vectorizer_config(),
+        'inputs': inputs_digest(df[text_column], y, df.index.values),
+    }
+
+
+def save_features(features, file_path, metadata=None):
+    """
+    Save a feature matrix with its labels, row ids and vectorizer.
+    
+    Arrays are stored uncompressed so they can be memory-mapped; the
+    vectorizer is pickled into a byte array member.
+    
+    Args:
+        features (dict): 'X' (sparse matrix), 'y', 'row_ids' and 'vectorizer'
+        file_path (str): Output path
+        metadata (dict, optional): Provenance, e.g. from features_metadata()
+    
+    Returns:
+        Path: Path the features were written to
+    """
+    X = sp.csr_matrix(features['X'])
+    X.sort_indices()
+    header = {'format_version': FORMAT_VERSION, 'metadata': metadata or {}}
+    arrays = {
+        'data': X.data,
+        'indices': X.indices,
+        'indptr': X.indptr,
+        'shape': np.array(X.shape, dtype=np.int64),
+        'y': np.asarray(features['y']),
+        'row_ids': np.asarray(features['row_ids'], dtype=np.int64),
+        'vectorizer': np.frombuffer(pickle.dumps(features['vectorizer'], protocol=5), dtype=np.uint8),
+        'header': np.frombuffer(json.dumps(header, default=str).encode('utf-8'), dtype=np.uint8),
+    }
+    # A file object keeps numpy from appending .npz to the path
+    with open(file_path, 'wb') as f:
+        np.savez(f, **arrays)
+    return Path(file_path)
+
+
+def _map_member(file_path, info):
+    """Memory-map one stored .npy member of a zip archive."""
+    with open(file_path, 'rb') as f:
+        f.seek(info.header_offset)
+        local_header = f.read(_LOCAL_HEADER_SIZE)
+        name_length, extra_length = struct.unpack('<HH', local_header[26:30])
+        f.seek(info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    
+    if int(np.prod(shape)) == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(file_path, dtype=dtype, mode='r', offset=offset, shape=shape,
+                     order='F' if fortran_order else 'C')
+
+
+def read_arrays(file_path, memory_map=True):
+    """
+    Read every member of a .npz file, memory-mapping stored ones.
+    
+    Args:
+        file_path (str): Input path
+        memory_map (bool): Memory-map uncompressed members instead of reading them
+    
+    Returns:
+        dict: Member name -> array
+    """
+    if not memory_map:
+        with np.load(file_path) as archive:
+            return {name: archive[name] for name in archive.files}
+    
+    arrays = {}
+    with zipfile.ZipFile(file_path) as archive:
+        for info in archive.infolist():
+            name = info.filename[:-len('.npy')]
+            if info.compress_type == zipfile.ZIP_STORED:
+                arrays[name] = _map_member(file_path, info)
+            else:
+                with archive.open(info) as member:
+                    arrays[name] = np.lib.format.read_array(member)
+    return arrays
+
+
+def load_features(file_path, memory_map=True):
+    """
+    Load a feature matrix saved by save_features().
+    
+    Args:
+        file_path (str): Input path
+        memory_map (bool): Memory-map the arrays instead of reading them
+    
+    Returns:
+        tuple: (features dict with 'X', 'y', 'row_ids' and 'vectorizer',
+               metadata dict), or (None, None) if the file does not exist
+               or has another layout
+    """
+    if not Path(file_path).exists():
+        return None, None
+    
+    arrays = read_arrays(file_path, memory_map)
+    header = json.loads(arrays['header'].tobytes())
+    if header.get('format_version') != FORMAT_VERSION:
+        return None, None
+    
+    # The mapped arrays already have scipy's dtypes, so no copy is made
+    X = sp.csr_matrix((arrays['data'], arrays['indices'], arrays['indptr']),
+                      shape=tuple(arrays['shape']), copy=False)
+    features = {
+        'X': X,
+        'y': np.asarray(arrays['y']),
+        'row_ids': np.asarray(arrays['row_ids']),
+        'vectorizer': pickle.loads(arrays['vectorizer'].tobytes()),
+    }
+    return features, header['metadata']
+
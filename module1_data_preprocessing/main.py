@@ -3,6 +3,7 @@ Main script for Module 1: Data Collection & Preprocessing
 Runs the complete preprocessing pipeline.
 """
 
+import argparse
 import pandas as pd
 import sys
 from pathlib import Path
@@ -10,58 +11,139 @@ from pathlib import Path
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from data_loader import load_dataset, inspect_dataset, merge_text_columns
-from text_preprocessor import preprocess_dataframe
-from feature_extractor import extract_features, save_vectorizer
-from config.config import PROCESSED_DATA_PATH, DATA_DIR
+from data_loader import inspect_dataset
+from text_preprocessor import cleaning_key
+from feature_extractor import save_vectorizer
+from streaming import iter_cleaned_chunks, fit_vectorizer_streaming
+from processed_store import write_chunks_processed, processed_data_path, source_fingerprint
+from config.config import DATA_DIR, PIPELINE_CACHE_DIR, TFIDF_VECTORIZER_PATH
+from pipeline.stages import build_pipeline, STAGE_NAMES
 
 
-def main():
+def processed_metadata():
+    """Provenance stored with the processed data so module 2 can reuse it."""
+    return {'cleaning_key': cleaning_key(), 'source': source_fingerprint()}
+
+
+def main(n_jobs=None, chunk_size=None, force=(), use_cache=True):
     """
     Main preprocessing pipeline.
+    
+    Cleaning and feature extraction run through the shared pipeline, so
+    their results are cached and reused by Module 2 instead of recomputed.
+    The pipeline cache is their only store.
+    
+    Args:
+        n_jobs (int, optional): Worker processes for text cleaning and vectorizing (-1 for all CPUs)
+        chunk_size (int, optional): Rows per worker task
+        force (iterable): Pipeline stage names to recompute even if cached
+        use_cache (bool): False recomputes every stage and caches nothing
     """
     print("="*60)
     print("MODULE 1: DATA COLLECTION & PREPROCESSING")
     print("="*60)
     
-    # Step 1: Load dataset
-    print("\n[Step 1/4] Loading dataset...")
-    df = load_dataset()
-    if df is None:
-        return
-    
-    # Step 2: Inspect dataset
-    print("\n[Step 2/4] Inspecting dataset...")
-    inspect_dataset(df)
+    pipeline = build_pipeline(n_jobs=n_jobs, chunk_size=chunk_size,
+                              force=force, use_cache=use_cache)
+    print()
+    pipeline.print_plan(['vectorize'])
+    actions = {name: action for name, _, action in pipeline.plan(['vectorize'])}
     
-    # Step 3: Merge text columns
-    print("\n[Step 3/4] Merging text columns...")
-    df = merge_text_columns(df)
+    # Step 1: Load and inspect the dataset, only if a stage that needs it is recomputed
+    print("\n[Step 1/3] Loading dataset...")
+    if actions['load'] == 'run':
+        df = pipeline.get('load')
+        if df is None:
+            return
+        inspect_dataset(df)
+    else:
+        print("✓ Later stages are cached, raw dataset not needed")
     
-    # Step 4: Clean and preprocess text
-    print("\n[Step 4/5] Cleaning and preprocessing text...")
-    df = preprocess_dataframe(df, text_column='text')
+    # Step 2: Merge text columns, clean and preprocess text
+    print("\n[Step 2/3] Cleaning and preprocessing text...")
+    if actions['clean'] == 'skip':
+        print("✓ Features are cached, cleaned text not needed")
+    elif pipeline.get('clean') is None:
+        return
     
-    # Step 5: Extract features (optional - can be done in Module 2)
-    print("\n[Step 5/5] Extracting TF-IDF features...")
-    X, vectorizer = extract_features(df, text_column='text_cleaned', fit=True)
+    # Step 3: Extract features (reused by Module 2 through the pipeline cache)
+    print("\n[Step 3/3] Extracting TF-IDF features...")
+    vectorized = pipeline.get('vectorize')
+    if vectorized is None:
+        return
+    vectorizer = vectorized['vectorizer']
     
     # Save vectorizer
     save_vectorizer(vectorizer)
     
-    # Save processed dataframe
-    print(f"\nSaving processed data to {PROCESSED_DATA_PATH}...")
-    df.to_csv(PROCESSED_DATA_PATH, index=False)
-    print(f"✓ Processed data saved successfully")
+    print("\n" + "="*60)
+    print("PREPROCESSING COMPLETE!")
+    print("="*60)
+    print(f"\nOutput files:")
+    print(f"  - Cleaned text and features: {PIPELINE_CACHE_DIR}/")
+    print(f"  - TF-IDF vectorizer: {TFIDF_VECTORIZER_PATH}")
+    print(f"\nReady for Module 2: Model Training")
+
+
+def main_streaming(n_jobs=None, chunksize=None):
+    """
+    Streaming preprocessing pipeline with bounded peak memory.
+    
+    Reads the CSV in chunks with only the needed columns, cleans each chunk,
+    appends it to the processed data file and feeds it to the vectorizer
+    fit, all in a single pass.
+    
+    Args:
+        n_jobs (int, optional): Worker processes for text cleaning (-1 for all CPUs)
+        chunksize (int, optional): Rows per CSV chunk
+    """
+    print("="*60)
+    print("MODULE 1: DATA COLLECTION & PREPROCESSING (STREAMING)")
+    print("="*60)
+    
+    print("\n[Step 1/2] Streaming, cleaning and vectorizing dataset...")
+    try:
+        chunks = iter_cleaned_chunks(chunksize=chunksize, n_jobs=n_jobs)
+        chunks = write_chunks_processed(chunks, metadata=processed_metadata())
+        vectorizer = fit_vectorizer_streaming(chunks)
+    except FileNotFoundError:
+        print(f"✗ Error: Dataset not found. Please place it in {DATA_DIR}/")
+        return
+    
+    print("\n[Step 2/2] Saving vectorizer...")
+    save_vectorizer(vectorizer)
     
     print("\n" + "="*60)
     print("PREPROCESSING COMPLETE!")
     print("="*60)
     print(f"\nOutput files:")
-    print(f"  - Processed data: {PROCESSED_DATA_PATH}")
-    print(f"  - TF-IDF vectorizer: {vectorizer}")
+    print(f"  - Processed data: {processed_data_path()}")
+    print(f"  - TF-IDF vectorizer: {TFIDF_VECTORIZER_PATH}")
     print(f"\nReady for Module 2: Model Training")
 
 
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Module 1: Data Collection & Preprocessing")
+    parser.add_argument('--n-jobs', type=int, default=None,
+                        help='worker processes for text cleaning and vectorizing (-1 for all CPUs)')
+    parser.add_argument('--chunk-size', type=int, default=None,
+                        help='rows per worker task')
+    parser.add_argument('--stream', action='store_true',
+                        help='read the CSV in chunks with bounded memory')
+    parser.add_argument('--stream-chunksize', type=int, default=None,
+                        help='rows per CSV chunk in streaming mode')
+    parser.add_argument('--force', action='append', default=[], choices=STAGE_NAMES,
+                        metavar='STAGE', help='recompute a pipeline stage even if cached (repeatable)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='recompute every stage and do not write the pipeline cache')
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.stream:
+        main_streaming(n_jobs=args.n_jobs, chunksize=args.stream_chunksize)
+    else:
+        main(n_jobs=args.n_jobs, chunk_size=args.chunk_size,
+             force=args.force, use_cache=not args.no_cache)
@@ -0,0 +1,292 @@
+"""
+Processed-data storage module.
+Saves the cleaned text and labels in a columnar Arrow IPC file that module 2
+can memory-map and load directly instead of re-running preprocessing.
+"""
+
+import json
+import os
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+from config.config import (
+    RAW_DATA_PATH,
+    PROCESSED_DATA_PATH,
+    PROCESSED_DATA_ARROW_PATH,
+    PROCESSED_DATA_FORMAT,
+    TARGET_COLUMN
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+# Schema metadata key holding the provenance of the processed data
+METADATA_KEY = b'jobcheck'
+
+
+def resolve_format(fmt=None):
+    """
+    Resolve the processed-data format, falling back to CSV without pyarrow.
+    
+    Args:
+        fmt (str, optional): "arrow" or "csv". Defaults to config.PROCESSED_DATA_FORMAT
+    
+    Returns:
+        str: Format to use
+    """
+    if fmt is None:
+        fmt = PROCESSED_DATA_FORMAT
+    if fmt == 'arrow' and pa is None:
+        print("⚠ Warning: pyarrow is not installed, falling back to CSV processed data")
+        fmt = 'csv'
+    return fmt
+
+
+def processed_data_path(fmt=None):
+    """
+    Get the default processed-data path for a format.
+    
+    Args:
+        fmt (str, optional): "arrow" or "csv"
+    
+    Returns:
+        Path: Processed-data file path
+    """
+    return PROCESSED_DATA_ARROW_PATH if resolve_format(fmt) == 'arrow' else PROCESSED_DATA_PATH
+
+
+def source_fingerprint(file_path=None):
+    """
+    Describe the raw dataset so stale processed data can be detected.
+    
+    Args:
+        file_path (str, optional): Raw CSV path. Defaults to config.RAW_DATA_PATH
+    
+    Returns:
+        dict: Path, size and modification time, or None if the file is missing
+    """
+    if file_path is None:
+        file_path = RAW_DATA_PATH
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return {'path': str(file_path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _arrow_schema(metadata=None, labels=True):
+    """Build the Arrow schema for processed data, with or without the label column."""
+    fields = [
+        pa.field('row_id', pa.int64()),
+        pa.field('text_cleaned', pa.large_string()),
+    ]
+    if labels:
+        fields.append(pa.field(TARGET_COLUMN, pa.int8()))
+    encoded = {METADATA_KEY: json.dumps(metadata or {}).encode('utf-8')}
+    return pa.schema(fields, metadata=encoded)
+
+
+def _to_record_batch(df, schema):
+    """Convert a processed dataframe to an Arrow record batch."""
+    columns = [
+        pa.array(df.index.to_numpy(dtype='int64'), type=pa.int64()),
+        pa.array(df['text_cleaned'].tolist(), type=pa.large_string()),
+    ]
+    if TARGET_COLUMN in schema.names:
+        if TARGET_COLUMN not in df.columns:
+            raise ValueError(f"Chunk has no '{TARGET_COLUMN}' column but earlier chunks did")
+        columns.append(pa.array(df[TARGET_COLUMN].to_numpy(dtype='int8'), type=pa.int8()))
+    return pa.record_batch(columns, schema=schema)
+
+
+def save_processed_data(df, file_path=None, fmt=None, metadata=None):
+    """
+    Save processed data.
+    
+    The Arrow format keeps only the row id, cleaned text and label (when
+    present), written uncompressed so it can be memory-mapped. The CSV
+    format writes the whole dataframe, as before.
+    
+    Args:
+        df (pd.DataFrame): Processed dataframe with 'text_cleaned' and optionally the target
+        file_path (str, optional): Output path. Defaults to the path for the format
+        fmt (str, optional): "arrow" or "csv". Defaults to config.PROCESSED_DATA_FORMAT
+        metadata (dict, optional): Provenance stored in the Arrow schema
+    
+    Returns:
+        Path: Path the data was written to
+    """
+    fmt = resolve_format(fmt)
+    if file_path is None:
+        file_path = processed_data_path(fmt)
+    
+    if fmt == 'csv':
+        df.to_csv(file_path, index=False)
+        return Path(file_path)
+    
+    schema = _arrow_schema(metadata, labels=TARGET_COLUMN in df.columns)
+    with pa.OSFile(str(file_path), 'wb') as sink:
+        with pa.ipc.new_file(sink, schema) as writer:
+            writer.write_batch(_to_record_batch(df, schema))
+    return Path(file_path)
+
+
+def write_chunks_processed(chunks, file_path=None, fmt=None, metadata=None):
+    """
+    Pass chunks through unchanged while appending them to the processed-data file.
+    
+    The label column is stored if the first chunk has it; chunks without
+    labels (e.g. unlabeled data from iter_cleaned_chunks()) are stored
+    without it.
+    
+    Args:
+        chunks (iterable): Chunks from streaming.iter_cleaned_chunks()
+        file_path (str, optional): Output path. Defaults to the path for the format
+        fmt (str, optional): "arrow" or "csv"
+        metadata (dict, optional): Provenance stored in the Arrow schema
+    
+    Yields:
+        pd.DataFrame: The input chunks
+    """
+    fmt = resolve_format(fmt)
+    if file_path is None:
+        file_path = processed_data_path(fmt)
+    
+    if fmt == 'csv':
+        first = True
+        for chunk in chunks:
+            chunk.to_csv(file_path, mode='w' if first else 'a', header=first, index=False)
+            first = False
+            yield chunk
+        return
+    
+    # The schema is fixed before the first write, so look at the first chunk
+    chunks = iter(chunks)
+    first = next(chunks, None)
+    schema = _arrow_schema(metadata, labels=first is None or TARGET_COLUMN in first.columns)
+    with pa.OSFile(str(file_path), 'wb') as sink:
+        with pa.ipc.new_file(sink, schema) as writer:
+            if first is None:
+                return
+            writer.write_batch(_to_record_batch(first, schema))
+            yield first
+            for chunk in chunks:
+                writer.write_batch(_to_record_batch(chunk, schema))
+                yield chunk
+
+
+def load_processed_data(file_path=None, fmt=None, memory_map=True):
+    """
+    Load processed data.
+    
+    Args:
+        file_path (str, optional): Input path. Defaults to the path for the format
+        fmt (str, optional): "arrow" or "csv"
+        memory_map (bool): Memory-map the Arrow file instead of reading it
+    
+    Returns:
+        tuple: (DataFrame indexed by row id, metadata dict), or (None, None)
+               if the file does not exist
+    """
+    fmt = resolve_format(fmt)
+    if file_path is None:
+        file_path = processed_data_path(fmt)
+    if not Path(file_path).exists():
+        return None, None
+    
+    if fmt == 'csv':
+        return pd.read_csv(file_path), {}
+    
+    source = pa.memory_map(str(file_path), 'r') if memory_map else pa.OSFile(str(file_path), 'rb')
+    with source:
+        reader = pa.ipc.open_file(source)
+        table = reader.read_all()
+        metadata = json.loads((table.schema.metadata or {}).get(METADATA_KEY, b'{}'))
+        df = table.to_pandas()
+    
+    df = df.set_index('row_id')
+    df.index.name = None
+    return df, metadata
+
+
+def read_processed_metadata(file_path=None):
+    """
+    Read the provenance of an Arrow processed-data file without loading it.
+    
+    Args:
+        file_path (str, optional): Input path. Defaults to the Arrow path
+    
+    Returns:
+        dict: Metadata, or None if the file is missing or not Arrow
+    """
+    if resolve_format() != 'arrow':
+        return None
+    if file_path is None:
+        file_path = PROCESSED_DATA_ARROW_PATH
+    if not Path(file_path).exists():
+        return None
+    
+    with pa.memory_map(str(file_path), 'r') as source:
+        schema = pa.ipc.open_file(source).schema
+    return json.loads((schema.metadata or {}).get(METADATA_KEY, b'{}'))
+
+
+def is_current(metadata, cleaning_key, raw_file_path=None):
+    """
+    Check processed-data metadata against the current dataset and cleaning setup.
+    
+    Args:
+        metadata (dict): Metadata from load_processed_data() or read_processed_metadata()
+        cleaning_key (str): Cleaning-setup digest the data must have been built with
+        raw_file_path (str, optional): Raw CSV path. Defaults to config.RAW_DATA_PATH
+    
+    Returns:
+        bool: True if the processed data can be reused
+    """
+    if metadata is None:
+        return False
+    
+    if metadata.get('cleaning_key') != cleaning_key:
+        print("  Processed data was built with different cleaning settings, ignoring it")
+        return False
+    
+    source = source_fingerprint(raw_file_path)
+    if source is not None and metadata.get('source') != source:
+        print("  Raw dataset changed since the processed data was built, ignoring it")
+        return False
+    
+    return True
+
+
+def iter_processed_chunks(file_path=None, chunksize=None):
+    """
+    Stream an Arrow processed-data file chunk by chunk from a memory map.
+    
+    Args:
+        file_path (str, optional): Input path. Defaults to the Arrow path
+        chunksize (int, optional): Rows per chunk. Defaults to the file's record batches
+    
+    Yields:
+        pd.DataFrame: Chunk indexed by row id, with 'text_cleaned' and the
+                      target if the file has labels (iter_feature_chunks()
+                      then yields y=None)
+    """
+    if file_path is None:
+        file_path = PROCESSED_DATA_ARROW_PATH
+    
+    with pa.memory_map(str(file_path), 'r') as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            step = chunksize or batch.num_rows
+            for start in range(0, batch.num_rows, step):
+                chunk = batch.slice(start, step).to_pandas().set_index('row_id')
+                chunk.index.name = None
+                yield chunk
+
@@ -0,0 +1,311 @@
+"""
+Sharded (multi-process) TF-IDF fitting.
+
+The documents are split into one contiguous shard per worker. Each worker
+counts term and document frequencies for its shard, the parent merges the
+counts and applies the MIN_DF/MAX_DF/MAX_FEATURES pruning to the merged
+result exactly like TfidfVectorizer does, and the fitted vectorizer then
+transforms the shards in parallel. The vocabulary, IDF weights and
+feature matrix equal a single-process fit_transform().
+"""
+
+import sys
+from collections import Counter
+from numbers import Integral
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+from module1_data_preprocessing.text_preprocessor import resolve_n_jobs
+
+
+def _shards(docs, n_shards):
+    """Split documents into n_shards contiguous, near-equal slices."""
+    bounds = np.linspace(0, len(docs), n_shards + 1).astype(int)
+    return [docs[start:stop] for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+
+def update_counts(analyzer, docs, tf, df):
+    """
+    Add some documents' term and document frequencies to running totals.
+    
+    Args:
+        analyzer (callable): Document -> terms, e.g. vectorizer.build_analyzer()
+        docs (iterable): Cleaned texts
+        tf (Counter): Term frequencies, updated in place
+        df (Counter): Document frequencies, updated in place
+    """
+    for doc in docs:
+        terms = analyzer(doc)
+        tf.update(terms)
+        df.update(set(terms))
+
+
+def counts_to_arrays(tf, df):
+    """
+    Convert term-count Counters to the arrays merge_counts() and fit_from_counts() take.
+    
+    Args:
+        tf (Counter): Term frequencies
+        df (Counter): Document frequencies
+    
+    Returns:
+        tuple: (object array of distinct terms, tf, df), counts as int64 arrays
+    """
+    terms = list(tf)
+    return (np.array(terms, dtype=object),
+            np.fromiter(tf.values(), dtype=np.int64, count=len(terms)),
+            np.fromiter((df[term] for term in terms), dtype=np.int64, count=len(terms)))
+
+
+def count_terms(analyzer, docs):
+    """
+    Term frequencies and document frequencies of some documents.
+    
+    Args:
+        analyzer (callable): Document -> terms, e.g. vectorizer.build_analyzer()
+        docs (iterable): Cleaned texts
+    
+    Returns:
+        tuple: (object array of distinct terms, tf, df), counts as int64 arrays
+    """
+    tf = Counter()
+    df = Counter()
+    update_counts(analyzer, docs, tf, df)
+    return counts_to_arrays(tf, df)
+
+
+def _count_shard(analyzer, docs):
+    """
+    Worker task: term frequencies and document frequencies of one shard.
+    
+    The terms come back as one NUL-joined string rather than an object
+    array, which pickles an order of magnitude faster when the shard
+    vocabulary has millions of n-grams.
+    """
+    terms, tf, df = count_terms(analyzer, docs)
+    return '\0'.join(terms.tolist()), tf, df
+
+
+def _hashed_df_shard(vectorizer, docs):
+    """Worker task: hashed document frequencies of one shard."""
+    counts = vectorizer._counts(docs)
+    return np.bincount(counts.indices, minlength=vectorizer.n_features), counts.shape[0]
+
+
+def _transform_shard(vectorizer, docs):
+    """Worker task: vectorize one shard."""
+    return vectorizer.transform(docs)
+
+
+def _run_shards(func, first_arg, shards, n_jobs):
+    """Apply func(first_arg, shard) to every shard, in a process pool when n_jobs > 1."""
+    if n_jobs == 1 or len(shards) == 1:
+        return [func(first_arg, shard) for shard in shards]
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(func, [first_arg] * len(shards), shards))
+
+
+def _merge_counts(shard_counts):
+    """Sum the counts returned by _count_shard() by term."""
+    return merge_counts([
+        (np.array(joined.split('\0'), dtype=object) if joined else np.empty(0, dtype=object),
+         tf, df)
+        for joined, tf, df in shard_counts
+    ])
+
+
+def merge_counts(counts):
+    """
+    Sum counts from count_terms() by term.
+    
+    Args:
+        counts (list): (terms, tf, df) tuples
+    
+    Returns:
+        tuple: (object array of distinct terms, total tf, total df)
+    """
+    terms = [terms for terms, _, _ in counts]
+    tfs = [tf for _, tf, _ in counts]
+    dfs = [df for _, _, df in counts]
+    if len(counts) == 1:
+        return terms[0], tfs[0], dfs[0]
+    
+    import pandas as pd
+    
+    # Hash-based grouping in C; the totals stay exact integers well below 2**53
+    codes, unique_terms = pd.factorize(np.concatenate(terms))
+    tf = np.bincount(codes, weights=np.concatenate(tfs)).astype(np.int64)
+    df = np.bincount(codes, weights=np.concatenate(dfs)).astype(np.int64)
+    return np.asarray(unique_terms, dtype=object), tf, df
+
+
+def limit_vocabulary(terms, tfs, dfs, n_docs, min_df=1, max_df=1.0, max_features=None):
+    """
+    Build a pruned vocabulary from merged counts, as TfidfVectorizer does.
+    
+    Terms outside the document-frequency bounds are dropped first, then the
+    rest are sorted by name and (with max_features) the most frequent are
+    kept, ranked with the same argsort over the same array TfidfVectorizer
+    builds, so ties break identically. Filtering before sorting is exact:
+    the survivors keep their relative order.
+    
+    Args:
+        terms (np.ndarray): Distinct terms (object array)
+        tfs (np.ndarray): Total count of each term
+        dfs (np.ndarray): Number of documents containing each term
+        n_docs (int): Number of documents
+        min_df (int or float): Minimum document frequency (float: fraction)
+        max_df (int or float): Maximum document frequency (float: fraction)
+        max_features (int, optional): Maximum vocabulary size
+    
+    Returns:
+        tuple: (vocabulary dict term -> column, document frequencies of the kept terms)
+    """
+    if len(terms) == 0:
+        raise ValueError("empty vocabulary; perhaps the documents only contain stop words")
+    
+    max_doc_count = max_df if isinstance(max_df, Integral) else max_df * n_docs
+    min_doc_count = min_df if isinstance(min_df, Integral) else min_df * n_docs
+    if max_doc_count < min_doc_count:
+        raise ValueError("max_df corresponds to < documents than min_df")
+    
+    in_bounds = np.flatnonzero((dfs <= max_doc_count) & (dfs >= min_doc_count))
+    if len(in_bounds) == 0:
+        raise ValueError("After pruning, no terms remain. Try a lower min_df or a higher max_df.")
+    candidates = terms[in_bounds]
+    order = in_bounds[sorted(range(len(candidates)), key=candidates.__getitem__)]
+    
+    if max_features is not None and len(order) > max_features:
+        # Counts are float64 in TfidfVectorizer, and the sort must see the same array
+        ranked = (-tfs[order].astype(np.float64)).argsort()[:max_features]
+        order = order[np.sort(ranked)]
+    
+    vocabulary = {term: column for column, term in enumerate(terms[order].tolist())}
+    return vocabulary, dfs[order]
+
+
+def _set_tfidf_state(vectorizer, vocabulary, dfs, n_docs):
+    """Install a vocabulary and IDF weights on a TfidfVectorizer."""
+    from sklearn.feature_extraction.text import TfidfTransformer
+    
+    vectorizer._tfidf = TfidfTransformer(norm=vectorizer.norm, use_idf=vectorizer.use_idf,
+                                         smooth_idf=vectorizer.smooth_idf,
+                                         sublinear_tf=vectorizer.sublinear_tf)
+    vectorizer.vocabulary_ = vocabulary
+    vectorizer.fixed_vocabulary_ = False
+    vectorizer._tfidf.n_features_in_ = len(vocabulary)
+    if vectorizer.use_idf:
+        # Same operations as TfidfTransformer.fit, so the weights are bit-identical
+        df = dfs.astype(np.float64)
+        df += float(vectorizer.smooth_idf)
+        n_samples = n_docs + int(vectorizer.smooth_idf)
+        idf = np.full_like(df, fill_value=n_samples, dtype=np.float64)
+        idf /= df
+        np.log(idf, out=idf)
+        idf += 1.0
+        vectorizer.idf_ = idf
+
+
+def fit_sharded(docs, vectorizer=None, n_jobs=-1):
+    """
+    Fit a vectorizer by counting shards in parallel.
+    
+    Args:
+        docs (iterable): Cleaned texts
+        vectorizer (optional): Unfitted TfidfVectorizer or HashingTfidfVectorizer.
+                               Defaults to one for config.FEATURE_MODE
+        n_jobs (int): Worker processes (-1 for all CPUs)
+    
+    Returns:
+        Fitted vectorizer
+    """
+    from module1_data_preprocessing.feature_extractor import (
+        create_vectorizer,
+        HashingTfidfVectorizer
+    )
+    
+    if vectorizer is None:
+        vectorizer = create_vectorizer()
+    docs = list(docs)
+    n_jobs = resolve_n_jobs(n_jobs)
+    shards = _shards(docs, n_jobs)
+    
+    if isinstance(vectorizer, HashingTfidfVectorizer):
+        vectorizer.fit([])
+        if vectorizer.use_idf:
+            for df, n_docs in _run_shards(_hashed_df_shard, vectorizer, shards, n_jobs):
+                vectorizer.df_ += df
+                vectorizer.n_docs_ += n_docs
+            vectorizer._idf = None
+        return vectorizer
+    
+    if vectorizer.vocabulary is not None:
+        raise ValueError("Sharded fitting needs a vectorizer without a fixed vocabulary")
+    
+    counts = _run_shards(_count_shard, vectorizer.build_analyzer(), shards, n_jobs)
+    terms, tfs, dfs = _merge_counts(counts)
+    return fit_from_counts(vectorizer, terms, tfs, dfs, len(docs))
+
+
+def fit_from_counts(vectorizer, terms, tfs, dfs, n_docs):
+    """
+    Fit a TfidfVectorizer from merged term counts.
+    
+    Args:
+        vectorizer: Unfitted TfidfVectorizer without a fixed vocabulary
+        terms (np.ndarray): Distinct terms (object array)
+        tfs (np.ndarray): Total count of each term
+        dfs (np.ndarray): Number of documents containing each term
+        n_docs (int): Number of documents counted
+    
+    Returns:
+        Fitted vectorizer, equal to vectorizer.fit() over the counted documents
+    """
+    vocabulary, dfs = limit_vocabulary(terms, tfs, dfs, n_docs, vectorizer.min_df,
+                                       vectorizer.max_df, vectorizer.max_features)
+    _set_tfidf_state(vectorizer, vocabulary, dfs, n_docs)
+    return vectorizer
+
+
+def transform_sharded(docs, vectorizer, n_jobs=-1):
+    """
+    Vectorize documents shard by shard in parallel.
+    
+    Args:
+        docs (iterable): Cleaned texts
+        vectorizer: Fitted vectorizer
+        n_jobs (int): Worker processes (-1 for all CPUs)
+    
+    Returns:
+        scipy.sparse.csr_matrix: Features, rows in input order
+    """
+    docs = list(docs)
+    n_jobs = resolve_n_jobs(n_jobs)
+    shards = _shards(docs, n_jobs)
+    if not shards:
+        return vectorizer.transform(docs)
+    return sp.vstack(_run_shards(_transform_shard, vectorizer, shards, n_jobs), format='csr')
+
+
+def fit_transform_sharded(docs, vectorizer=None, n_jobs=-1):
+    """
+    Fit a vectorizer and vectorize documents, both sharded across processes.
+    
+    Args:
+        docs (iterable): Cleaned texts
+        vectorizer (optional): Unfitted vectorizer. Defaults to one for config.FEATURE_MODE
+        n_jobs (int): Worker processes (-1 for all CPUs)
+    
+    Returns:
+        tuple: (feature_matrix, vectorizer)
+    """
+    docs = list(docs)
+    vectorizer = fit_sharded(docs, vectorizer, n_jobs)
+    return transform_sharded(docs, vectorizer, n_jobs), vectorizer
@@ -0,0 +1,169 @@
+"""
+Streaming preprocessing pipeline.
+Runs load -> merge -> clean -> vectorize as generators over CSV chunks so
+peak memory is bounded by the chunk size instead of the dataset size.
+"""
+
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+from config.config import TARGET_COLUMN, CLEANED_TEXT_CACHE_ENABLED
+from module1_data_preprocessing.data_loader import iter_dataset, merge_text_columns
+from module1_data_preprocessing.text_preprocessor import preprocess_dataframe, resolve_n_jobs
+from module1_data_preprocessing.text_cache import CleanedTextCache
+from module1_data_preprocessing.feature_extractor import (
+    create_vectorizer,
+    describe_vectorizer,
+    HashingTfidfVectorizer
+)
+from module1_data_preprocessing.sharded_tfidf import update_counts, counts_to_arrays, fit_from_counts
+
+
+def iter_cleaned_chunks(file_path=None, chunksize=None, n_jobs=None, cache=None, **kwargs):
+    """
+    Stream cleaned text chunk by chunk.
+    
+    Raw text columns are dropped as soon as they are merged, so each yielded
+    chunk only holds the cleaned text and the label. The original row index
+    is kept.
+    
+    Args:
+        file_path (str, optional): Path to the CSV file
+        chunksize (int, optional): Rows per chunk
+        n_jobs (int, optional): Worker processes for cleaning
+        cache (CleanedTextCache or bool, optional): Cleaned-text cache, False to disable
+        **kwargs: Cleaning flags passed to clean_text()
+    
+    Yields:
+        pd.DataFrame: Chunk with 'text_cleaned' and, if present, the target column
+    """
+    owns_cache = False
+    if cache is None:
+        cache = CLEANED_TEXT_CACHE_ENABLED
+    if cache is True:
+        cache = CleanedTextCache()
+        owns_cache = True
+    
+    rows_in = rows_out = 0
+    try:
+        for i, chunk in enumerate(iter_dataset(file_path, chunksize=chunksize)):
+            rows_in += len(chunk)
+            chunk = merge_text_columns(chunk, verbose=False, drop_columns=True)
+            chunk = preprocess_dataframe(chunk, text_column='text', n_jobs=n_jobs,
+                                         cache=cache, verbose=False, **kwargs)
+            keep = ['text_cleaned'] + ([TARGET_COLUMN] if TARGET_COLUMN in chunk.columns else [])
+            chunk = chunk[keep]
+            rows_out += len(chunk)
+            print(f"  Chunk {i + 1}: {rows_in} rows read, {rows_out} kept")
+            yield chunk
+    finally:
+        if owns_cache:
+            cache.close()
+
+
+def fit_vectorizer_streaming(chunks, vectorizer=None, text_column='text_cleaned'):
+    """
+    Fit a vectorizer over streamed, cleaned chunks in a single pass.
+    
+    Each chunk's term and document frequencies are added to running Counter
+    totals, which are converted and pruned into the vocabulary once at the
+    end, so the result equals fit() over all the text.
+    Memory holds one chunk plus one count per distinct term, never the
+    document-term matrix; in hashing mode, only the document frequencies.
+    
+    Args:
+        chunks (iterable): Chunks from iter_cleaned_chunks()
+        vectorizer (optional): Unfitted vectorizer. Defaults to one for config.FEATURE_MODE
+        text_column (str): Name of the cleaned text column
+    
+    Returns:
+        Fitted vectorizer
+    """
+    if vectorizer is None:
+        vectorizer = create_vectorizer()
+    
+    print("\nFitting vectorizer on streamed text...")
+    if isinstance(vectorizer, HashingTfidfVectorizer):
+        vectorizer.fit([])
+        for chunk in chunks:
+            vectorizer.partial_fit(chunk[text_column])
+    elif vectorizer.vocabulary is not None:
+        # A fixed vocabulary only needs document frequencies; let sklearn count them
+        vectorizer.fit(text for chunk in chunks for text in chunk[text_column])
+    else:
+        analyzer = vectorizer.build_analyzer()
+        tf, df = Counter(), Counter()
+        n_docs = 0
+        for chunk in chunks:
+            update_counts(analyzer, chunk[text_column], tf, df)
+            n_docs += len(chunk)
+        if n_docs == 0:
+            raise ValueError("No documents to fit the vectorizer on")
+        fit_from_counts(vectorizer, *counts_to_arrays(tf, df), n_docs)
+    print(f"✓ Vectorizer fitted. {describe_vectorizer(vectorizer)}")
+    
+    return vectorizer
+
+
+_worker_vectorizer = None
+
+
+def _init_feature_worker(vectorizer):
+    """Process-pool initializer: receive the fitted vectorizer once per worker."""
+    global _worker_vectorizer
+    _worker_vectorizer = vectorizer
+
+
+def _transform_chunk(texts):
+    """Process-pool task: vectorize one chunk."""
+    return _worker_vectorizer.transform(texts)
+
+
+def _chunk_labels(chunk):
+    """Labels of a chunk, or None without the target column."""
+    return chunk[TARGET_COLUMN].values if TARGET_COLUMN in chunk.columns else None
+
+
+def iter_feature_chunks(chunks, vectorizer, text_column='text_cleaned', n_jobs=1):
+    """
+    Stream feature matrices from a fitted vectorizer.
+    
+    With n_jobs > 1 chunks are vectorized in worker processes, at most two
+    chunks per worker in flight so memory stays bounded. This suits the
+    hashing mode, whose fitted state is tiny to ship to each worker.
+    
+    Args:
+        chunks (iterable): Chunks from iter_cleaned_chunks()
+        vectorizer: Fitted vectorizer
+        text_column (str): Name of the cleaned text column
+        n_jobs (int): Worker processes (-1 for all CPUs)
+    
+    Yields:
+        tuple: (X_chunk, y_chunk, row_index); y_chunk is None without labels
+    """
+    n_jobs = resolve_n_jobs(n_jobs)
+    if n_jobs == 1:
+        for chunk in chunks:
+            X = vectorizer.transform(chunk[text_column])
+            yield X, _chunk_labels(chunk), chunk.index.values
+        return
+    
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+    
+    with ProcessPoolExecutor(max_workers=n_jobs,
+                             initializer=_init_feature_worker,
+                             initargs=(vectorizer,)) as executor:
+        pending = deque()
+        for chunk in chunks:
+            future = executor.submit(_transform_chunk, chunk[text_column].tolist())
+            pending.append((future, _chunk_labels(chunk), chunk.index.values))
+            if len(pending) >= 2 * n_jobs:
+                future, y, rows = pending.popleft()
+                yield future.result(), y, rows
+        while pending:
+            future, y, rows = pending.popleft()
+            yield future.result(), y, rows
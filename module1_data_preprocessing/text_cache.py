@@ -0,0 +1,276 @@
+"""
+Content-addressed on-disk cache for cleaned text.
+Stores clean_text() results keyed by a hash of the raw text and the
+cleaning flags, so repeated pipeline runs only clean new postings.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+from config.config import CLEANED_TEXT_CACHE_PATH, CLEANED_TEXT_CACHE_MAX_BYTES
+
+# Bump when the cleaning algorithm changes so old entries (and features built
+# from them, see feature_store.features_metadata) stop matching
+CLEANER_VERSION = 1
+
+# SQLite's default limit on bound parameters is 999 on older builds
+_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key BLOB PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (name, value) VALUES
+    ('total_bytes', 0), ('hits', 0), ('misses', 0), ('evictions', 0);
+"""
+
+
+def cache_namespace(options, stopwords=None):
+    """
+    Build the part of the cache key that depends on the cleaning setup.
+    
+    Args:
+        options (dict): Cleaning flags passed to clean_text()
+        stopwords (iterable, optional): Stopword list in use
+    
+    Returns:
+        bytes: Namespace digest mixed into every key
+    """
+    payload = {
+        'version': CLEANER_VERSION,
+        'options': {name: bool(value) for name, value in sorted(options.items())},
+        'stopwords': sorted(stopwords) if stopwords is not None else None,
+    }
+    return hashlib.blake2b(json.dumps(payload, sort_keys=True).encode('utf-8'),
+                           digest_size=16).digest()
+
+
+class CleanedTextCache:
+    """
+    Persistent LRU cache of cleaned text backed by SQLite.
+    
+    Entries are content-addressed, so concurrent writers of the same key
+    always agree on its value. Several pipeline processes can share one
+    cache file: SQLite's WAL journal lets readers run alongside a writer
+    and write transactions are serialized with BEGIN IMMEDIATE.
+    """
+    
+    def __init__(self, path=None, max_bytes=None, timeout=30.0):
+        """
+        Open (and create if needed) the cache database.
+        
+        Args:
+            path (str, optional): Cache file. Defaults to config.CLEANED_TEXT_CACHE_PATH
+            max_bytes (int, optional): Size bound for cached values.
+                                       Defaults to config.CLEANED_TEXT_CACHE_MAX_BYTES
+            timeout (float): Seconds to wait for another process's lock
+        """
+        if path is None:
+            path = CLEANED_TEXT_CACHE_PATH
+        if max_bytes is None:
+            max_bytes = CLEANED_TEXT_CACHE_MAX_BYTES
+        
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Autocommit mode; transactions are opened explicitly below
+        self.conn = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Idempotent DDL, safe when several processes open the cache at once
+        self.conn.executescript(_SCHEMA)
+        
+        # Statistics for this instance; cumulative totals live in the meta table
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def make_keys(texts, namespace):
+        """
+        Hash raw texts into cache keys.
+        
+        Args:
+            texts (iterable): Raw texts
+            namespace (bytes): Digest from cache_namespace()
+        
+        Returns:
+            list: 16-byte keys, one per text
+        """
+        base = hashlib.blake2b(namespace, digest_size=16)
+        keys = []
+        for text in texts:
+            h = base.copy()
+            h.update(text.encode('utf-8', 'surrogatepass'))
+            keys.append(h.digest())
+        return keys
+    
+    def get_many(self, keys):
+        """
+        Look up cleaned texts and mark the hits as recently used.
+        
+        Args:
+            keys (list): Keys from make_keys()
+        
+        Returns:
+            dict: Mapping of found keys to cleaned text
+        """
+        unique = list(dict.fromkeys(keys))
+        found = {}
+        for i in range(0, len(unique), _BATCH_SIZE):
+            batch = unique[i:i + _BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            rows = self.conn.execute(
+                f"SELECT key, value FROM entries WHERE key IN ({placeholders})", batch
+            ).fetchall()
+            found.update(rows)
+        
+        hits = sum(1 for key in keys if key in found)
+        misses = len(keys) - hits
+        self.hits += hits
+        self.misses += misses
+        
+        now = time.time()
+        hit_keys = list(found)
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for i in range(0, len(hit_keys), _BATCH_SIZE):
+                batch = hit_keys[i:i + _BATCH_SIZE]
+                placeholders = ','.join('?' * len(batch))
+                self.conn.execute(
+                    f"UPDATE entries SET last_access = ? WHERE key IN ({placeholders})",
+                    [now] + batch
+                )
+            self._bump('hits', hits)
+            self._bump('misses', misses)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        
+        return found
+    
+    def put_many(self, items):
+        """
+        Store cleaned texts, then evict least recently used entries over the bound.
+        
+        Args:
+            items (iterable): (key, cleaned_text) pairs
+        """
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            added = 0
+            for key, value in items:
+                size = len(value.encode('utf-8', 'surrogatepass'))
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO entries (key, value, size, last_access) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, value, size, now)
+                )
+                # Another process may have stored the same key first
+                if cursor.rowcount > 0:
+                    added += size
+            self._bump('total_bytes', added)
+            self._evict()
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+    
+    def _bump(self, name, amount):
+        """Add to a counter in the meta table (inside a transaction)."""
+        if amount:
+            self.conn.execute("UPDATE meta SET value = value + ? WHERE name = ?", (amount, name))
+    
+    def _meta(self, name):
+        """Read a counter from the meta table."""
+        return self.conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()[0]
+    
+    def _evict(self):
+        """Drop least recently used entries until under the size bound (inside a transaction)."""
+        total = self._meta('total_bytes')
+        if total <= self.max_bytes:
+            return
+        # Evict down to 90% of the bound so eviction is not triggered on every write
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        while total > target:
+            rows = self.conn.execute(
+                "SELECT key, size FROM entries ORDER BY last_access LIMIT ?", (_BATCH_SIZE,)
+            ).fetchall()
+            if not rows:
+                break
+            batch = []
+            for key, size in rows:
+                batch.append(key)
+                total -= size
+                if total <= target:
+                    break
+            placeholders = ','.join('?' * len(batch))
+            self.conn.execute(f"DELETE FROM entries WHERE key IN ({placeholders})", batch)
+            evicted += len(batch)
+        self.conn.execute("UPDATE meta SET value = ? WHERE name = 'total_bytes'", (max(total, 0),))
+        self._bump('evictions', evicted)
+        self.evictions += evicted
+    
+    def stats(self):
+        """
+        Get cache statistics.
+        
+        Returns:
+            dict: Instance and cumulative hit/miss/eviction counts and size
+        """
+        lookups = self.hits + self.misses
+        total_hits = self._meta('hits')
+        total_lookups = total_hits + self._meta('misses')
+        return {
+            'entries': self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0],
+            'bytes': self._meta('total_bytes'),
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'total_hits': total_hits,
+            'total_misses': total_lookups - total_hits,
+            'total_hit_rate': total_hits / total_lookups if total_lookups else 0.0,
+            'total_evictions': self._meta('evictions'),
+        }
+    
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute("DELETE FROM entries")
+            self.conn.execute("UPDATE meta SET value = 0")
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.hits = self.misses = self.evictions = 0
+    
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,35 +1,130 @@
 """
 Text preprocessing module.
 Handles cleaning, normalization, and preparation of text data.
+
+NLTK, BeautifulSoup and pandas are imported on first use, not at import
+time: the batch engine only needs them for rare inputs, and importing this
+module must stay cheap for the web app and CLIs.
 """
 
+import os
 import re
+import time
 import string
-import pandas as pd
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from bs4 import BeautifulSoup
+from functools import lru_cache
 import sys
 from pathlib import Path
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
-from config.config import LOWERCASE, REMOVE_PUNCTUATION, REMOVE_HTML, REMOVE_STOPWORDS
+from config.config import (
+    LOWERCASE,
+    REMOVE_PUNCTUATION,
+    REMOVE_HTML,
+    REMOVE_STOPWORDS,
+    PREPROCESS_N_JOBS,
+    PREPROCESS_CHUNK_SIZE,
+    CLEANED_TEXT_CACHE_ENABLED
+)
+from module1_data_preprocessing.text_cache import CleanedTextCache, cache_namespace
+from module1_data_preprocessing.stopword_list import ENGLISH_STOPWORDS
+
+# Bundled copy of NLTK's English stopwords, so no corpus download is needed
+STOPWORDS = set(ENGLISH_STOPWORDS)
+
+# Precompiled state shared by the batch cleaning engine (see TextCleaner)
+_PUNCTUATION_BYTES = string.punctuation.encode('ascii')
+_PUNCTUATION_RE = re.compile(f'[{re.escape(string.punctuation)}]')
+
+# Well-formed start/end tags that html.parser handles exactly like a regex
+_HTML_TAG_RE = re.compile(
+    r'</[a-zA-Z][-.a-zA-Z0-9:_]*[ \t\n\r\f]*>'
+    r'|<[a-zA-Z][-.a-zA-Z0-9:_]*'
+    r'(?:[ \t\n\r\f]+[^ \t\n\r\f"\'>/=\x00]+'
+    r'(?:[ \t\n\r\f]*=[ \t\n\r\f]*(?:"[^"]*"|\'[^\']*\'|[^ \t\n\r\f"\'=<>`]+))?)*'
+    r'[ \t\n\r\f]*/?>'
+)
+
+# Markup whose text BeautifulSoup treats specially (comments, declarations,
+# processing instructions, raw-text, whitespace-preserving and excluded-string
+# elements, broken end tags)
+_HTML_UNSAFE_RE = re.compile(
+    r'<(?:[!?]|/(?![a-zA-Z])|(?:script|style|template|rt|rp|pre|textarea)\b)',
+    re.IGNORECASE
+)
+
+# Whitespace that BeautifulSoup collapses when it makes up a whole string
+_HTML_ASCII_SPACES = ' \n\t\x0c\r'
+
+# References whose decoding by html.parser does not depend on the
+# surrounding text: ';'-terminated entity and character references, bare
+# entity names followed by a terminator, and a lone '&'. Any other '&'
+# takes the BeautifulSoup fallback.
+_HTML_REF_RE = re.compile(
+    r'&(?:[a-zA-Z][-.a-zA-Z0-9]*;'
+    r'|[a-zA-Z][-.a-zA-Z0-9]*(?=[^-.a-zA-Z0-9;])'
+    r'|#[0-9]+;'
+    r'|#[xX][0-9a-fA-F]+;'
+    r'|(?=[^a-zA-Z#]))'
+)
+
+# Leftover tag openers after the simple tags have been removed
+_HTML_DANGLING_RE = re.compile(r'<(?:[a-zA-Z/]|$)')
+
+# Input on which NLTK's word tokenizer does more than split on whitespace,
+# once ASCII punctuation has been removed: unicode quotes/dashes and the
+# apostrophe-free contractions ("cannot" -> "can not", "gonna" -> "gon na")
+_TOKENIZER_QUOTES_RE = re.compile(r'[«“‘„»”’\u2012-\u2015]')
+_TOKENIZER_CONTRACTIONS_RE = re.compile(
+    r'\b(?:cannot|gimme|gonna|gotta|lemme)\b|\bwanna(?=\s|$)',
+    re.IGNORECASE
+)
+_TOKENIZER_CONTRACTIONS = ('cannot', 'gimme', 'gonna', 'gotta', 'lemme', 'wanna')
+
+
+@lru_cache(maxsize=None)
+def _get_word_tokenizer():
+    """NLTK's word tokenizer, imported on first use (needs no NLTK data)."""
+    from nltk.tokenize.destructive import NLTKWordTokenizer
+    return NLTKWordTokenizer()
+
+
+def _word_tokenize(text):
+    """
+    nltk.word_tokenize(), imported on first use.
+    
+    Needs NLTK's punkt tokenizer data (installed by setup.py); it is never
+    downloaded at run time.
+    """
+    from nltk.tokenize import word_tokenize
+    return word_tokenize(text)
+
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
+def _is_missing(value):
+    """pd.isna() for a single value, importing pandas only for unusual types."""
+    if value is None:
+        return True
+    if isinstance(value, (str, int)):
+        return False
+    if isinstance(value, float):
+        return value != value
+    import pandas as pd
+    return pd.isna(value)
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords', quiet=True)
 
-# Get stopwords
-STOPWORDS = set(stopwords.words('english'))
+def _needs_word_tokenizer(text):
+    """Check whether punctuation-free text needs NLTK's tokenizer rules."""
+    if not text.isascii():
+        if _TOKENIZER_QUOTES_RE.search(text):
+            return True
+        if '\u0130' in text or '\u0131' in text:
+            # Case-insensitive 'i' also matches the Turkish dotted/dotless i
+            return _TOKENIZER_CONTRACTIONS_RE.search(text) is not None
+    # Cheap substring pre-check before the case-insensitive regex
+    lowered = text.lower()
+    if any(word in lowered for word in _TOKENIZER_CONTRACTIONS):
+        return _TOKENIZER_CONTRACTIONS_RE.search(text) is not None
+    return False
 
 
 def remove_html_tags(text):
@@ -42,9 +137,10 @@ def remove_html_tags(text):
     Returns:
         str: Text without HTML tags
     """
-    if pd.isna(text) or text == '':
+    if _is_missing(text) or text == '':
         return ''
     
+    from bs4 import BeautifulSoup
     soup = BeautifulSoup(str(text), 'html.parser')
     return soup.get_text()
 
@@ -67,7 +163,7 @@ def clean_text(text,
     Returns:
         str: Cleaned text
     """
-    if pd.isna(text) or text == '':
+    if _is_missing(text) or text == '':
         return ''
     
     text = str(text)
@@ -89,21 +185,381 @@ def clean_text(text,
     
     # Remove stopwords
     if remove_stopwords:
-        tokens = word_tokenize(text)
+        tokens = _word_tokenize(text)
         tokens = [token for token in tokens if token not in STOPWORDS]
         text = ' '.join(tokens)
     
     return text
 
 
-def preprocess_dataframe(df, text_column='text', **kwargs):
+@lru_cache(maxsize=4096)
+def _decode_html_ref(ref):
+    """Decode a single reference exactly as BeautifulSoup does."""
+    # Non-space sentinels keep whitespace-only results from being collapsed
+    return remove_html_tags(f'!{ref}!')[1:-1]
+
+
+def _decode_html_refs(text):
+    """
+    Decode the references in a tag-free text segment.
+    
+    Returns None when the segment contains an '&' that html.parser would
+    treat depending on what follows it.
+    """
+    if '&' in _HTML_REF_RE.sub('', text):
+        return None
+    return _HTML_REF_RE.sub(lambda match: _decode_html_ref(match.group()), text)
+
+
+def fast_remove_html_tags(text):
+    """
+    Remove HTML tags from text without building a parse tree.
+    
+    Simple tags are stripped with a regex and references are decoded from
+    a small cache. Input containing markup that BeautifulSoup handles
+    specially falls back to remove_html_tags(), so the result is always
+    identical to it.
+    
+    Args:
+        text (str): Input text
+    
+    Returns:
+        str: Text without HTML tags
+    """
+    if '<' not in text:
+        parts = [text]
+    elif _HTML_UNSAFE_RE.search(text):
+        return remove_html_tags(text)
+    else:
+        parts = _HTML_TAG_RE.split(text)
+    
+    for i, part in enumerate(parts):
+        if '<' in part and _HTML_DANGLING_RE.search(part):
+            return remove_html_tags(text)
+        if '&' in part:
+            part = _decode_html_refs(part)
+            if part is None:
+                return remove_html_tags(text)
+            parts[i] = part
+        if part and not part.strip(_HTML_ASCII_SPACES):
+            parts[i] = '\n' if '\n' in part else ' '
+    
+    return ''.join(parts)
+
+
+class TextCleaner:
+    """
+    Batch text-cleaning engine with precompiled state.
+    
+    Produces exactly the same output as clean_text() for the same flags,
+    but reuses precompiled punctuation tables and regexes across rows and fuses the
+    lowercase/punctuation/whitespace/stopword steps into a single pass.
+    """
+    
+    def __init__(self,
+                 lowercase=True,
+                 remove_punctuation=True,
+                 remove_html=True,
+                 remove_stopwords=True):
+        """
+        Initialize the cleaner.
+        
+        Args:
+            lowercase (bool): Convert to lowercase
+            remove_punctuation (bool): Remove punctuation
+            remove_html (bool): Remove HTML tags
+            remove_stopwords (bool): Remove stopwords
+        """
+        self.lowercase = lowercase
+        self.remove_punctuation = remove_punctuation
+        self.remove_html = remove_html
+        self.remove_stopwords = remove_stopwords
+        self.stopwords = STOPWORDS
+    
+    def tokenize(self, text):
+        """
+        Split whitespace-normalized text into tokens like word_tokenize().
+        
+        Args:
+            text (str): Input text
+        
+        Returns:
+            list: Tokens
+        """
+        tokens = text.split()
+        if not self.remove_punctuation:
+            # Punctuation drives sentence splitting and most tokenizer rules
+            return _word_tokenize(' '.join(tokens))
+        if _needs_word_tokenizer(text):
+            return _get_word_tokenizer().tokenize(' '.join(tokens))
+        return tokens
+    
+    def clean_tokens(self, text):
+        """
+        Clean a single text into its final tokens.
+        
+        This is the one tokenization and stopword pass of the pipeline: the
+        vectorizer's TokenAnalyzer consumes these tokens as they are.
+        
+        Args:
+            text (str): Input text to clean
+        
+        Returns:
+            list: Tokens of the cleaned text
+        """
+        if type(text) is not str:
+            if _is_missing(text):
+                return []
+            text = str(text)
+        if text == '':
+            return []
+        
+        if self.remove_html:
+            text = fast_remove_html_tags(text)
+        if self.lowercase:
+            text = text.lower()
+        if self.remove_punctuation:
+            if text.isascii():
+                # bytes.translate deletes characters far faster than str.translate
+                text = text.encode('ascii').translate(None, _PUNCTUATION_BYTES).decode('ascii')
+            else:
+                text = _PUNCTUATION_RE.sub('', text)
+        
+        if not self.remove_stopwords:
+            return text.split()
+        
+        stop = self.stopwords
+        return [token for token in self.tokenize(text) if token not in stop]
+    
+    def clean(self, text):
+        """
+        Clean a single text.
+        
+        Args:
+            text (str): Input text to clean
+        
+        Returns:
+            str: Cleaned text (tokens joined by single spaces)
+        """
+        return ' '.join(self.clean_tokens(text))
+    
+    def clean_many(self, texts):
+        """
+        Clean an iterable of texts.
+        
+        Args:
+            texts (iterable): Input texts
+        
+        Returns:
+            list: Cleaned texts, in input order
+        """
+        clean = self.clean
+        return [clean(text) for text in texts]
+
+
+def clean_texts(texts, **options):
+    """
+    Clean a batch of texts with a shared, precompiled TextCleaner.
+    
+    Args:
+        texts (iterable): Input texts to clean
+        **options: Cleaning flags accepted by clean_text()
+    
+    Returns:
+        list: Cleaned texts, byte-identical to clean_text() per item
+    """
+    return TextCleaner(**options).clean_many(texts)
+
+
+# Per-process cleaner used by the worker pool (see clean_texts_parallel)
+_worker_cleaner = None
+
+
+def _init_worker(options):
+    """Build the worker's TextCleaner once, when the process starts."""
+    global _worker_cleaner
+    _worker_cleaner = TextCleaner(**options)
+
+
+def _clean_chunk(texts):
+    """Clean one chunk in a worker; returns (pid, cleaned, seconds)."""
+    start = time.perf_counter()
+    cleaned = _worker_cleaner.clean_many(texts)
+    return os.getpid(), cleaned, time.perf_counter() - start
+
+
+def resolve_n_jobs(n_jobs):
+    """
+    Resolve an n_jobs value to a worker count.
+    
+    Negative values follow the joblib convention: -1 uses every CPU,
+    -2 all but one, and so on.
+    
+    Args:
+        n_jobs (int): Requested number of jobs
+    
+    Returns:
+        int: Number of worker processes (at least 1)
+    """
+    if n_jobs is None:
+        n_jobs = PREPROCESS_N_JOBS
+    if n_jobs < 0:
+        n_jobs = (os.cpu_count() or 1) + 1 + n_jobs
+    return max(1, n_jobs)
+
+
+def clean_texts_parallel(texts, n_jobs=-1, chunk_size=None, **options):
+    """
+    Clean a batch of texts in a process pool, preserving input order.
+    
+    Args:
+        texts (iterable): Input texts to clean
+        n_jobs (int): Number of worker processes (-1 for all CPUs)
+        chunk_size (int, optional): Texts per task.
+                                    Defaults to config.PREPROCESS_CHUNK_SIZE
+        **options: Cleaning flags accepted by clean_text()
+    
+    Returns:
+        list: Cleaned texts, identical to clean_texts()
+    """
+    texts = list(texts)
+    n_jobs = resolve_n_jobs(n_jobs)
+    if chunk_size is None:
+        chunk_size = PREPROCESS_CHUNK_SIZE
+    chunk_size = max(1, chunk_size)
+    
+    if n_jobs == 1 or len(texts) <= chunk_size:
+        return clean_texts(texts, **options)
+    
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    n_jobs = min(n_jobs, len(chunks))
+    print(f"  Cleaning {len(chunks)} chunks of up to {chunk_size} rows on {n_jobs} workers...")
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    cleaned = []
+    worker_stats = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=n_jobs,
+                             initializer=_init_worker,
+                             initargs=(options,)) as executor:
+        # map() yields results in submission order, so row order is preserved
+        for pid, chunk, seconds in executor.map(_clean_chunk, chunks):
+            cleaned.extend(chunk)
+            rows, busy = worker_stats.get(pid, (0, 0.0))
+            worker_stats[pid] = (rows + len(chunk), busy + seconds)
+    elapsed = time.perf_counter() - start
+    
+    for pid, (rows, busy) in sorted(worker_stats.items()):
+        print(f"    Worker {pid}: {rows} rows, {rows / busy if busy else 0:.0f} rows/s")
+    print(f"  Total throughput: {len(texts) / elapsed:.0f} rows/s")
+    
+    return cleaned
+
+
+def cleaning_options(**kwargs):
+    """
+    Build the effective cleaning flags.
+    
+    Args:
+        **kwargs: Flags overriding the LOWERCASE/REMOVE_* values in config
+    
+    Returns:
+        dict: Flags accepted by clean_text()
+    """
+    options = {
+        'lowercase': LOWERCASE,
+        'remove_punctuation': REMOVE_PUNCTUATION,
+        'remove_html': REMOVE_HTML,
+        'remove_stopwords': REMOVE_STOPWORDS,
+    }
+    options.update(kwargs)
+    return options
+
+
+def cleaning_key(**kwargs):
+    """
+    Get a digest identifying the cleaning setup (flags, stopwords, version).
+    
+    Args:
+        **kwargs: Flags overriding the LOWERCASE/REMOVE_* values in config
+    
+    Returns:
+        str: Hex digest
+    """
+    return cache_namespace(cleaning_options(**kwargs), STOPWORDS).hex()
+
+
+def clean_texts_cached(texts, cache, n_jobs=1, chunk_size=None, **options):
+    """
+    Clean a batch of texts, reusing results stored in a CleanedTextCache.
+    
+    Only texts whose (raw text, flags) key is not in the cache are cleaned;
+    their results are written back for the next run.
+    
+    Args:
+        texts (iterable): Input texts to clean
+        cache (CleanedTextCache): Cache to read from and write to
+        n_jobs (int): Worker processes for the texts that miss the cache
+        chunk_size (int, optional): Texts per worker task
+        **options: Cleaning flags accepted by clean_text()
+    
+    Returns:
+        list: Cleaned texts, identical to clean_texts()
+    """
+    texts = list(texts)
+    cleaned = [''] * len(texts)
+    
+    # Missing and non-string values are cheap to clean and are not cached
+    positions = [i for i, text in enumerate(texts) if type(text) is str and text]
+    others = [i for i, text in enumerate(texts) if not (type(text) is str and text)]
+    if others:
+        for i, value in zip(others, clean_texts([texts[i] for i in others], **options)):
+            cleaned[i] = value
+    
+    keys = cache.make_keys([texts[i] for i in positions], cache_namespace(options, STOPWORDS))
+    found = cache.get_many(keys)
+    
+    # Clean each distinct missing text once, even if it repeats in the batch
+    missing = {}
+    for i, key in zip(positions, keys):
+        if key not in found and key not in missing:
+            missing[key] = texts[i]
+    
+    if missing:
+        if resolve_n_jobs(n_jobs) > 1:
+            results = clean_texts_parallel(missing.values(), n_jobs=n_jobs,
+                                           chunk_size=chunk_size, **options)
+        else:
+            results = clean_texts(missing.values(), **options)
+        new_entries = dict(zip(missing.keys(), results))
+        cache.put_many(new_entries.items())
+        found.update(new_entries)
+    
+    for i, key in zip(positions, keys):
+        cleaned[i] = found[key]
+    
+    return cleaned
+
+
+def preprocess_dataframe(df, text_column='text', n_jobs=None, chunk_size=None,
+                         cache=None, verbose=True, **kwargs):
     """
     Preprocess text column in a dataframe.
     
     Args:
         df (pd.DataFrame): Input dataframe
         text_column (str): Name of the text column to preprocess
-        **kwargs: Additional arguments passed to clean_text()
+        n_jobs (int, optional): Worker processes for cleaning (-1 for all CPUs).
+                                Defaults to config.PREPROCESS_N_JOBS
+        chunk_size (int, optional): Rows per worker task.
+                                    Defaults to config.PREPROCESS_CHUNK_SIZE
+        cache (CleanedTextCache or bool, optional): Cleaned-text cache to use,
+                                    False to disable. Defaults to the shared
+                                    cache when config.CLEANED_TEXT_CACHE_ENABLED
+        verbose (bool): Print progress information
+        **kwargs: Cleaning flags passed to clean_text(); default to the
+                  LOWERCASE/REMOVE_* values in config
     
     Returns:
         pd.DataFrame: Dataframe with cleaned text column
@@ -112,24 +568,52 @@ def preprocess_dataframe(df, text_column='text', **kwargs):
         print(f"✗ Error: Column '{text_column}' not found in dataframe")
         return df
     
-    print(f"\nPreprocessing '{text_column}' column...")
-    print(f"  Rows to process: {len(df)}")
+    if verbose:
+        print(f"\nPreprocessing '{text_column}' column...")
+        print(f"  Rows to process: {len(df)}")
+    
+    options = cleaning_options(**kwargs)
+    
+    owns_cache = False
+    if cache is None:
+        cache = CLEANED_TEXT_CACHE_ENABLED
+    if cache is True:
+        cache = CleanedTextCache()
+        owns_cache = True
     
     # Apply cleaning function
-    df[f'{text_column}_cleaned'] = df[text_column].apply(
-        lambda x: clean_text(x, **kwargs)
-    )
+    n_jobs = resolve_n_jobs(n_jobs)
+    if cache:
+        try:
+            df[f'{text_column}_cleaned'] = clean_texts_cached(
+                df[text_column], cache, n_jobs=n_jobs, chunk_size=chunk_size, **options
+            )
+            if verbose:
+                stats = cache.stats()
+                print(f"  Cache: {stats['hits']} hits, {stats['misses']} misses "
+                      f"({stats['hit_rate'] * 100:.1f}% hit rate), "
+                      f"{stats['entries']} entries, {stats['bytes'] / 1024 / 1024:.1f} MB")
+        finally:
+            if owns_cache:
+                cache.close()
+    elif n_jobs > 1:
+        df[f'{text_column}_cleaned'] = clean_texts_parallel(
+            df[text_column], n_jobs=n_jobs, chunk_size=chunk_size, **options
+        )
+    else:
+        df[f'{text_column}_cleaned'] = clean_texts(df[text_column], **options)
     
     # Remove empty cleaned texts
     initial_count = len(df)
     df = df[df[f'{text_column}_cleaned'].str.len() > 0]
     removed_count = initial_count - len(df)
     
-    if removed_count > 0:
-        print(f"  Removed {removed_count} rows with empty cleaned text")
-    
-    print(f"✓ Preprocessing complete: {len(df)} rows remaining")
-    print(f"  Average cleaned text length: {df[f'{text_column}_cleaned'].str.len().mean():.0f} characters")
+    if verbose:
+        if removed_count > 0:
+            print(f"  Removed {removed_count} rows with empty cleaned text")
+        
+        print(f"✓ Preprocessing complete: {len(df)} rows remaining")
+        print(f"  Average cleaned text length: {df[f'{text_column}_cleaned'].str.len().mean():.0f} characters")
     
     return df
 
@@ -0,0 +1,280 @@
+"""
+Compact vectorizer storage module.
+Exports a fitted vectorizer as an uncompressed .npz holding only what
+transform() needs: the vocabulary (one UTF-8 blob plus offsets), the IDF
+weights and the analyzer settings. Loading memory-maps the arrays and
+needs neither pickle nor scikit-learn for the vocabulary TF-IDF mode, so
+web workers start faster and keep a smaller resident footprint.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+from config.config import COMPACT_VECTORIZER_PATH
+from module1_data_preprocessing.feature_extractor import TokenAnalyzer, HashingTfidfVectorizer
+
+# Bump when the stored layout changes
+FORMAT_VERSION = 1
+
+
+class CompactVectorizer:
+    """
+    Transform-only vectorizer loaded from a compact artifact.
+    
+    transform() produces the same matrix, bit for bit, as the fitted
+    TfidfVectorizer or HashingTfidfVectorizer it was exported from: the
+    same counting, sublinear/IDF weighting and l2 normalization, in the
+    same floating-point order. It cannot be fitted.
+    """
+    
+    def __init__(self, kind, analyzer, idf=None, vocabulary=None, n_features=None,
+                 norm='l2', sublinear_tf=False):
+        """
+        Args:
+            kind (str): "tfidf" (vocabulary lookup) or "hashing" (hashed columns)
+            analyzer (TokenAnalyzer): Turns a cleaned document into terms
+            idf (np.ndarray, optional): IDF weight per column (None: no IDF)
+            vocabulary (dict, optional): Term -> column, for kind "tfidf"
+            n_features (int, optional): Number of columns, for kind "hashing"
+            norm (str, optional): "l2" or None
+            sublinear_tf (bool): Replace counts with 1 + log(count)
+        """
+        if norm not in ('l2', None):
+            raise ValueError(f"Unsupported norm for a compact vectorizer: {norm!r}")
+        self.kind = kind
+        self.analyzer = analyzer
+        self.idf_ = idf
+        self.vocabulary_ = vocabulary
+        self.n_features = len(vocabulary) if kind == 'tfidf' else n_features
+        self.norm = norm
+        self.sublinear_tf = sublinear_tf
+    
+    def build_analyzer(self):
+        """Return the analyzer, like sklearn vectorizers."""
+        return self.analyzer
+    
+    def get_feature_names_out(self):
+        """Vocabulary terms in column order (kind "tfidf" only)."""
+        names = np.empty(len(self.vocabulary_), dtype=object)
+        for term, column in self.vocabulary_.items():
+            names[column] = term
+        return names
+    
+    def _count_vocabulary(self, docs):
+        """Term-count matrix over the vocabulary, as CountVectorizer builds it."""
+        vocabulary = self.vocabulary_
+        analyze = self.analyzer
+        columns = []
+        counts = []
+        indptr = [0]
+        for doc in docs:
+            doc_counts = {}
+            for term in analyze(doc):
+                column = vocabulary.get(term)
+                if column is not None:
+                    doc_counts[column] = doc_counts.get(column, 0) + 1
+            columns.extend(doc_counts)
+            counts.extend(doc_counts.values())
+            indptr.append(len(columns))
+        
+        X = sp.csr_matrix((np.array(counts, dtype=np.float64),
+                           np.array(columns, dtype=np.int32),
+                           np.array(indptr, dtype=np.int32)),
+                          shape=(len(indptr) - 1, self.n_features))
+        X.sort_indices()
+        return X
+    
+    def _count_hashed(self, docs):
+        """Hashed term-count matrix, as HashingTfidfVectorizer builds it."""
+        from sklearn.feature_extraction.text import HashingVectorizer
+        
+        if len(docs) == 0:
+            return sp.csr_matrix((0, self.n_features))
+        hasher = HashingVectorizer(analyzer=self.analyzer, n_features=self.n_features,
+                                   alternate_sign=False, norm=None)
+        X = hasher.transform(docs)
+        X.sum_duplicates()
+        return X
+    
+    @staticmethod
+    def _normalize_row(row):
+        """
+        l2-normalize one row's values in place.
+        
+        Squares are summed left to right, the order sklearn's normalize()
+        uses, so the result is bit-identical to it.
+        """
+        if len(row):
+            total = np.cumsum(row * row)[-1]
+            if total != 0.0:
+                row /= np.sqrt(total)
+    
+    def _normalize(self, X):
+        """l2-normalize the rows of a CSR matrix in place."""
+        data, indptr = X.data, X.indptr
+        for start, stop in zip(indptr[:-1], indptr[1:]):
+            self._normalize_row(data[start:stop])
+        return X
+    
+    def transform(self, docs):
+        """
+        Vectorize documents.
+        
+        Args:
+            docs (iterable): Cleaned texts or token lists
+        
+        Returns:
+            scipy.sparse.csr_matrix: TF-IDF features
+        """
+        if isinstance(docs, str):
+            raise ValueError("Iterable over documents expected, string object received.")
+        if not hasattr(docs, '__len__'):
+            docs = list(docs)
+        
+        X = self._count_vocabulary(docs) if self.kind == 'tfidf' else self._count_hashed(docs)
+        if self.sublinear_tf:
+            np.log(X.data, X.data)
+            X.data += 1.0
+        if self.idf_ is not None:
+            X.data *= self.idf_[X.indices]
+            if self.kind == 'hashing':
+                # Columns below min_df have an IDF of 0
+                X.eliminate_zeros()
+        if self.norm == 'l2':
+            X = self._normalize(X)
+        return X
+    
+    def transform_row(self, doc):
+        """
+        Vectorize one document into the non-zeros of its row.
+        
+        Gives the same values as transform([doc]) without building a sparse
+        matrix, which is most of the cost for a single request.
+        
+        Args:
+            doc (str or list): Cleaned text or tokens
+        
+        Returns:
+            tuple: (column indices in ascending order, values)
+        """
+        if self.kind != 'tfidf':
+            X = self.transform([doc])
+            return X.indices, X.data
+        
+        vocabulary = self.vocabulary_
+        counts = {}
+        for term in self.analyzer(doc):
+            column = vocabulary.get(term)
+            if column is not None:
+                counts[column] = counts.get(column, 0) + 1
+        columns = sorted(counts)
+        indices = np.array(columns, dtype=np.int32)
+        data = np.array([counts[column] for column in columns], dtype=np.float64)
+        
+        if self.sublinear_tf:
+            np.log(data, data)
+            data += 1.0
+        if self.idf_ is not None:
+            data *= self.idf_[indices]
+        if self.norm == 'l2':
+            self._normalize_row(data)
+        return indices, data
+    
+    def __repr__(self):
+        return (f"CompactVectorizer(kind={self.kind!r}, n_features={self.n_features}, "
+                f"analyzer={self.analyzer!r})")
+
+
+def export_vectorizer(vectorizer, file_path=None):
+    """
+    Save a fitted vectorizer in the compact format.
+    
+    Args:
+        vectorizer: Fitted TfidfVectorizer (with a TokenAnalyzer) or
+                    HashingTfidfVectorizer
+        file_path (str, optional): Output path. Defaults to config.COMPACT_VECTORIZER_PATH
+    
+    Returns:
+        Path: Path the vectorizer was written to
+    
+    Raises:
+        ValueError: If the vectorizer cannot be expressed in the compact format
+    """
+    if file_path is None:
+        file_path = COMPACT_VECTORIZER_PATH
+    
+    analyzer = vectorizer.analyzer
+    if not isinstance(analyzer, TokenAnalyzer):
+        raise ValueError("Only vectorizers with a TokenAnalyzer can be exported")
+    header = {
+        'format_version': FORMAT_VERSION,
+        'analyzer': {'ngram_range': list(analyzer.ngram_range),
+                     'min_token_length': analyzer.min_token_length},
+    }
+    arrays = {}
+    
+    if isinstance(vectorizer, HashingTfidfVectorizer):
+        header.update(kind='hashing', n_features=vectorizer.n_features, norm='l2',
+                      sublinear_tf=False)
+        if vectorizer.use_idf:
+            arrays['idf'] = np.asarray(vectorizer.idf_, dtype=np.float64)
+    else:
+        if vectorizer.binary or vectorizer.dtype != np.float64:
+            raise ValueError("Only float64, non-binary TF-IDF vectorizers can be exported")
+        header.update(kind='tfidf', norm=vectorizer.norm, sublinear_tf=vectorizer.sublinear_tf)
+        terms = vectorizer.get_feature_names_out()
+        encoded = [term.encode('utf-8') for term in terms]
+        arrays['terms'] = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        arrays['term_offsets'] = np.cumsum([0] + [len(term) for term in encoded], dtype=np.int64)
+        if vectorizer.use_idf:
+            arrays['idf'] = np.asarray(vectorizer.idf_, dtype=np.float64)
+    
+    arrays['header'] = np.frombuffer(json.dumps(header).encode('utf-8'), dtype=np.uint8)
+    # A file object keeps numpy from appending .npz to the path
+    with open(file_path, 'wb') as f:
+        np.savez(f, **arrays)
+    return Path(file_path)
+
+
+def load_compact_vectorizer(file_path=None, memory_map=True):
+    """
+    Load a vectorizer saved by export_vectorizer().
+    
+    Args:
+        file_path (str, optional): Input path. Defaults to config.COMPACT_VECTORIZER_PATH
+        memory_map (bool): Memory-map the arrays instead of reading them
+    
+    Returns:
+        CompactVectorizer: Loaded vectorizer, or None if the file does not
+                           exist or has another layout
+    """
+    from module1_data_preprocessing.feature_store import read_arrays
+    
+    if file_path is None:
+        file_path = COMPACT_VECTORIZER_PATH
+    if not Path(file_path).exists():
+        return None
+    
+    arrays = read_arrays(file_path, memory_map)
+    header = json.loads(arrays['header'].tobytes())
+    if header.get('format_version') != FORMAT_VERSION:
+        return None
+    
+    analyzer = TokenAnalyzer(tuple(header['analyzer']['ngram_range']),
+                             header['analyzer']['min_token_length'])
+    vocabulary = None
+    if header['kind'] == 'tfidf':
+        blob = arrays['terms'].tobytes()
+        offsets = arrays['term_offsets'].tolist()
+        vocabulary = {blob[start:stop].decode('utf-8'): column
+                      for column, (start, stop) in enumerate(zip(offsets[:-1], offsets[1:]))}
+    
+    return CompactVectorizer(header['kind'], analyzer, idf=arrays.get('idf'),
+                             vocabulary=vocabulary, n_features=header.get('n_features'),
+                             norm=header['norm'], sublinear_tf=header['sublinear_tf'])
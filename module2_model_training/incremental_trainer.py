@@ -0,0 +1,205 @@
+"""
+Out-of-core training module.
+Trains an SGDClassifier (log loss) with partial_fit over streamed feature
+chunks, so the full feature matrix is never materialized. A stratified
+holdout is carved out of every chunk by hashing row ids, which keeps the
+split identical across epochs without storing it.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+from config.config import (
+    TEST_SIZE,
+    RANDOM_STATE,
+    SGD_PARAMS,
+    INCREMENTAL_EPOCHS,
+    STREAM_CHUNK_SIZE
+)
+
+# Class labels, passed to the first partial_fit call
+CLASSES = np.array([0, 1])
+
+
+def _row_hash(row_ids, random_state):
+    """Map row ids to well-mixed uint64 values (splitmix64)."""
+    x = np.asarray(row_ids).astype(np.uint64)
+    x = x + np.uint64((random_state * 0x9E3779B97F4A7C15) % 2 ** 64)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def holdout_mask(row_ids, y, test_size=None, random_state=None):
+    """
+    Select the holdout rows of one chunk.
+    
+    Within each class, the round(test_size * n) rows with the smallest row-id
+    hash are held out, so every chunk is split in the class proportions and
+    the same rows are held out on every pass over the same chunks.
+    
+    Args:
+        row_ids (np.ndarray): Original row ids of the chunk
+        y (np.ndarray): Labels of the chunk
+        test_size (float, optional): Holdout fraction. Defaults to config.TEST_SIZE
+        random_state (int, optional): Seed. Defaults to config.RANDOM_STATE
+    
+    Returns:
+        np.ndarray: Boolean mask, True for holdout rows
+    """
+    if test_size is None:
+        test_size = TEST_SIZE
+    if random_state is None:
+        random_state = RANDOM_STATE
+    
+    hashes = _row_hash(row_ids, random_state)
+    mask = np.zeros(len(y), dtype=bool)
+    for label in np.unique(y):
+        members = np.flatnonzero(y == label)
+        n_test = int(round(test_size * len(members)))
+        if n_test:
+            order = np.argsort(hashes[members], kind='stable')
+            mask[members[order[:n_test]]] = True
+    return mask
+
+
+def prepare_streaming(n_jobs=None, chunksize=None):
+    """
+    Fit the vectorizer in one streaming pass and set up the chunk source for training.
+    
+    Module 1's memory-mapped processed data is reused when it matches the
+    current dataset and cleaning settings. Otherwise the raw CSV is streamed,
+    cleaned and written to the processed data file while the vectorizer is
+    fitted, so later epochs read the cleaned chunks back instead of cleaning
+    again.
+    
+    Args:
+        n_jobs (int, optional): Worker processes for text cleaning (-1 for all CPUs)
+        chunksize (int, optional): Rows per chunk. Defaults to config.STREAM_CHUNK_SIZE
+    
+    Returns:
+        tuple: (chunk_source, vectorizer); chunk_source() returns a fresh
+               iterator of cleaned chunks
+    """
+    from module1_data_preprocessing.text_preprocessor import cleaning_key
+    from module1_data_preprocessing.streaming import iter_cleaned_chunks, fit_vectorizer_streaming
+    from module1_data_preprocessing.processed_store import (
+        resolve_format,
+        read_processed_metadata,
+        is_current,
+        iter_processed_chunks,
+        write_chunks_processed,
+        source_fingerprint
+    )
+    
+    if chunksize is None:
+        chunksize = STREAM_CHUNK_SIZE
+    
+    def processed_chunks():
+        return iter_processed_chunks(chunksize=chunksize)
+    
+    def raw_chunks():
+        return iter_cleaned_chunks(chunksize=chunksize, n_jobs=n_jobs)
+    
+    key = cleaning_key()
+    if is_current(read_processed_metadata(), key):
+        print("✓ Streaming processed data from Module 1")
+        return processed_chunks, fit_vectorizer_streaming(processed_chunks())
+    
+    if resolve_format() != 'arrow':
+        return raw_chunks, fit_vectorizer_streaming(raw_chunks())
+    
+    print("Streaming raw dataset (cleaned chunks are saved for later epochs)...")
+    metadata = {'cleaning_key': key, 'source': source_fingerprint()}
+    vectorizer = fit_vectorizer_streaming(write_chunks_processed(raw_chunks(), metadata=metadata))
+    return processed_chunks, vectorizer
+
+
+def train_incremental(chunk_source, vectorizer, epochs=None, test_size=None,
+                      random_state=None, n_jobs=1):
+    """
+    Train an SGDClassifier with partial_fit over streamed chunks.
+    
+    Each epoch re-reads the chunks, drops the holdout rows and shuffles the
+    rest within the chunk before updating the model. Only one chunk's
+    features (per worker) are in memory at a time.
+    
+    Args:
+        chunk_source (callable): Returns a fresh iterator of cleaned chunks
+        vectorizer: Fitted vectorizer
+        epochs (int, optional): Passes over the data. Defaults to config.INCREMENTAL_EPOCHS
+        test_size (float, optional): Holdout fraction. Defaults to config.TEST_SIZE
+        random_state (int, optional): Seed. Defaults to config.RANDOM_STATE
+        n_jobs (int): Worker processes for vectorizing chunks (-1 for all CPUs)
+    
+    Returns:
+        SGDClassifier: Trained model
+    """
+    from sklearn.linear_model import SGDClassifier
+    from module1_data_preprocessing.streaming import iter_feature_chunks
+    
+    if epochs is None:
+        epochs = INCREMENTAL_EPOCHS
+    if random_state is None:
+        random_state = RANDOM_STATE
+    
+    print(f"\nTraining SGD classifier ({epochs} epochs)...")
+    model = SGDClassifier(random_state=random_state, **SGD_PARAMS)
+    rng = np.random.default_rng(random_state)
+    
+    for epoch in range(epochs):
+        start = time.perf_counter()
+        n_train = 0
+        for X, y, rows in iter_feature_chunks(chunk_source(), vectorizer, n_jobs=n_jobs):
+            if y is None:
+                raise ValueError("Chunks have no target column")
+            train = np.flatnonzero(~holdout_mask(rows, y, test_size, random_state))
+            if len(train) == 0:
+                continue
+            train = rng.permutation(train)
+            model.partial_fit(X[train], y[train], classes=CLASSES)
+            n_train += len(train)
+        print(f"  Epoch {epoch + 1}/{epochs}: {n_train} rows in {time.perf_counter() - start:.1f}s")
+    
+    print("✓ SGD classifier trained successfully")
+    return model
+
+
+def evaluate_incremental(model, chunk_source, vectorizer, test_size=None,
+                         random_state=None, n_jobs=1, model_name="SGD Classifier"):
+    """
+    Evaluate a model on the holdout rows of streamed chunks.
+    
+    Only the holdout labels and predictions are collected, never the features.
+    
+    Args:
+        model: Trained model
+        chunk_source (callable): Returns a fresh iterator of cleaned chunks
+        vectorizer: Fitted vectorizer
+        test_size (float, optional): Holdout fraction used in training
+        random_state (int, optional): Seed used in training
+        n_jobs (int): Worker processes for vectorizing chunks
+        model_name (str): Name of the model for display
+    
+    Returns:
+        dict: Metrics from evaluate_predictions()
+    """
+    from module1_data_preprocessing.streaming import iter_feature_chunks
+    from module2_model_training.model_evaluator import evaluate_predictions
+    
+    y_true, y_pred = [], []
+    for X, y, rows in iter_feature_chunks(chunk_source(), vectorizer, n_jobs=n_jobs):
+        test = np.flatnonzero(holdout_mask(rows, y, test_size, random_state))
+        if len(test):
+            y_true.append(y[test])
+            y_pred.append(model.predict(X[test]))
+    
+    y_true = np.concatenate(y_true) if y_true else np.array([], dtype=int)
+    y_pred = np.concatenate(y_pred) if y_pred else np.array([], dtype=int)
+    print(f"\nHoldout set: {len(y_true)} samples")
+    return evaluate_predictions(y_true, y_pred, model_name)
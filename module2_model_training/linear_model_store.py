@@ -0,0 +1,276 @@
+"""
+Linear model export module.
+Stores a binary logistic model (LogisticRegression, or SGDClassifier with
+log loss) as a weight vector plus intercept in an uncompressed .npz, and
+scores TF-IDF rows with a sigmoid over the sparse dot product. Loading
+memory-maps the weights and imports neither pickle nor scikit-learn, so
+the web app can serve linear models without sklearn.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+from config.config import LINEAR_MODEL_PATH, BEST_MODEL_PATH, LINEAR_MODEL_DTYPE
+
+# Bump when the stored layout changes
+FORMAT_VERSION = 1
+
+
+def _sigmoid(z):
+    """Logistic function, computed as scipy's expit (which sklearn uses) does."""
+    with np.errstate(over='ignore'):
+        return 1.0 / (1.0 + np.exp(-z))
+
+
+class LinearScorer:
+    """
+    Binary logistic scorer over sparse feature rows.
+    
+    Mirrors the parts of the sklearn classifier API that serving uses
+    (predict, predict_proba, decision_function, classes_), and adds
+    score_row() for a single row given as column indices and values.
+    With float64 weights (the default) probabilities match sklearn's to
+    rounding error, ~1e-15. float32 weights halve the size; rounding each
+    weight to 24 bits moves the logit by up to ~6e-8 times the sum of
+    |weight * value| over the row, so probabilities differ by up to ~1e-6
+    for typical TF-IDF rows, and labels can flip for scores within that
+    distance of 0.5.
+    """
+    
+    def __init__(self, coef, intercept, classes, model_name="Linear Model"):
+        """
+        Args:
+            coef (np.ndarray): Weight per feature column (float32 or float64)
+            intercept (float): Bias term
+            classes (np.ndarray): The two class labels, negative class first
+            model_name (str): Name of the exported estimator
+        """
+        self.coef_ = coef
+        self.intercept_ = float(intercept)
+        self.classes_ = np.asarray(classes)
+        self.model_name = model_name
+        self.n_features_in_ = len(coef)
+    
+    def _row_sums(self, indices, data, indptr):
+        """
+        Dot product of each CSR row with the weights.
+        
+        Single rows and batches go through the same reduction, so a posting
+        gets the same score alone as in a batch.
+        """
+        products = self.coef_[indices] * data
+        lengths = np.diff(indptr)
+        sums = np.zeros(len(lengths))
+        nonempty = lengths > 0
+        if nonempty.any():
+            # Empty rows add no products, so each start runs to the next non-empty row
+            sums[nonempty] = np.add.reduceat(products, indptr[:-1][nonempty])
+        return sums
+    
+    def score_row(self, indices, data):
+        """
+        Probability of the positive class for one sparse row.
+        
+        Args:
+            indices (np.ndarray): Column indices of the row's non-zeros
+            data (np.ndarray): The row's non-zero values
+        
+        Returns:
+            float: Positive-class probability
+        """
+        z = self.intercept_ + self._row_sums(indices, data, np.array([0, len(data)]))[0]
+        return float(_sigmoid(z))
+    
+    def decision_function(self, X):
+        """
+        Logit of the positive class.
+        
+        Args:
+            X (scipy.sparse.csr_matrix): Feature rows
+        
+        Returns:
+            np.ndarray: One score per row
+        """
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(f"X has {X.shape[1]} features, but the model expects "
+                             f"{self.n_features_in_}")
+        X = X.tocsr()
+        return self.intercept_ + self._row_sums(X.indices, X.data, X.indptr)
+    
+    def predict_proba(self, X):
+        """
+        Class probabilities, columns in classes_ order.
+        
+        Args:
+            X (scipy.sparse.csr_matrix): Feature rows
+        
+        Returns:
+            np.ndarray: Array of shape (n_rows, 2)
+        """
+        positive = _sigmoid(self.decision_function(X))
+        return np.column_stack([1.0 - positive, positive])
+    
+    def predict(self, X):
+        """
+        Predicted class labels.
+        
+        Args:
+            X (scipy.sparse.csr_matrix): Feature rows
+        
+        Returns:
+            np.ndarray: One label per row
+        """
+        return self.classes_[(self.decision_function(X) > 0).astype(int)]
+    
+    def __repr__(self):
+        return (f"LinearScorer(model_name={self.model_name!r}, n_features={self.n_features_in_}, "
+                f"dtype={self.coef_.dtype})")
+
+
+def is_exportable(model):
+    """
+    Check whether a fitted model can be exported as a LinearScorer.
+    
+    Args:
+        model: Fitted estimator
+    
+    Returns:
+        bool: True for binary logistic models
+    """
+    if not (hasattr(model, 'coef_') and hasattr(model, 'intercept_') and hasattr(model, 'classes_')):
+        return False
+    if len(model.classes_) != 2 or model.coef_.shape[0] != 1:
+        return False
+    # SGDClassifier only has logistic probabilities with log loss
+    return getattr(model, 'loss', 'log_loss') == 'log_loss'
+
+
+def export_linear_model(model, file_path=None, dtype=None, model_name=None):
+    """
+    Save a binary logistic model as weights plus intercept.
+    
+    Args:
+        model: Fitted LogisticRegression or log-loss SGDClassifier
+        file_path (str, optional): Output path. Defaults to config.LINEAR_MODEL_PATH
+        dtype (str, optional): Weight dtype, "float32" or "float64".
+                               Defaults to config.LINEAR_MODEL_DTYPE
+        model_name (str, optional): Name stored with the weights. Defaults
+                                    to the estimator's class name
+    
+    Returns:
+        Path: Path the model was written to
+    
+    Raises:
+        ValueError: If the model is not a binary logistic model
+    """
+    if file_path is None:
+        file_path = LINEAR_MODEL_PATH
+    if dtype is None:
+        dtype = LINEAR_MODEL_DTYPE
+    if not is_exportable(model):
+        raise ValueError(f"{type(model).__name__} is not a binary logistic model")
+    
+    header = {
+        'format_version': FORMAT_VERSION,
+        'model_name': model_name or type(model).__name__,
+        'intercept': float(model.intercept_[0]),
+    }
+    arrays = {
+        'coef': np.ascontiguousarray(model.coef_[0], dtype=dtype),
+        'classes': np.asarray(model.classes_),
+        'header': np.frombuffer(json.dumps(header).encode('utf-8'), dtype=np.uint8),
+    }
+    # A file object keeps numpy from appending .npz to the path
+    with open(file_path, 'wb') as f:
+        np.savez(f, **arrays)
+    return Path(file_path)
+
+
+def load_linear_model(file_path=None, memory_map=True):
+    """
+    Load a model saved by export_linear_model().
+    
+    Args:
+        file_path (str, optional): Input path. Defaults to config.LINEAR_MODEL_PATH
+        memory_map (bool): Memory-map the weights instead of reading them
+    
+    Returns:
+        LinearScorer: Loaded scorer, or None if the file does not exist or
+                      has another layout
+    """
+    from module1_data_preprocessing.feature_store import read_arrays
+    
+    if file_path is None:
+        file_path = LINEAR_MODEL_PATH
+    if not Path(file_path).exists():
+        return None
+    
+    arrays = read_arrays(file_path, memory_map)
+    header = json.loads(arrays['header'].tobytes())
+    if header.get('format_version') != FORMAT_VERSION:
+        return None
+    return LinearScorer(arrays['coef'], header['intercept'], np.array(arrays['classes']),
+                        model_name=header['model_name'])
+
+
+def save_serving_model(model, file_path=None, model_name="Best Model"):
+    """
+    Export the served model for sklearn-free scoring, when it is linear.
+    
+    A previous export is removed when the model is not linear, so the web
+    app does not serve stale weights next to a newer pickle.
+    
+    Args:
+        model: Fitted estimator saved as the best model
+        file_path (str, optional): Output path. Defaults to config.LINEAR_MODEL_PATH
+        model_name (str): Name of the model for logging
+    
+    Returns:
+        Path: Path of the export, or None if the model is not linear
+    """
+    if file_path is None:
+        file_path = LINEAR_MODEL_PATH
+    
+    if not is_exportable(model):
+        Path(file_path).unlink(missing_ok=True)
+        print(f"  {model_name} is not linear; the web app will load the pickle")
+        return None
+    
+    export_linear_model(model, file_path)
+    print(f"✓ {model_name} weights exported to {file_path}")
+    return Path(file_path)
+
+
+def load_serving_model(model_path=None, linear_path=None, model_name="Best Model"):
+    """
+    Load the model the web app serves.
+    
+    The linear export is used when it is at least as new as the pickle;
+    otherwise the pickle is loaded with load_model().
+    
+    Args:
+        model_path (str, optional): Pickled model. Defaults to config.BEST_MODEL_PATH
+        linear_path (str, optional): Linear export. Defaults to config.LINEAR_MODEL_PATH
+        model_name (str): Name of the model for logging
+    
+    Returns:
+        LinearScorer or estimator: Loaded model, or None if not found
+    """
+    model_path = Path(model_path or BEST_MODEL_PATH)
+    linear_path = Path(linear_path or LINEAR_MODEL_PATH)
+    
+    if linear_path.exists() and (not model_path.exists()
+                                 or linear_path.stat().st_mtime >= model_path.stat().st_mtime):
+        scorer = load_linear_model(linear_path)
+        if scorer is not None:
+            print(f"✓ {model_name} ({scorer.model_name}) loaded from {linear_path}")
+            return scorer
+    
+    from module2_model_training.model_trainer import load_model
+    
+    return load_model(model_path, model_name)
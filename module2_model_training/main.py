@@ -3,57 +3,73 @@ Main script for Module 2: Fake Job Classification Model
 Trains, evaluates, and compares ML models.
 """
 
+import argparse
 import sys
 from pathlib import Path
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from model_trainer import (
-    prepare_data,
-    train_logistic_regression,
-    train_random_forest,
-    save_model
-)
-from model_evaluator import evaluate_model, compare_models
+from model_trainer import save_model
+from model_evaluator import compare_models
+from incremental_trainer import prepare_streaming, train_incremental, evaluate_incremental
+from linear_model_store import save_serving_model
+from module1_data_preprocessing.feature_extractor import save_vectorizer
+from pipeline.stages import build_pipeline, STAGE_NAMES
 from config.config import (
+    DATA_DIR,
     LOGISTIC_REGRESSION_MODEL_PATH,
     RANDOM_FOREST_MODEL_PATH,
     BEST_MODEL_PATH,
+    SGD_MODEL_PATH,
     TARGET_ACCURACY
 )
 
 
-def main():
+def main(n_jobs=None, chunk_size=None, force=(), use_cache=True):
     """
     Main training and evaluation pipeline.
+    
+    Stages whose fingerprint is unchanged since the last run (including runs
+    of Module 1) are loaded from the pipeline cache instead of recomputed.
+    
+    Args:
+        n_jobs (int, optional): Worker processes for text cleaning and vectorizing (-1 for all CPUs)
+        chunk_size (int, optional): Rows per worker task
+        force (iterable): Stage names to recompute even if cached
+        use_cache (bool): False recomputes every stage and caches nothing
     """
     print("="*60)
     print("MODULE 2: FAKE JOB CLASSIFICATION MODEL")
     print("="*60)
     
+    pipeline = build_pipeline(n_jobs=n_jobs, chunk_size=chunk_size,
+                              force=force, use_cache=use_cache)
+    print()
+    pipeline.print_plan(['vectorize', 'evaluate'])
+    
     # Step 1: Prepare data
     print("\n[Step 1/5] Preparing data...")
-    X_train, X_test, y_train, y_test, vectorizer = prepare_data()
+    vectorized = pipeline.get('vectorize')
     
-    if X_train is None:
+    if vectorized is None:
         print("✗ Failed to prepare data. Exiting.")
         return
+    save_vectorizer(vectorized['vectorizer'])
     
     # Step 2: Train Logistic Regression
     print("\n[Step 2/5] Training Logistic Regression...")
-    lr_model = train_logistic_regression(X_train, y_train)
+    lr_model = pipeline.get('train_logistic_regression')
     save_model(lr_model, LOGISTIC_REGRESSION_MODEL_PATH, "Logistic Regression")
     
     # Step 3: Train Random Forest
     print("\n[Step 3/5] Training Random Forest...")
-    rf_model = train_random_forest(X_train, y_train)
+    rf_model = pipeline.get('train_random_forest')
     save_model(rf_model, RANDOM_FOREST_MODEL_PATH, "Random Forest")
     
     # Step 4: Evaluate models
     print("\n[Step 4/5] Evaluating models...")
-    lr_metrics = evaluate_model(lr_model, X_test, y_test, "Logistic Regression")
-    rf_metrics = evaluate_model(rf_model, X_test, y_test, "Random Forest")
+    lr_metrics, rf_metrics = pipeline.get('evaluate')
     
     # Step 5: Compare and select best model
     print("\n[Step 5/5] Comparing models...")
@@ -66,6 +82,7 @@ def main():
         best_model_obj = rf_model
     
     save_model(best_model_obj, BEST_MODEL_PATH, "Best Model")
+    save_serving_model(best_model_obj)
     
     # Check if target accuracy achieved
     print("\n" + "="*60)
@@ -85,5 +102,86 @@ def main():
     print("\nReady for Module 3: Web Interface & Prediction API")
 
 
+def main_incremental(n_jobs=None, chunksize=None, epochs=None):
+    """
+    Out-of-core training pipeline with bounded peak memory.
+    
+    Streams cleaned chunks, fits the vectorizer in one pass and trains an
+    SGDClassifier with partial_fit for several epochs, evaluating on a
+    stratified holdout carved out of every chunk. The model is saved as the
+    best model, so Module 3 serves it like the batch-trained ones.
+    
+    Args:
+        n_jobs (int, optional): Worker processes for cleaning and vectorizing (-1 for all CPUs)
+        chunksize (int, optional): Rows per chunk
+        epochs (int, optional): Passes over the training data
+    """
+    print("="*60)
+    print("MODULE 2: FAKE JOB CLASSIFICATION MODEL (OUT-OF-CORE)")
+    print("="*60)
+    
+    n_workers = n_jobs if n_jobs is not None else 1
+    
+    # Step 1: Fit vectorizer over streamed chunks
+    print("\n[Step 1/3] Streaming data and fitting vectorizer...")
+    try:
+        chunk_source, vectorizer = prepare_streaming(n_jobs=n_jobs, chunksize=chunksize)
+    except FileNotFoundError:
+        print(f"✗ Error: Dataset not found. Please place it in {DATA_DIR}/")
+        return
+    save_vectorizer(vectorizer)
+    
+    # Step 2: Train
+    print("\n[Step 2/3] Training SGD classifier...")
+    model = train_incremental(chunk_source, vectorizer, epochs=epochs, n_jobs=n_workers)
+    save_model(model, SGD_MODEL_PATH, "SGD Classifier")
+    
+    # Step 3: Evaluate on the holdout
+    print("\n[Step 3/3] Evaluating on holdout...")
+    metrics = evaluate_incremental(model, chunk_source, vectorizer, n_jobs=n_workers)
+    save_model(model, BEST_MODEL_PATH, "Best Model")
+    save_serving_model(model)
+    
+    print("\n" + "="*60)
+    print("TRAINING COMPLETE!")
+    print("="*60)
+    
+    if metrics['accuracy'] >= TARGET_ACCURACY:
+        print(f"✓ Target accuracy ({TARGET_ACCURACY*100}%) achieved!")
+    else:
+        print(f"⚠ Target accuracy ({TARGET_ACCURACY*100}%) not reached.")
+    
+    print(f"\nModel: {metrics['model_name']}")
+    print(f"  Accuracy: {metrics['accuracy']*100:.2f}%")
+    print(f"  F1-Score: {metrics['f1_score']:.4f}")
+    print(f"\nModel saved to: {BEST_MODEL_PATH}")
+    print("\nReady for Module 3: Web Interface & Prediction API")
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Module 2: Fake Job Classification Model")
+    parser.add_argument('--n-jobs', type=int, default=None,
+                        help='worker processes for text cleaning and vectorizing (-1 for all CPUs)')
+    parser.add_argument('--chunk-size', type=int, default=None,
+                        help='rows per worker task')
+    parser.add_argument('--force', action='append', default=[], choices=STAGE_NAMES,
+                        metavar='STAGE', help='recompute a stage even if cached (repeatable)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='recompute every stage and do not write the pipeline cache')
+    parser.add_argument('--incremental', action='store_true',
+                        help='train an SGD classifier out of core over streamed chunks')
+    parser.add_argument('--stream-chunksize', type=int, default=None,
+                        help='rows per chunk in incremental mode')
+    parser.add_argument('--epochs', type=int, default=None,
+                        help='passes over the data in incremental mode')
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.incremental:
+        main_incremental(n_jobs=args.n_jobs, chunksize=args.stream_chunksize, epochs=args.epochs)
+    else:
+        main(n_jobs=args.n_jobs, chunk_size=args.chunk_size,
+             force=args.force, use_cache=not args.no_cache)
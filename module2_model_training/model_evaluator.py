@@ -35,6 +35,24 @@ def evaluate_model(model, X_test, y_test, model_name="Model"):
     # Make predictions
     y_pred = model.predict(X_test)
     
+    return evaluate_predictions(y_test, y_pred, model_name)
+
+
+def evaluate_predictions(y_test, y_pred, model_name="Model"):
+    """
+    Compute and display evaluation metrics from predictions.
+    
+    Used directly when predictions are collected chunk by chunk (out-of-core
+    training) instead of from a single test matrix.
+    
+    Args:
+        y_test: Test labels
+        y_pred: Predicted labels
+        model_name: Name of the model for display
+    
+    Returns:
+        dict: Dictionary containing evaluation metrics
+    """
     # Calculate metrics
     accuracy = accuracy_score(y_test, y_pred)
     precision = precision_score(y_test, y_pred, average='weighted', zero_division=0)
@@ -1,13 +1,12 @@
 """
 Model training module.
 Handles training Logistic Regression and Random Forest classifiers.
+
+Training dependencies (scikit-learn estimators, the data pipeline) are
+imported inside the functions that use them, so the web app can import
+load_model() without paying for them.
 """
 
-import pandas as pd
-import numpy as np
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LogisticRegression
-from sklearn.ensemble import RandomForestClassifier
 import joblib
 import sys
 from pathlib import Path
@@ -15,56 +14,43 @@ from pathlib import Path
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 from config.config import (
-    TEST_SIZE,
     RANDOM_STATE,
+    LOGISTIC_REGRESSION_PARAMS,
+    RANDOM_FOREST_PARAMS,
     LOGISTIC_REGRESSION_MODEL_PATH,
     RANDOM_FOREST_MODEL_PATH
 )
-from module1_data_preprocessing.feature_extractor import load_vectorizer, extract_features
-from module1_data_preprocessing.data_loader import load_dataset
-from module1_data_preprocessing.text_preprocessor import preprocess_dataframe, merge_text_columns
 
 
-def prepare_data():
+def prepare_data(n_jobs=None, chunk_size=None, use_processed=True):
     """
     Load and prepare data for training.
     
+    Features come from the shared pipeline's vectorize and split stages, so
+    this reuses (and fills) the same cache as the Module 1 and Module 2 scripts.
+    
+    Args:
+        n_jobs (int, optional): Worker processes for text cleaning and vectorizing (-1 for all CPUs)
+        chunk_size (int, optional): Rows per worker task
+        use_processed (bool): Load cached pipeline stages when their fingerprint
+                              matches; False recomputes them and caches nothing
+    
     Returns:
         tuple: (X_train, X_test, y_train, y_test, vectorizer)
     """
-    print("Preparing data for training...")
-    
-    # Load dataset
-    df = load_dataset()
-    if df is None:
-        return None, None, None, None, None
-    
-    # Merge text columns
-    df = merge_text_columns(df)
+    from pipeline.stages import build_pipeline
     
-    # Preprocess text
-    df = preprocess_dataframe(df, text_column='text')
-    
-    # Extract features
-    X, vectorizer = extract_features(df, text_column='text_cleaned', fit=True)
+    print("Preparing data for training...")
     
-    # Get target variable
-    if 'fraudulent' not in df.columns:
-        print("✗ Error: 'fraudulent' column not found in dataset")
+    pipeline = build_pipeline(n_jobs=n_jobs, chunk_size=chunk_size, use_cache=use_processed)
+    vectorized = pipeline.get('vectorize')
+    if vectorized is None:
         return None, None, None, None, None
+    split = pipeline.get('split')
     
-    y = df['fraudulent'].values
-    
-    # Split data
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE, stratify=y
-    )
+    print("✓ Data prepared")
     
-    print(f"✓ Data prepared:")
-    print(f"  Training set: {X_train.shape[0]} samples")
-    print(f"  Test set: {X_test.shape[0]} samples")
-    
-    return X_train, X_test, y_train, y_test, vectorizer
+    return split['X_train'], split['X_test'], split['y_train'], split['y_test'], vectorized['vectorizer']
 
 
 def train_logistic_regression(X_train, y_train, random_state=None):
@@ -79,38 +65,45 @@ def train_logistic_regression(X_train, y_train, random_state=None):
     Returns:
         LogisticRegression: Trained model
     """
+    from sklearn.linear_model import LogisticRegression
+    
     if random_state is None:
         random_state = RANDOM_STATE
     
     print("\nTraining Logistic Regression...")
-    model = LogisticRegression(random_state=random_state, max_iter=1000)
+    model = LogisticRegression(random_state=random_state, **LOGISTIC_REGRESSION_PARAMS)
     model.fit(X_train, y_train)
     print("✓ Logistic Regression trained successfully")
     
     return model
 
 
-def train_random_forest(X_train, y_train, n_estimators=100, random_state=None):
+def train_random_forest(X_train, y_train, n_estimators=None, random_state=None):
     """
     Train Random Forest classifier.
     
     Args:
         X_train: Training features
         y_train: Training labels
-        n_estimators: Number of trees
+        n_estimators: Number of trees (defaults to config.RANDOM_FOREST_PARAMS)
         random_state: Random state for reproducibility
     
     Returns:
         RandomForestClassifier: Trained model
     """
+    from sklearn.ensemble import RandomForestClassifier
+    
     if random_state is None:
         random_state = RANDOM_STATE
+    params = dict(RANDOM_FOREST_PARAMS)
+    if n_estimators is not None:
+        params['n_estimators'] = n_estimators
     
     print("\nTraining Random Forest...")
     model = RandomForestClassifier(
-        n_estimators=n_estimators,
         random_state=random_state,
-        n_jobs=-1
+        n_jobs=-1,
+        **params
     )
     model.fit(X_train, y_train)
     print("✓ Random Forest trained successfully")
@@ -5,6 +5,7 @@ Provides web interface and API endpoints for predictions.
 
 from flask import Flask, render_template, request, jsonify
 from flask_cors import CORS
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import sys
 from pathlib import Path
 
@@ -12,12 +13,22 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from prediction_service import PredictionService
-from config.config import FLASK_HOST, FLASK_PORT, FLASK_DEBUG
+from micro_batcher import MicroBatcher
+from config.config import (
+    FLASK_HOST,
+    FLASK_PORT,
+    FLASK_DEBUG,
+    PREDICT_BATCH_MAX_ITEMS,
+    MICRO_BATCH_ENABLED,
+    MICRO_BATCH_TIMEOUT_SECONDS,
+    PREDICTION_LOG_WRITE_BEHIND
+)
 
 # Module 4 imports
-from module4_dashboard.database import init_db, log_prediction, db
+from module4_dashboard.database import init_db, log_prediction, log_predictions, db
 from module4_dashboard.auth import init_auth
 from module4_dashboard.admin_routes import admin_bp
+from module4_dashboard.log_writer import PredictionLogWriter
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your-secret-key-change-in-production'  # Change in production!
@@ -32,6 +43,9 @@ init_auth(app)
 # Register admin blueprint (Module 4)
 app.register_blueprint(admin_bp)
 
+# Write prediction logs in the background, in bulk (Module 4)
+log_writer = PredictionLogWriter(app) if PREDICTION_LOG_WRITE_BEHIND else None
+
 # Initialize prediction service
 try:
     prediction_service = PredictionService()
@@ -39,6 +53,11 @@ except Exception as e:
     print(f"Warning: Could not initialize prediction service: {e}")
     prediction_service = None
 
+# Share scoring calls between concurrent /predict requests (opt-in)
+micro_batcher = None
+if MICRO_BATCH_ENABLED and prediction_service is not None:
+    micro_batcher = MicroBatcher(prediction_service.predict_batch)
+
 
 @app.route('/')
 def index():
@@ -77,8 +96,15 @@ def predict():
         if not job_description:
             return jsonify({'error': 'Job description is required'}), 400
         
-        # Make prediction
-        result = prediction_service.predict(job_description, requirements, benefits)
+        # Make prediction, batched with concurrent requests when enabled
+        if micro_batcher is not None:
+            try:
+                result = micro_batcher.predict(job_description, requirements, benefits,
+                                               timeout=MICRO_BATCH_TIMEOUT_SECONDS)
+            except FutureTimeoutError:
+                return jsonify({'error': 'Prediction timed out. Please try again.'}), 503
+        else:
+            result = prediction_service.predict(job_description, requirements, benefits)
         
         if 'error' in result:
             return jsonify(result), 400
@@ -86,7 +112,10 @@ def predict():
         # Log prediction to database (Module 4)
         try:
             ip_address = request.remote_addr
-            log_prediction(job_description, requirements, benefits, result, ip_address)
+            if log_writer is not None:
+                log_writer.log(job_description, requirements, benefits, result, ip_address)
+            else:
+                log_prediction(job_description, requirements, benefits, result, ip_address)
         except Exception as e:
             print(f"Warning: Could not log prediction: {e}")
         
@@ -96,6 +125,111 @@ def predict():
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
+def _posting_fields(posting):
+    """
+    Validate one /predict/batch posting.
+    
+    Missing and null fields are treated as empty text.
+    
+    Args:
+        posting: One item of the request's "postings" list
+    
+    Returns:
+        tuple: (dict with string 'job_description', 'requirements' and
+               'benefits', None), or (None, error result dict)
+    """
+    if not isinstance(posting, dict):
+        return None, {'error': 'Posting must be a JSON object'}
+    
+    fields = {}
+    for name in ('job_description', 'requirements', 'benefits'):
+        value = posting.get(name)
+        if value is None:
+            value = ''
+        elif not isinstance(value, str):
+            return None, {'error': f'"{name}" must be a string'}
+        fields[name] = value
+    
+    if not fields['job_description']:
+        return None, {'error': 'Job description is required'}
+    return fields, None
+
+
+@app.route('/predict/batch', methods=['POST'])
+def predict_batch():
+    """
+    API endpoint for predicting many postings in one call.
+    
+    Expected JSON payload:
+    {
+        "postings": [
+            {
+                "job_description": "string",
+                "requirements": "string" (optional),
+                "benefits": "string" (optional)
+            },
+            ...
+        ]
+    }
+    
+    Returns one entry per posting, in order: the same result as /predict,
+    or {"error": "..."} for a posting that could not be predicted.
+    """
+    if prediction_service is None:
+        return jsonify({
+            'error': 'Prediction service not available. Please train models first.'
+        }), 503
+    
+    try:
+        # Get data from request
+        data = request.get_json(silent=True)
+        postings = data.get('postings') if isinstance(data, dict) else None
+        
+        if not isinstance(postings, list) or not postings:
+            return jsonify({'error': 'A non-empty "postings" list is required'}), 400
+        if len(postings) > PREDICT_BATCH_MAX_ITEMS:
+            return jsonify({
+                'error': f'At most {PREDICT_BATCH_MAX_ITEMS} postings per request'
+            }), 413
+        
+        # Validate each posting as /predict does; only valid ones are predicted
+        results = [None] * len(postings)
+        valid, fields = [], []
+        for position, posting in enumerate(postings):
+            posting_fields, error = _posting_fields(posting)
+            if error:
+                results[position] = error
+            else:
+                valid.append(position)
+                fields.append(posting_fields)
+        
+        # Make predictions
+        predicted = prediction_service.predict_batch(fields)
+        for position, result in zip(valid, predicted):
+            results[position] = result
+        
+        # Log the successful predictions in one write (Module 4)
+        entries = [(posting_fields, results[position])
+                   for position, posting_fields in zip(valid, fields)
+                   if 'error' not in results[position]]
+        try:
+            if log_writer is not None:
+                log_writer.log_many(entries, request.remote_addr)
+            else:
+                log_predictions(entries, request.remote_addr)
+        except Exception as e:
+            print(f"Warning: Could not log predictions: {e}")
+        
+        return jsonify({
+            'results': results,
+            'count': len(results),
+            'errors': sum('error' in result for result in results)
+        }), 200
+    
+    except Exception as e:
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
+
+
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint."""
@@ -103,6 +237,12 @@ def health():
         'status': 'healthy',
         'service_available': prediction_service is not None
     }
+    if micro_batcher is not None:
+        status['micro_batcher'] = micro_batcher.stats()
+    if prediction_service is not None and prediction_service.cache is not None:
+        status['result_cache'] = prediction_service.cache_stats()
+    if log_writer is not None:
+        status['prediction_log'] = log_writer.stats()
     return jsonify(status), 200
 
 
@@ -116,6 +256,7 @@ if __name__ == '__main__':
     print(f"  http://localhost:{FLASK_PORT}")
     print("\nAPI Endpoints:")
     print(f"  POST http://localhost:{FLASK_PORT}/predict")
+    print(f"  POST http://localhost:{FLASK_PORT}/predict/batch")
     print(f"  GET  http://localhost:{FLASK_PORT}/health")
     print("="*60)
     
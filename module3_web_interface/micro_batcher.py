@@ -0,0 +1,215 @@
+"""
+Micro-batching scheduler for concurrent prediction requests.
+Request threads hand their posting to a queue and wait; one worker thread
+collects up to max_batch_size postings, or whatever arrived within
+max_wait_ms of the first one, runs them through predict_batch() in one
+call and hands each caller its own result.
+"""
+
+import atexit
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+from config.config import MICRO_BATCH_MAX_SIZE, MICRO_BATCH_MAX_WAIT_MS
+
+# Queue marker that makes the worker flush and exit
+_STOP = object()
+
+
+class MicroBatcher:
+    """
+    Groups single predictions from concurrent callers into batches.
+    
+    A caller waits at most max_wait_ms for others to join its batch (plus
+    the time to score batches ahead of it), so the batcher trades a little
+    latency for fewer, larger predict_batch() calls.
+    """
+    
+    def __init__(self, predict_batch, max_batch_size=None, max_wait_ms=None):
+        """
+        Args:
+            predict_batch (callable): Takes a list of posting dicts and returns
+                                      one result per posting, in order
+            max_batch_size (int, optional): Flush once this many postings are
+                                            queued. Defaults to config.MICRO_BATCH_MAX_SIZE
+            max_wait_ms (float, optional): Flush this long after the first
+                                           posting of a batch arrived. Defaults
+                                           to config.MICRO_BATCH_MAX_WAIT_MS
+        """
+        self.predict_batch = predict_batch
+        self.max_batch_size = max(1, max_batch_size or MICRO_BATCH_MAX_SIZE)
+        self.max_wait = (MICRO_BATCH_MAX_WAIT_MS if max_wait_ms is None else max_wait_ms) / 1000
+        
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._batches = 0
+        self._items = 0
+        self._largest_batch = 0
+        self._last_batch = 0
+        self._flushes = {'size': 0, 'time': 0, 'shutdown': 0}
+        
+        self._thread = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def submit(self, posting):
+        """
+        Queue one posting for the next batch.
+        
+        Args:
+            posting (dict): 'job_description' and optional 'requirements'
+                            and 'benefits'
+        
+        Returns:
+            Future: Resolves to the posting's prediction result
+        """
+        future = Future()
+        # Checked and queued under the lock, so nothing is queued behind close()'s stop marker
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Micro-batcher is closed")
+            self._queue.put((posting, future))
+        return future
+    
+    def predict(self, job_description, requirements="", benefits="", timeout=None):
+        """
+        Predict one posting as part of a batch, blocking until it is scored.
+        
+        Args:
+            job_description (str): Job description text
+            requirements (str): Job requirements text
+            benefits (str): Job benefits text
+            timeout (float, optional): Seconds to wait for the result
+        
+        Returns:
+            dict: Same result as PredictionService.predict()
+        
+        Raises:
+            concurrent.futures.TimeoutError: If the result is not ready within
+                timeout; the posting is then dropped from its batch if not yet scored
+        """
+        posting = {'job_description': job_description, 'requirements': requirements,
+                   'benefits': benefits}
+        future = self.submit(posting)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+    
+    def _collect(self):
+        """
+        Wait for a batch to fill or time out.
+        
+        Returns:
+            tuple: (list of (posting, future), flush reason), or (None, None)
+                   once stopped with nothing queued
+        """
+        first = self._queue.get()
+        if first is _STOP:
+            return None, None
+        
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                return batch, 'time'
+            if item is _STOP:
+                # Score what was queued before close(), then stop
+                self._queue.put(_STOP)
+                return batch, 'shutdown'
+            batch.append(item)
+        return batch, 'size'
+    
+    def _run(self):
+        """Worker loop: collect, score and resolve batches until stopped."""
+        try:
+            self._serve()
+        finally:
+            # Fail whatever is still queued, also when the worker died unexpectedly
+            with self._lock:
+                self._closed = True
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not _STOP and item[1].set_running_or_notify_cancel():
+                    item[1].set_exception(RuntimeError("Micro-batcher is closed"))
+    
+    def _serve(self):
+        """Collect, score and resolve batches until stopped."""
+        while True:
+            batch, reason = self._collect()
+            if batch is None:
+                return
+            
+            # Skip postings whose callers timed out and cancelled
+            batch = [(posting, future) for posting, future in batch
+                     if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            
+            postings = [posting for posting, _ in batch]
+            try:
+                results = self.predict_batch(postings)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+            else:
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+                for _, future in batch[len(results):]:
+                    future.set_exception(RuntimeError("predict_batch returned too few results"))
+            
+            with self._lock:
+                self._batches += 1
+                self._items += len(batch)
+                self._largest_batch = max(self._largest_batch, len(batch))
+                self._last_batch = len(batch)
+                self._flushes[reason] += 1
+    
+    def stats(self):
+        """
+        Queue and batch metrics.
+        
+        Returns:
+            dict: Current queue depth, batch counts and sizes, and how many
+                  batches were flushed by size, by time and at shutdown
+        """
+        with self._lock:
+            return {
+                'queue_depth': self._queue.qsize(),
+                'max_batch_size': self.max_batch_size,
+                'max_wait_ms': self.max_wait * 1000,
+                'batches': self._batches,
+                'items': self._items,
+                'mean_batch_size': round(self._items / self._batches, 2) if self._batches else 0,
+                'largest_batch': self._largest_batch,
+                'last_batch_size': self._last_batch,
+                'flushes': dict(self._flushes),
+            }
+    
+    def close(self, timeout=None):
+        """
+        Score everything already queued, then stop the worker.
+        
+        Args:
+            timeout (float, optional): Seconds to wait for the worker
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join(timeout)
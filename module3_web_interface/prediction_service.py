@@ -3,17 +3,49 @@ Prediction service module.
 Handles preprocessing and prediction using the trained model.
 """
 
-import pandas as pd
+import hashlib
 import sys
+import threading
+import time
 from pathlib import Path
 
+import numpy as np
+
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from module1_data_preprocessing.text_preprocessor import clean_text
-from module1_data_preprocessing.feature_extractor import load_vectorizer
-from module2_model_training.model_trainer import load_model
-from config.config import BEST_MODEL_PATH, TFIDF_VECTORIZER_PATH
+from module1_data_preprocessing.text_preprocessor import TextCleaner, cleaning_options
+from module1_data_preprocessing.feature_extractor import load_vectorizer, TokenAnalyzer
+from module1_data_preprocessing.vectorizer_store import CompactVectorizer
+from module2_model_training.linear_model_store import load_serving_model, LinearScorer
+from module3_web_interface.result_cache import result_key, create_result_cache
+from config.config import (
+    BEST_MODEL_PATH,
+    LINEAR_MODEL_PATH,
+    TFIDF_VECTORIZER_PATH,
+    COMPACT_VECTORIZER_PATH,
+    ARTIFACT_CHECK_INTERVAL_SECONDS
+)
+
+# Files whose change means a new model version
+ARTIFACT_PATHS = [BEST_MODEL_PATH, LINEAR_MODEL_PATH, TFIDF_VECTORIZER_PATH, COMPACT_VECTORIZER_PATH]
+
+
+def artifact_signature():
+    """
+    Snapshot of the served artifacts' modification times and sizes.
+    
+    Returns:
+        tuple: (path, mtime_ns, size) per existing artifact file
+    """
+    signature = []
+    for path in ARTIFACT_PATHS:
+        try:
+            stat = Path(path).stat()
+        except FileNotFoundError:
+            continue
+        signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
 
 
 class PredictionService:
@@ -21,24 +53,111 @@ class PredictionService:
     Service class for making predictions on job postings.
     """
     
-    def __init__(self):
-        """Initialize the prediction service by loading model and vectorizer."""
-        self.model = None
-        self.vectorizer = None
-        self._load_artifacts()
+    def __init__(self, model=None, vectorizer=None, cache=None, model_version=None):
+        """
+        Initialize the prediction service by loading model and vectorizer.
+        
+        Artifacts loaded from models/ are reloaded when they change on
+        disk; pre-loaded ones are used as given.
+        
+        Args:
+            model (optional): Pre-loaded model; both artifacts are loaded
+                              from models/ unless model and vectorizer are given
+            vectorizer (optional): Pre-loaded vectorizer
+            cache (optional): Result cache; defaults to the one configured by
+                              config.RESULT_CACHE_BACKEND, False disables caching
+            model_version (str, optional): Cache version of pre-loaded artifacts
+        """
+        # Same cleaning flags, tokenizer and stopwords as training
+        self.cleaner = TextCleaner(**cleaning_options())
+        self.cache = create_result_cache() if cache is None else (cache or None)
+        self._reload_lock = threading.Lock()
+        self._signature = None
+        self._next_check = 0.0
+        
+        if model is None or vectorizer is None:
+            self._artifacts = (None, None, None)
+            self._load_artifacts()
+        else:
+            # (model, vectorizer, version), swapped as one so requests never mix versions
+            self._artifacts = (model, vectorizer,
+                               model_version or f"in-memory-{id(model):x}-{id(vectorizer):x}")
+    
+    @property
+    def model(self):
+        """Model currently served."""
+        return self._artifacts[0]
+    
+    @property
+    def vectorizer(self):
+        """Vectorizer currently served."""
+        return self._artifacts[1]
+    
+    @property
+    def model_version(self):
+        """Version of the served artifacts, part of every result cache key."""
+        return self._artifacts[2]
     
     def _load_artifacts(self):
-        """Load the trained model and vectorizer."""
+        """
+        Load the trained model and vectorizer.
+        
+        The compact vectorizer and, for linear models, the exported weights
+        are preferred when current, so serving needs no scikit-learn.
+        """
         print("Loading model and vectorizer...")
-        self.model = load_model(BEST_MODEL_PATH, "Best Model")
-        self.vectorizer = load_vectorizer(TFIDF_VECTORIZER_PATH)
+        # Taken before loading, so a write during the load triggers another reload
+        signature = artifact_signature()
+        model = load_serving_model()
+        vectorizer = load_vectorizer()
         
-        if self.model is None or self.vectorizer is None:
+        if model is None or vectorizer is None:
             raise FileNotFoundError(
                 "Model or vectorizer not found. Please train models first using Module 2."
             )
+        version = hashlib.blake2b(repr(signature).encode('utf-8'), digest_size=8).hexdigest()
+        self._artifacts = (model, vectorizer, version)
+        self._signature = signature
         print("✓ Model and vectorizer loaded successfully")
     
+    def _current_artifacts(self):
+        """
+        Get the served (model, vectorizer, version), reloading changed artifacts first.
+        
+        models/ is checked at most every ARTIFACT_CHECK_INTERVAL_SECONDS.
+        A new version leaves old cache entries unreachable; a worker-local
+        cache is also cleared to free their memory.
+        """
+        if self._signature is None or time.monotonic() < self._next_check:
+            return self._artifacts
+        
+        with self._reload_lock:
+            if time.monotonic() < self._next_check:
+                return self._artifacts
+            self._next_check = time.monotonic() + ARTIFACT_CHECK_INTERVAL_SECONDS
+            if artifact_signature() != self._signature:
+                try:
+                    self._load_artifacts()
+                    if self.cache is not None and not self.cache.shared:
+                        self.cache.clear()
+                    print(f"✓ Artifacts changed; now serving model version {self.model_version}")
+                except Exception as e:
+                    # Keep serving the loaded artifacts, e.g. while a retrain is still writing
+                    print(f"⚠ Warning: Could not reload changed artifacts: {e}")
+        return self._artifacts
+    
+    def cache_stats(self):
+        """
+        Get result cache statistics.
+        
+        Returns:
+            dict: Cache statistics and the served model version, or None
+                  without a cache
+        """
+        if self.cache is None:
+            return None
+        return dict(self.cache.stats(), model_version=self.model_version)
+    
     def preprocess_text(self, text):
         """
         Preprocess input text (same as training phase).
@@ -49,84 +168,240 @@ class PredictionService:
         Returns:
             str: Cleaned text
         """
-        cleaned = clean_text(
-            text,
-            lowercase=True,
-            remove_punctuation=True,
-            remove_html=True,
-            remove_stopwords=True
-        )
-        return cleaned
+        return self.cleaner.clean(text)
     
-    def predict(self, job_description, requirements="", benefits=""):
+    def preprocess_tokens(self, text):
         """
-        Predict if a job posting is fake or real.
+        Preprocess input text into the tokens the vectorizer consumes.
         
         Args:
-            job_description (str): Job description text
-            requirements (str): Job requirements text
-            benefits (str): Job benefits text
+            text (str): Raw job description text
         
         Returns:
-            dict: Prediction result with label and confidence
+            list: Cleaned tokens
         """
-        if self.model is None or self.vectorizer is None:
-            return {
-                'error': 'Model not loaded. Please ensure models are trained.'
-            }
+        return self.cleaner.clean_tokens(text)
+    
+    def _tokens(self, job_description, requirements="", benefits=""):
+        """
+        Merge and clean one posting's fields.
         
+        Returns:
+            tuple: (tokens, None), or (None, error result dict)
+        """
         # Merge text fields (same as training)
         combined_text = f"{job_description} {requirements} {benefits}".strip()
         
         if not combined_text:
-            return {
+            return None, {
                 'error': 'No text provided for prediction.'
             }
         
-        # Preprocess text
-        cleaned_text = self.preprocess_text(combined_text)
+        # Preprocess text (tokenized once, here)
+        tokens = self.preprocess_tokens(combined_text)
         
-        if not cleaned_text:
-            return {
+        if not tokens:
+            return None, {
                 'error': 'Text is empty after preprocessing.'
             }
+        return tokens, None
+    
+    @staticmethod
+    def _result(classes, probabilities):
+        """
+        Build the prediction result for one posting.
+        
+        Args:
+            classes (np.ndarray): Class labels, in probability order
+            probabilities: Probability of each class
         
-        # Convert to dataframe format (for consistency)
-        df = pd.DataFrame({'text_cleaned': [cleaned_text]})
+        Returns:
+            dict: Prediction result with label and confidence
+        """
+        # The predicted class is the most probable one, as sklearn's predict() picks it
+        prediction = classes[int(np.argmax(probabilities))]
         
-        # Extract features
-        try:
-            X = self.vectorizer.transform(df['text_cleaned'])
-        except Exception as e:
-            return {
-                'error': f'Error during feature extraction: {str(e)}'
+        # Get confidence score
+        confidence = float(max(probabilities)) * 100
+        
+        # Map prediction to label
+        label = "Fake" if prediction == 1 else "Real"
+        
+        return {
+            'prediction': int(prediction),
+            'label': label,
+            'confidence': round(confidence, 2),
+            'probabilities': {
+                'real': round(float(probabilities[0]) * 100, 2),
+                'fake': round(float(probabilities[1]) * 100, 2)
             }
+        }
+    
+    def predict(self, job_description, requirements="", benefits=""):
+        """
+        Predict if a job posting is fake or real.
         
-        # Make prediction
-        try:
-            prediction = self.model.predict(X)[0]
-            probabilities = self.model.predict_proba(X)[0]
-            
-            # Get confidence score
-            confidence = max(probabilities) * 100
-            
-            # Map prediction to label
-            label = "Fake" if prediction == 1 else "Real"
-            
+        Args:
+            job_description (str): Job description text
+            requirements (str): Job requirements text
+            benefits (str): Job benefits text
+        
+        Returns:
+            dict: Prediction result with label and confidence
+        """
+        model, vectorizer, version = self._current_artifacts()
+        if model is None or vectorizer is None:
             return {
-                'prediction': int(prediction),
-                'label': label,
-                'confidence': round(confidence, 2),
-                'probabilities': {
-                    'real': round(probabilities[0] * 100, 2),
-                    'fake': round(probabilities[1] * 100, 2)
-                }
+                'error': 'Model not loaded. Please ensure models are trained.'
             }
+        
+        tokens, error = self._tokens(job_description, requirements, benefits)
+        if error:
+            return error
+        
+        # Postings that clean to the same text share a cached result
+        key = None
+        if self.cache is not None:
+            key = result_key(tokens, version)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        # Extract features and score them once
+        try:
+            classes, probabilities = self._score(tokens, model, vectorizer)
         except Exception as e:
             return {
                 'error': f'Error during prediction: {str(e)}'
             }
+        
+        result = self._result(classes, probabilities)
+        if key is not None:
+            self.cache.put(key, result)
+        return result
+    
+    def predict_batch(self, postings):
+        """
+        Predict many job postings with one vectorize and one scoring call.
+        
+        Each posting is cleaned on its own; the postings that leave tokens
+        and are not cached are then vectorized into one matrix and scored
+        together. A posting gets the same result as from predict().
+        
+        Args:
+            postings (list): Dicts with 'job_description' and optional
+                             'requirements' and 'benefits'
+        
+        Returns:
+            list: One result per posting, in input order; failed postings
+                  get a dict with an 'error' key instead
+        """
+        model, vectorizer, version = self._current_artifacts()
+        if model is None or vectorizer is None:
+            return [{'error': 'Model not loaded. Please ensure models are trained.'}
+                    for _ in postings]
+        
+        results = [None] * len(postings)
+        documents, positions, keys = [], [], []
+        for position, posting in enumerate(postings):
+            tokens, error = self._tokens(posting.get('job_description', ''),
+                                         posting.get('requirements', ''),
+                                         posting.get('benefits', ''))
+            if error:
+                results[position] = error
+                continue
+            key = None
+            if self.cache is not None:
+                key = result_key(tokens, version)
+                results[position] = self.cache.get(key)
+            if results[position] is None:
+                documents.append(tokens)
+                positions.append(position)
+                keys.append(key)
+        
+        if documents:
+            try:
+                classes, probabilities = self._score_batch(documents, model, vectorizer)
+            except Exception as e:
+                error = {'error': f'Error during prediction: {str(e)}'}
+                for position in positions:
+                    results[position] = dict(error)
+                return results
+            for position, key, row in zip(positions, keys, probabilities):
+                results[position] = self._result(classes, row)
+                if key is not None:
+                    self.cache.put(key, results[position])
+        return results
+    
+    @staticmethod
+    def _documents(token_lists, vectorizer):
+        """Vectorizer input for cleaned token lists."""
+        # Vectorizers saved before TokenAnalyzer re-tokenize the joined text
+        if isinstance(vectorizer.analyzer, TokenAnalyzer):
+            return token_lists
+        return [' '.join(tokens) for tokens in token_lists]
+    
+    def _score(self, tokens, model, vectorizer):
+        """
+        Vectorize one cleaned document and compute its class probabilities.
+        
+        With the compact vectorizer and a linear model this is a single
+        pass over the tokens: count vocabulary terms, weight and normalize
+        them, and take the sigmoid of their dot product with the weights,
+        with no sparse matrix. Other artifacts go through transform() and
+        one predict_proba() call.
+        
+        Args:
+            tokens (list): Cleaned tokens
+            model: Model to score with
+            vectorizer: Vectorizer matching the model
+        
+        Returns:
+            tuple: (class labels, probability of each class)
+        """
+        if isinstance(vectorizer, CompactVectorizer) and isinstance(model, LinearScorer):
+            fake = model.score_row(*vectorizer.transform_row(tokens))
+            return model.classes_, (1.0 - fake, fake)
+        
+        classes, probabilities = self._score_batch([tokens], model, vectorizer)
+        return classes, probabilities[0]
+    
+    def _score_batch(self, token_lists, model, vectorizer):
+        """
+        Vectorize cleaned documents into one matrix and score it once.
+        
+        Args:
+            token_lists (list): Cleaned tokens of each document
+            model: Model to score with
+            vectorizer: Vectorizer matching the model
+        
+        Returns:
+            tuple: (class labels, array of shape (n_documents, n_classes))
+        """
+        X = vectorizer.transform(self._documents(token_lists, vectorizer))
+        return model.classes_, model.predict_proba(X)
+
+
+# Global instance, created on first access so importing this module does not
+# load the artifacts (app.py builds its own instance)
+_prediction_service = None
+
+
+def get_prediction_service():
+    """
+    Get the shared PredictionService, loading the artifacts on first use.
+    
+    Returns:
+        PredictionService: Shared service instance
+    """
+    global _prediction_service
+    if _prediction_service is None:
+        _prediction_service = PredictionService()
+    return _prediction_service
 
 
-# Global instance
-prediction_service = PredictionService()
+def __getattr__(name):
+    # Keeps `from prediction_service import prediction_service` working
+    if name == 'prediction_service':
+        return get_prediction_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,402 @@
+"""
+Prediction result cache.
+Stores prediction results keyed by a hash of the posting's cleaned text and
+the model version, so reposted and duplicated postings skip vectorizing and
+scoring. LocalResultCache keeps results in the worker's memory;
+SQLiteResultCache keeps them in a file that all workers on a host share.
+Both have the same interface, so either can stand in for the other.
+"""
+
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+from config.config import (
+    RESULT_CACHE_BACKEND,
+    RESULT_CACHE_PATH,
+    RESULT_CACHE_MAX_ENTRIES,
+    RESULT_CACHE_MAX_BYTES,
+    RESULT_CACHE_TTL_SECONDS,
+    RESULT_CACHE_TOUCH_INTERVAL_SECONDS
+)
+
+# Per-entry bookkeeping beyond the key and value strings (OrderedDict node, tuple)
+_ENTRY_OVERHEAD = 160
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    last_access REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_results_last_access ON results (last_access);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (name, value) VALUES ('total_bytes', 0);
+"""
+
+
+def result_key(tokens, model_version):
+    """
+    Build the cache key for one cleaned posting.
+    
+    Args:
+        tokens (list): Cleaned tokens of the posting
+        model_version (str): Version of the loaded model and vectorizer
+    
+    Returns:
+        str: Hex digest of the model version and cleaned text
+    """
+    h = hashlib.blake2b(model_version.encode('utf-8'), digest_size=16)
+    h.update(b'\0')
+    h.update(' '.join(tokens).encode('utf-8', 'surrogatepass'))
+    return h.hexdigest()
+
+
+class LocalResultCache:
+    """
+    In-memory LRU cache of prediction results with a TTL.
+    
+    Bounded both by entry count and by approximate memory: the size of an
+    entry is the size of its key and serialized result strings plus a fixed
+    overhead. Results are stored as JSON, so callers get their own copy.
+    Expired entries are dropped when looked up or evicted. Thread-safe.
+    """
+    
+    # Entries are only visible to this worker
+    shared = False
+    
+    def __init__(self, max_entries=None, max_bytes=None, ttl_seconds=None):
+        """
+        Args:
+            max_entries (int, optional): Most entries kept. Defaults to
+                                         config.RESULT_CACHE_MAX_ENTRIES
+            max_bytes (int, optional): Approximate memory bound. Defaults to
+                                       config.RESULT_CACHE_MAX_BYTES
+            ttl_seconds (float, optional): Lifetime of an entry. Defaults to
+                                           config.RESULT_CACHE_TTL_SECONDS
+        """
+        self.max_entries = max_entries or RESULT_CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or RESULT_CACHE_MAX_BYTES
+        self.ttl_seconds = ttl_seconds or RESULT_CACHE_TTL_SECONDS
+        
+        # key -> (serialized result, size, expiry time)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key):
+        """
+        Look up a result and mark it as recently used.
+        
+        Args:
+            key (str): Key from result_key()
+        
+        Returns:
+            dict: Cached result, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, size, expires = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return json.loads(value)
+    
+    def put(self, key, result):
+        """
+        Store a result, then evict least recently used entries over the bounds.
+        
+        Args:
+            key (str): Key from result_key()
+            result (dict): Prediction result
+        """
+        value = json.dumps(result, separators=(',', ':'))
+        size = sys.getsizeof(key) + sys.getsizeof(value) + _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size, time.monotonic() + self.ttl_seconds)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+    
+    def stats(self):
+        """
+        Get cache statistics.
+        
+        Returns:
+            dict: Size, bounds and hit/miss/eviction counts
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'backend': 'memory',
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
+    
+    def clear(self):
+        """Remove every entry; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+class SQLiteResultCache:
+    """
+    Prediction result cache shared by the worker processes on one host.
+    
+    Backed by an SQLite file in WAL mode, like the cleaned-text cache, so
+    workers read concurrently and writes are serialized with BEGIN
+    IMMEDIATE. Bounded by the total size of the stored results; each
+    thread gets its own connection. A hit only writes when its LRU
+    timestamp is older than touch_interval, so recency is approximate to
+    that interval and repeated hits are read-only. A lookup that fails
+    (e.g. the database stays locked past the timeout) counts as a miss
+    rather than failing the prediction.
+    """
+    
+    # Entries are visible to every worker using the same file
+    shared = True
+    
+    def __init__(self, path=None, max_bytes=None, ttl_seconds=None, timeout=1.0,
+                 touch_interval=None):
+        """
+        Open (and create if needed) the cache database.
+        
+        Args:
+            path (str, optional): Cache file. Defaults to config.RESULT_CACHE_PATH
+            max_bytes (int, optional): Size bound for stored results.
+                                       Defaults to config.RESULT_CACHE_MAX_BYTES
+            ttl_seconds (float, optional): Lifetime of an entry. Defaults to
+                                           config.RESULT_CACHE_TTL_SECONDS
+            timeout (float): Seconds to wait for another worker's lock
+            touch_interval (float, optional): Least age of an entry's LRU timestamp
+                                              before a hit refreshes it. Defaults
+                                              to config.RESULT_CACHE_TOUCH_INTERVAL_SECONDS
+        """
+        self.path = Path(path or RESULT_CACHE_PATH)
+        self.max_bytes = max_bytes or RESULT_CACHE_MAX_BYTES
+        self.ttl_seconds = ttl_seconds or RESULT_CACHE_TTL_SECONDS
+        self.touch_interval = (RESULT_CACHE_TOUCH_INTERVAL_SECONDS if touch_interval is None
+                               else touch_interval)
+        self.timeout = timeout
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+        
+        # Idempotent DDL, safe when several workers open the cache at once
+        self._conn().executescript(_SCHEMA)
+    
+    def _conn(self):
+        """This thread's connection, opened on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode; transactions are opened explicitly below
+            conn = sqlite3.connect(str(self.path), timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def _count(self, name, amount=1):
+        """Add to one of this instance's counters."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+    
+    def get(self, key):
+        """
+        Look up a result and mark it as recently used.
+        
+        The timestamp is only refreshed when it is older than touch_interval,
+        so most hits are a read without a write or commit.
+        
+        Args:
+            key (str): Key from result_key()
+        
+        Returns:
+            dict: Cached result, or None on a miss
+        """
+        now = time.time()
+        try:
+            conn = self._conn()
+            row = conn.execute("SELECT value, last_access FROM results "
+                               "WHERE key = ? AND expires > ?", (key, now)).fetchone()
+            if row is not None and now - row[1] >= self.touch_interval:
+                # The condition repeats the check so concurrent hits touch it once
+                conn.execute("UPDATE results SET last_access = ? "
+                             "WHERE key = ? AND last_access <= ?",
+                             (now, key, now - self.touch_interval))
+        except sqlite3.Error:
+            self._count('errors')
+            row = None
+        
+        if row is None:
+            self._count('misses')
+            return None
+        self._count('hits')
+        return json.loads(row[0])
+    
+    def put(self, key, result):
+        """
+        Store a result, then evict expired and least recently used entries over the bound.
+        
+        Args:
+            key (str): Key from result_key()
+            result (dict): Prediction result
+        """
+        value = json.dumps(result, separators=(',', ':'))
+        size = len(key) + len(value)
+        now = time.time()
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                old = conn.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, value, size, expires, last_access) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, value, size, now + self.ttl_seconds, now)
+                )
+                conn.execute("UPDATE meta SET value = value + ? WHERE name = 'total_bytes'",
+                             (size - (old[0] if old else 0),))
+                self._evict(conn, now)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            self._count('errors')
+    
+    def _evict(self, conn, now):
+        """Drop expired, then least recently used entries until under the bound (inside a transaction)."""
+        total = conn.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        expired = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results "
+                               "WHERE expires <= ?", (now,)).fetchone()
+        conn.execute("DELETE FROM results WHERE expires <= ?", (now,))
+        total -= expired[1]
+        evicted = expired[0]
+        
+        # Evict down to 90% of the bound so eviction is not triggered on every write
+        target = int(self.max_bytes * 0.9)
+        while total > target:
+            rows = conn.execute("SELECT key, size FROM results ORDER BY last_access LIMIT 500"
+                                ).fetchall()
+            if not rows:
+                break
+            batch = []
+            for key, size in rows:
+                batch.append(key)
+                total -= size
+                if total <= target:
+                    break
+            placeholders = ','.join('?' * len(batch))
+            conn.execute(f"DELETE FROM results WHERE key IN ({placeholders})", batch)
+            evicted += len(batch)
+        conn.execute("UPDATE meta SET value = ? WHERE name = 'total_bytes'", (max(total, 0),))
+        self._count('evictions', evicted)
+    
+    def stats(self):
+        """
+        Get cache statistics.
+        
+        Returns:
+            dict: Shared size and bound, and this worker's hit/miss/eviction counts
+        """
+        conn = self._conn()
+        lookups = self.hits + self.misses
+        return {
+            'backend': 'sqlite',
+            'path': str(self.path),
+            'entries': conn.execute("SELECT COUNT(*) FROM results").fetchone()[0],
+            'bytes': conn.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()[0],
+            'max_bytes': self.max_bytes,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'evictions': self.evictions,
+            'errors': self.errors,
+        }
+    
+    def clear(self):
+        """Remove every entry; the counters are kept."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM results")
+            conn.execute("UPDATE meta SET value = 0 WHERE name = 'total_bytes'")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def create_result_cache(backend=None):
+    """
+    Create the result cache configured for the web app.
+    
+    Args:
+        backend (str, optional): "memory", "sqlite" or "none".
+                                 Defaults to config.RESULT_CACHE_BACKEND
+    
+    Returns:
+        LocalResultCache or SQLiteResultCache: The cache, or None for "none"
+    
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backend = (backend or RESULT_CACHE_BACKEND).lower()
+    if backend == 'memory':
+        return LocalResultCache()
+    if backend == 'sqlite':
+        return SQLiteResultCache()
+    if backend == 'none':
+        return None
+    raise ValueError(f"Unknown result cache backend: {backend!r}")
@@ -2,11 +2,15 @@
 Admin panel routes and views.
 """
 
-from flask import Blueprint, render_template, request, jsonify, session, redirect, url_for
+from flask import (
+    Blueprint, Response, render_template, request, jsonify, session, redirect, url_for,
+    stream_with_context
+)
 from werkzeug.security import check_password_hash
 import csv
 import io
-from datetime import datetime
+import zlib
+from datetime import datetime, timedelta, timezone
 import sys
 from pathlib import Path
 
@@ -14,13 +18,15 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from module4_dashboard.database import (
-    db, PredictionLog, AdminUser, 
+    db, AdminUser, 
     get_prediction_stats, log_prediction
 )
 from module4_dashboard.dashboard import (
     get_daily_predictions, 
     get_recent_predictions,
-    get_prediction_trends
+    get_prediction_trends,
+    get_predictions_page,
+    iter_prediction_logs
 )
 from module4_dashboard.auth import authenticate, admin_required_web
 
@@ -81,58 +87,143 @@ def api_stats():
 @admin_bp.route('/api/predictions')
 @admin_required_web
 def api_predictions():
-    """API endpoint for recent predictions."""
-    limit = request.args.get('limit', 10, type=int)
-    predictions = get_recent_predictions(limit=limit)
-    return jsonify(predictions)
+    """
+    API endpoint for browsing predictions, newest first, a page at a time.
+    
+    Query parameters:
+        limit: Page size, at most config.PREDICTIONS_MAX_PAGE_SIZE
+        cursor: next_cursor of the previous page
+        label: fake or real
+        min_confidence, max_confidence: Confidence range (0-100), inclusive
+    """
+    limit = request.args.get('limit', type=int)
+    min_confidence = request.args.get('min_confidence', type=float)
+    max_confidence = request.args.get('max_confidence', type=float)
+    label = request.args.get('label', '').lower()
+    
+    if limit is not None and limit < 1:
+        return jsonify({'error': 'limit must be a positive integer'}), 400
+    if label not in ('', 'fake', 'real'):
+        return jsonify({'error': 'label must be fake or real'}), 400
+    if (min_confidence is not None and max_confidence is not None
+            and min_confidence > max_confidence):
+        return jsonify({'error': 'min_confidence must not exceed max_confidence'}), 400
+    
+    try:
+        page = get_predictions_page(
+            limit=limit,
+            cursor=request.args.get('cursor'),
+            label={'fake': 1, 'real': 0}.get(label),
+            min_confidence=min_confidence,
+            max_confidence=max_confidence
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(page)
 
 
 @admin_bp.route('/api/trends')
 @admin_required_web
 def api_trends():
-    """API endpoint for prediction trends."""
-    trends = get_prediction_trends()
+    """API endpoint for prediction trends; ?days= sets the window."""
+    days = request.args.get('days', type=int)
+    if days is not None and days < 1:
+        return jsonify({'error': 'days must be a positive integer'}), 400
+    trends = get_prediction_trends(days=days)
     return jsonify(trends)
 
 
+def _parse_time(value, end=False):
+    """
+    Parse an ISO date or date-time query parameter as naive UTC.
+    
+    Args:
+        value (str): YYYY-MM-DD or YYYY-MM-DDTHH:MM[:SS], optionally with an offset
+        end (bool): A bare date as an upper bound includes that whole day
+    
+    Returns:
+        datetime: Parsed time, or None if value is empty
+    
+    Raises:
+        ValueError: If the value is not an ISO date or date-time
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid date {value!r}; use YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    if end and len(value) == 10:
+        parsed += timedelta(days=1)
+    return parsed
+
+
 @admin_bp.route('/export/csv')
 @admin_required_web
 def export_csv():
-    """Export predictions to CSV."""
+    """
+    Export predictions to CSV, streamed in batches.
+    
+    Query parameters:
+        start: Earliest date or date-time (UTC) to export
+        end: Latest date (inclusive) or date-time (exclusive) to export
+        gzip: 1 to download gzip-compressed CSV
+    """
     try:
-        predictions = PredictionLog.query.order_by(PredictionLog.timestamp.desc()).all()
-        
+        start = _parse_time(request.args.get('start'))
+        end = _parse_time(request.args.get('end'), end=True)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    compress = request.args.get('gzip', '').lower() in ('1', 'true', 'yes')
+    
+    def generate():
         output = io.StringIO()
         writer = csv.writer(output)
+        # wbits=31 writes a gzip header and trailer
+        compressor = zlib.compressobj(wbits=31) if compress else None
+        
+        def take():
+            data = output.getvalue().encode('utf-8')
+            output.seek(0)
+            output.truncate()
+            return compressor.compress(data) if compressor else data
         
         # Write header
         writer.writerow([
             'ID', 'Prediction', 'Confidence', 'Real Probability', 
             'Fake Probability', 'Timestamp', 'IP Address'
         ])
+        chunk = take()
+        if chunk:
+            yield chunk
         
-        # Write data
-        for pred in predictions:
-            writer.writerow([
-                pred.id,
-                'Fake' if pred.prediction == 1 else 'Real',
-                pred.confidence,
-                pred.probability_real,
-                pred.probability_fake,
-                pred.timestamp.isoformat(),
-                pred.ip_address or ''
-            ])
-        
-        output.seek(0)
+        # Write data, one chunk per batch
+        for batch in iter_prediction_logs(start, end):
+            for pred in batch:
+                writer.writerow([
+                    pred.id,
+                    'Fake' if pred.prediction == 1 else 'Real',
+                    pred.confidence,
+                    pred.probability_real,
+                    pred.probability_fake,
+                    pred.timestamp.isoformat(),
+                    pred.ip_address or ''
+                ])
+            chunk = take()
+            if chunk:
+                yield chunk
         
-        from flask import Response
-        return Response(
-            output.getvalue(),
-            mimetype='text/csv',
-            headers={'Content-Disposition': 'attachment; filename=predictions.csv'}
-        )
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        if compressor:
+            yield compressor.flush()
+    
+    filename = 'predictions.csv.gz' if compress else 'predictions.csv'
+    return Response(
+        stream_with_context(generate()),
+        mimetype='application/gzip' if compress else 'text/csv',
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
 
 
 @admin_bp.route('/retrain', methods=['POST'])
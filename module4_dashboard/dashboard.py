@@ -2,52 +2,59 @@
 Dashboard analytics and visualization module.
 """
 
+import base64
 from datetime import datetime, timedelta
-from sqlalchemy import func
 import sys
 from pathlib import Path
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from module4_dashboard.database import PredictionLog, db
+from module4_dashboard.database import PredictionLog, PredictionDaily, db
+from config.config import (
+    DASHBOARD_TREND_DAYS,
+    DASHBOARD_TREND_MAX_DAYS,
+    EXPORT_BATCH_SIZE,
+    PREDICTIONS_PAGE_SIZE,
+    PREDICTIONS_MAX_PAGE_SIZE
+)
 
 
-def get_daily_predictions(days=30):
+def get_daily_predictions(days=None):
     """
     Get daily prediction counts for the last N days.
     
+    Reads the prediction_daily rollup, one row per day, so the cost
+    depends on the window length and not on how many predictions it holds.
+    
     Args:
-        days: Number of days to retrieve
+        days: Number of days to retrieve. Defaults to config.DASHBOARD_TREND_DAYS,
+              capped at config.DASHBOARD_TREND_MAX_DAYS
     
     Returns:
         list: List of dictionaries with date and counts
     """
     try:
-        start_date = datetime.utcnow() - timedelta(days=days)
+        days = min(days or DASHBOARD_TREND_DAYS, DASHBOARD_TREND_MAX_DAYS)
+        start_date = (datetime.utcnow() - timedelta(days=days)).date()
         
         # Query daily predictions
-        daily_stats = db.session.query(
-            func.date(PredictionLog.timestamp).label('date'),
-            func.count(PredictionLog.id).label('total'),
-            func.sum(func.cast(PredictionLog.prediction == 0, db.Integer)).label('real'),
-            func.sum(func.cast(PredictionLog.prediction == 1, db.Integer)).label('fake')
-        ).filter(
-            PredictionLog.timestamp >= start_date
-        ).group_by(
-            func.date(PredictionLog.timestamp)
+        daily_stats = PredictionDaily.query.filter(
+            PredictionDaily.day >= start_date
         ).order_by(
-            func.date(PredictionLog.timestamp)
+            PredictionDaily.day
         ).all()
         
         # Format results
         result = []
         for stat in daily_stats:
             result.append({
-                'date': stat.date.isoformat() if isinstance(stat.date, datetime) else str(stat.date),
-                'total': stat.total,
-                'real': stat.real or 0,
-                'fake': stat.fake or 0
+                'date': stat.day.isoformat(),
+                'total': stat.total_count,
+                'real': stat.real_count,
+                'fake': stat.fake_count,
+                'avg_confidence': round(stat.confidence_sum / stat.total_count, 2)
+                                  if stat.total_count else 0
             })
         
         return result
@@ -77,14 +84,17 @@ def get_recent_predictions(limit=10):
         return []
 
 
-def get_prediction_trends():
+def get_prediction_trends(days=None):
     """
     Get prediction trends for visualization.
     
+    Args:
+        days: Number of days to chart. Defaults to config.DASHBOARD_TREND_DAYS
+    
     Returns:
         dict: Dictionary with chart data
     """
-    stats = get_daily_predictions(days=30)
+    stats = get_daily_predictions(days=days)
     
     dates = [item['date'] for item in stats]
     real_counts = [item['real'] for item in stats]
@@ -97,3 +107,149 @@ def get_prediction_trends():
         'fake': fake_counts,
         'total': total_counts
     }
+
+
+def _newest_first(query, cursor=None):
+    """
+    Order a prediction log query newest first, continuing below a cursor.
+    
+    The (timestamp, id) order is total, so a page never repeats or skips
+    rows with equal timestamps, and each page is a range scan on the
+    (timestamp, id) index whatever its depth.
+    
+    Args:
+        query: Query over PredictionLog columns
+        cursor (tuple, optional): (timestamp, id) of the last row already seen
+    
+    Returns:
+        Query: Ordered query
+    """
+    if cursor is not None:
+        query = query.filter(db.tuple_(PredictionLog.timestamp, PredictionLog.id) < cursor)
+    return query.order_by(PredictionLog.timestamp.desc(), PredictionLog.id.desc())
+
+
+def encode_cursor(timestamp, log_id):
+    """
+    Encode a (timestamp, id) position as an opaque page cursor.
+    
+    Args:
+        timestamp (datetime): Timestamp of the last row of a page
+        log_id (int): ID of the last row of a page
+    
+    Returns:
+        str: URL-safe cursor
+    """
+    raw = f"{timestamp.isoformat()},{log_id}".encode('ascii')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Decode a page cursor made by encode_cursor().
+    
+    Args:
+        cursor (str): Cursor from a previous page
+    
+    Returns:
+        tuple: (timestamp, id)
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('ascii')
+        timestamp, log_id = raw.rsplit(',', 1)
+        return datetime.fromisoformat(timestamp), int(log_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+
+
+def get_predictions_page(limit=None, cursor=None, label=None, min_confidence=None,
+                         max_confidence=None):
+    """
+    Get one page of predictions, newest first, with keyset pagination.
+    
+    Args:
+        limit (int, optional): Page size, capped at config.PREDICTIONS_MAX_PAGE_SIZE.
+                               Defaults to config.PREDICTIONS_PAGE_SIZE
+        cursor (str, optional): next_cursor of the previous page
+        label (int, optional): 1 for fake, 0 for real predictions only
+        min_confidence (float, optional): Lowest confidence included
+        max_confidence (float, optional): Highest confidence included
+    
+    Returns:
+        dict: 'predictions' (list of prediction dictionaries), 'next_cursor'
+              (None on the last page) and the 'limit' applied
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    limit = min(limit or PREDICTIONS_PAGE_SIZE, PREDICTIONS_MAX_PAGE_SIZE)
+    position = decode_cursor(cursor) if cursor else None
+    
+    query = PredictionLog.query
+    if label is not None:
+        query = query.filter(PredictionLog.prediction == label)
+    if min_confidence is not None:
+        query = query.filter(PredictionLog.confidence >= min_confidence)
+    if max_confidence is not None:
+        query = query.filter(PredictionLog.confidence <= max_confidence)
+    
+    # One row past the page tells whether there is a next page
+    predictions = _newest_first(query, position).limit(limit + 1).all()
+    next_cursor = None
+    if len(predictions) > limit:
+        predictions = predictions[:limit]
+        next_cursor = encode_cursor(predictions[-1].timestamp, predictions[-1].id)
+    
+    return {
+        'predictions': [pred.to_dict() for pred in predictions],
+        'next_cursor': next_cursor,
+        'limit': limit
+    }
+
+
+def iter_prediction_logs(start=None, end=None, batch_size=None):
+    """
+    Iterate over prediction logs, newest first, in keyset-paginated batches.
+    
+    Each batch is one query that continues below the last (timestamp, id)
+    seen, so memory use does not grow with the table and no batch rescans
+    the rows before it. The read transaction is ended between batches, so
+    a long export does not hold a database snapshot open.
+    
+    Args:
+        start (datetime, optional): Earliest timestamp included
+        end (datetime, optional): Timestamp before which logs are included
+        batch_size (int, optional): Rows per batch. Defaults to config.EXPORT_BATCH_SIZE
+    
+    Yields:
+        list: Rows with id, prediction, confidence, probability_real,
+              probability_fake, timestamp and ip_address
+    """
+    batch_size = batch_size or EXPORT_BATCH_SIZE
+    cursor = None
+    while True:
+        query = db.session.query(
+            PredictionLog.id,
+            PredictionLog.prediction,
+            PredictionLog.confidence,
+            PredictionLog.probability_real,
+            PredictionLog.probability_fake,
+            PredictionLog.timestamp,
+            PredictionLog.ip_address
+        )
+        if start is not None:
+            query = query.filter(PredictionLog.timestamp >= start)
+        if end is not None:
+            query = query.filter(PredictionLog.timestamp < end)
+        
+        batch = _newest_first(query, cursor).limit(batch_size).all()
+        db.session.rollback()
+        
+        if batch:
+            yield batch
+        if len(batch) < batch_size:
+            return
+        cursor = (batch[-1].timestamp, batch[-1].id)
@@ -3,6 +3,8 @@ Database models and setup for prediction logging and admin features.
 """
 
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import MetaData, Table, event, inspect
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime
 import sys
 from pathlib import Path
@@ -10,16 +12,36 @@ from pathlib import Path
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from config.config import DATABASE_URI
+from config.config import (
+    DATABASE_URI,
+    SQLITE_JOURNAL_MODE,
+    SQLITE_SYNCHRONOUS,
+    SQLITE_BUSY_TIMEOUT_MS,
+    DATABASE_POOL_SIZE,
+    DATABASE_MAX_OVERFLOW,
+    DATABASE_POOL_TIMEOUT,
+    DATABASE_POOL_RECYCLE
+)
 
 db = SQLAlchemy()
 
+# Indexes replaced by wider ones, dropped from existing databases by migrate_db()
+SUPERSEDED_INDEXES = {
+    'prediction_logs': ['ix_prediction_logs_timestamp', 'ix_prediction_logs_prediction_timestamp'],
+}
+
 
 class PredictionLog(db.Model):
     """
     Model for storing prediction logs.
     """
     __tablename__ = 'prediction_logs'
+    __table_args__ = (
+        # Time ranges, and recent-first listings paged by (timestamp, id)
+        db.Index('ix_prediction_logs_timestamp_id', 'timestamp', 'id'),
+        # The same, filtered by label
+        db.Index('ix_prediction_logs_prediction_timestamp_id', 'prediction', 'timestamp', 'id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     job_description = db.Column(db.Text, nullable=False)
@@ -44,6 +66,62 @@ class PredictionLog(db.Model):
         }
 
 
+class PredictionStats(db.Model):
+    """
+    Running prediction counts, a single row kept in step with prediction_logs.
+    
+    Updated in the same transaction as every logged prediction, so reading
+    the stats does not scan the logs; rebuild_prediction_stats() recounts.
+    """
+    __tablename__ = 'prediction_stats'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    total_count = db.Column(db.Integer, nullable=False, default=0)
+    fake_count = db.Column(db.Integer, nullable=False, default=0)
+    real_count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+
+class PredictionDaily(db.Model):
+    """
+    Per-day rollup of prediction_logs (UTC days), kept in step like PredictionStats.
+    
+    The dashboard's trend charts read these rows instead of grouping the
+    raw logs; rebuild_daily_rollup() backfills them from the logs.
+    """
+    __tablename__ = 'prediction_daily'
+    
+    day = db.Column(db.Date, primary_key=True)
+    total_count = db.Column(db.Integer, nullable=False, default=0)
+    real_count = db.Column(db.Integer, nullable=False, default=0)
+    fake_count = db.Column(db.Integer, nullable=False, default=0)
+    confidence_sum = db.Column(db.Float, nullable=False, default=0.0)
+
+
+# Built once: Core statements skip the ORM's per-call expression building
+_stats_table = PredictionStats.__table__
+_ADD_TO_STATS = _stats_table.update().where(_stats_table.c.id == 1).values(
+    total_count=_stats_table.c.total_count + db.bindparam('add_total'),
+    fake_count=_stats_table.c.fake_count + db.bindparam('add_fake'),
+    real_count=_stats_table.c.real_count + db.bindparam('add_real'),
+    updated_at=db.bindparam('now')
+)
+_daily_table = PredictionDaily.__table__
+_ADD_TO_DAY = _daily_table.update().where(_daily_table.c.day == db.bindparam('rollup_day')).values(
+    total_count=_daily_table.c.total_count + db.bindparam('add_total'),
+    fake_count=_daily_table.c.fake_count + db.bindparam('add_fake'),
+    real_count=_daily_table.c.real_count + db.bindparam('add_real'),
+    confidence_sum=_daily_table.c.confidence_sum + db.bindparam('add_confidence')
+)
+_INSERT_DAY = _daily_table.insert().values(
+    day=db.bindparam('rollup_day'),
+    total_count=db.bindparam('add_total'),
+    fake_count=db.bindparam('add_fake'),
+    real_count=db.bindparam('add_real'),
+    confidence_sum=db.bindparam('add_confidence')
+)
+
+
 class AdminUser(db.Model):
     """
     Model for admin users.
@@ -66,6 +144,58 @@ class AdminUser(db.Model):
         }
 
 
+def engine_options(uri):
+    """
+    SQLAlchemy engine options for a database URI.
+    
+    Args:
+        uri (str): Database URI
+    
+    Returns:
+        dict: Pool settings; in-memory SQLite keeps SQLAlchemy's default pool
+    """
+    if uri in ('sqlite://', 'sqlite:///:memory:'):
+        return {}
+    return {
+        'pool_size': DATABASE_POOL_SIZE,
+        'max_overflow': DATABASE_MAX_OVERFLOW,
+        'pool_timeout': DATABASE_POOL_TIMEOUT,
+        'pool_recycle': DATABASE_POOL_RECYCLE,
+        # Replace connections the database closed, e.g. after a server restart
+        'pool_pre_ping': not uri.startswith('sqlite'),
+    }
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply the configured pragmas to a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA busy_timeout = {int(SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.execute(f"PRAGMA journal_mode = {SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous = {SQLITE_SYNCHRONOUS}")
+    cursor.close()
+
+
+def migrate_db():
+    """
+    Bring an existing database up to the current schema (inside an app context).
+    
+    create_all() only creates missing tables, so indexes added to existing
+    tables are created here, and the SUPERSEDED_INDEXES they replace dropped.
+    """
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+    
+    for table_name, index_names in SUPERSEDED_INDEXES.items():
+        existing = {index['name'] for index in inspect(db.engine).get_indexes(table_name)}
+        if existing.isdisjoint(index_names):
+            continue
+        reflected = Table(table_name, MetaData(), autoload_with=db.engine)
+        for index in reflected.indexes:
+            if index.name in index_names:
+                index.drop(bind=db.engine)
+
+
 def init_db(app):
     """
     Initialize database with Flask app.
@@ -75,11 +205,29 @@ def init_db(app):
     """
     app.config['SQLALCHEMY_DATABASE_URI'] = DATABASE_URI
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(DATABASE_URI)
     
     db.init_app(app)
     
     with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            event.listen(db.engine, 'connect', _set_sqlite_pragmas)
         db.create_all()
+        migrate_db()
+        # Count the existing logs once, when the stats table is new
+        if db.session.get(PredictionStats, 1) is None:
+            try:
+                rebuild_prediction_stats()
+            except IntegrityError:
+                # Another worker created the row first
+                db.session.rollback()
+        # Backfill the daily rollup once, when it is new and there are logs
+        if (db.session.query(PredictionDaily.day).first() is None
+                and db.session.query(PredictionLog.id).first() is not None):
+            try:
+                rebuild_daily_rollup()
+            except IntegrityError:
+                db.session.rollback()
         print("✓ Database initialized")
         
         # Create default admin user if it doesn't exist
@@ -97,6 +245,20 @@ def init_db(app):
             print(f"✓ Default admin user created: {ADMIN_USERNAME}")
 
 
+def _log_fields(job_description, requirements, benefits, prediction_result, ip_address=None):
+    """Column values of a prediction log row."""
+    return {
+        'job_description': job_description[:1000],  # Limit length
+        'requirements': requirements[:500] if requirements else None,
+        'benefits': benefits[:500] if benefits else None,
+        'prediction': prediction_result['prediction'],
+        'confidence': prediction_result['confidence'],
+        'probability_real': prediction_result['probabilities']['real'],
+        'probability_fake': prediction_result['probabilities']['fake'],
+        'ip_address': ip_address
+    }
+
+
 def log_prediction(job_description, requirements, benefits, prediction_result, ip_address=None):
     """
     Log a prediction to the database.
@@ -109,17 +271,12 @@ def log_prediction(job_description, requirements, benefits, prediction_result, i
         ip_address: IP address of the requester
     """
     try:
-        log = PredictionLog(
-            job_description=job_description[:1000],  # Limit length
-            requirements=requirements[:500] if requirements else None,
-            benefits=benefits[:500] if benefits else None,
-            prediction=prediction_result['prediction'],
-            confidence=prediction_result['confidence'],
-            probability_real=prediction_result['probabilities']['real'],
-            probability_fake=prediction_result['probabilities']['fake'],
-            ip_address=ip_address
-        )
+        fields = _log_fields(job_description, requirements, benefits, prediction_result,
+                             ip_address)
+        fields['timestamp'] = datetime.utcnow()
+        log = PredictionLog(**fields)
         db.session.add(log)
+        _update_aggregates([fields])
         db.session.commit()
         return log
     except Exception as e:
@@ -128,6 +285,183 @@ def log_prediction(job_description, requirements, benefits, prediction_result, i
         return None
 
 
+def prediction_log_rows(entries, ip_address=None, timestamp=None):
+    """
+    Build prediction log rows for insert_prediction_logs().
+    
+    Args:
+        entries (list): (posting dict, prediction result) pairs; the posting
+                        has 'job_description' and optional 'requirements'
+                        and 'benefits'
+        ip_address: IP address of the requester
+        timestamp (datetime, optional): Time of the predictions. Defaults to now
+    
+    Returns:
+        list: Column values of each row
+    """
+    timestamp = timestamp or datetime.utcnow()
+    rows = []
+    for posting, result in entries:
+        row = _log_fields(posting.get('job_description', ''), posting.get('requirements'),
+                          posting.get('benefits'), result, ip_address)
+        row['timestamp'] = timestamp
+        rows.append(row)
+    return rows
+
+
+def insert_prediction_logs(rows):
+    """
+    Write prediction log rows in one bulk insert and one commit.
+    
+    Args:
+        rows (list): Rows from prediction_log_rows()
+    
+    Raises:
+        Exception: If the write fails; the session is rolled back first
+    """
+    try:
+        db.session.execute(db.insert(PredictionLog), rows)
+        _update_aggregates(rows)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def _update_aggregates(rows):
+    """
+    Add newly logged predictions to the running counts and daily rollup
+    (inside the log's transaction).
+    
+    Args:
+        rows (list): Column values of each new log row
+    """
+    days = {}
+    for row in rows:
+        totals = days.setdefault(row['timestamp'].date(), [0, 0, 0.0])
+        totals[0] += 1
+        totals[1] += row['prediction'] == 1
+        totals[2] += row['confidence']
+    
+    fake = sum(fake for _, fake, _ in days.values())
+    db.session.execute(_ADD_TO_STATS, {
+        'add_total': len(rows),
+        'add_fake': fake,
+        'add_real': len(rows) - fake,
+        'now': datetime.utcnow()
+    })
+    
+    for day, (total, fake, confidence) in days.items():
+        params = {
+            'rollup_day': day,
+            'add_total': total,
+            'add_fake': fake,
+            'add_real': total - fake,
+            'add_confidence': confidence
+        }
+        # The UPDATE takes SQLite's write lock, so no other writer can insert the day in between
+        if db.session.execute(_ADD_TO_DAY, params).rowcount == 0:
+            db.session.execute(_INSERT_DAY, params)
+
+
+def rebuild_prediction_stats():
+    """
+    Recount prediction_stats from prediction_logs (inside an app context).
+    
+    Repairs drift, e.g. after logs were deleted or written by another tool.
+    The counts are taken inside the statement that writes them, which holds
+    the write lock, so predictions logged concurrently are neither lost nor
+    counted twice.
+    
+    Returns:
+        dict: The recounted totals
+    """
+    total = db.select(db.func.count(PredictionLog.id)).scalar_subquery()
+    fake = db.select(db.func.count(PredictionLog.id)).where(
+        PredictionLog.prediction == 1
+    ).scalar_subquery()
+    now = datetime.utcnow()
+    
+    recount = _stats_table.update().where(_stats_table.c.id == 1).values(
+        total_count=total,
+        fake_count=fake,
+        real_count=total - fake,
+        updated_at=now
+    )
+    if db.session.execute(recount).rowcount == 0:
+        db.session.execute(_stats_table.insert().from_select(
+            ['id', 'total_count', 'fake_count', 'real_count', 'updated_at'],
+            db.select(db.literal(1), total, fake, total - fake, db.literal(now, db.DateTime))
+        ))
+    
+    total, fake = db.session.execute(
+        db.select(_stats_table.c.total_count, _stats_table.c.fake_count)
+        .where(_stats_table.c.id == 1)
+    ).one()
+    db.session.commit()
+    return {'total': total, 'fake': fake, 'real': total - fake}
+
+
+def rebuild_daily_rollup(since=None):
+    """
+    Recompute prediction_daily from prediction_logs (inside an app context).
+    
+    Backfills history logged before the rollup existed and repairs drift.
+    The DELETE takes the write lock and the rows are re-inserted with
+    INSERT ... SELECT in the same transaction, so increments from predictions
+    logged concurrently are neither erased nor counted twice.
+    
+    Args:
+        since (date, optional): First day to recompute. Defaults to all history
+    
+    Returns:
+        int: Number of days written
+    """
+    day = db.func.date(PredictionLog.timestamp)
+    total = db.func.count(PredictionLog.id)
+    fake = db.func.coalesce(db.func.sum(db.case((PredictionLog.prediction == 1, 1), else_=0)), 0)
+    query = db.select(
+        day, total, fake, total - fake, db.func.sum(PredictionLog.confidence)
+    ).group_by(day)
+    
+    delete = db.delete(PredictionDaily)
+    if since is not None:
+        query = query.where(PredictionLog.timestamp >= datetime.combine(since, datetime.min.time()))
+        delete = delete.where(PredictionDaily.day >= since)
+    
+    db.session.execute(delete)
+    written = db.session.execute(_daily_table.insert().from_select(
+        ['day', 'total_count', 'fake_count', 'real_count', 'confidence_sum'], query
+    )).rowcount
+    db.session.commit()
+    return written
+
+
+def log_predictions(entries, ip_address=None):
+    """
+    Log many predictions in one bulk insert and one commit.
+    
+    Args:
+        entries (list): (posting dict, prediction result) pairs; the posting
+                        has 'job_description' and optional 'requirements'
+                        and 'benefits'
+        ip_address: IP address of the requester
+    
+    Returns:
+        int: Number of rows written (0 on error)
+    """
+    if not entries:
+        return 0
+    
+    rows = prediction_log_rows(entries, ip_address)
+    try:
+        insert_prediction_logs(rows)
+        return len(rows)
+    except Exception as e:
+        print(f"Error logging predictions: {e}")
+        return 0
+
+
 def get_prediction_stats():
     """
     Get statistics about predictions.
@@ -136,9 +470,11 @@ def get_prediction_stats():
         dict: Statistics dictionary
     """
     try:
-        total = PredictionLog.query.count()
-        fake_count = PredictionLog.query.filter_by(prediction=1).count()
-        real_count = PredictionLog.query.filter_by(prediction=0).count()
+        # One row kept up to date by every log write, instead of counting the logs
+        stats = db.session.get(PredictionStats, 1)
+        total = stats.total_count if stats else 0
+        fake_count = stats.fake_count if stats else 0
+        real_count = stats.real_count if stats else 0
         
         return {
             'total_predictions': total,
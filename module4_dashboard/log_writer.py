@@ -0,0 +1,272 @@
+"""
+Write-behind prediction logging.
+Request threads queue prediction log rows and return at once; one
+background thread inserts them with insert_prediction_logs(), one bulk
+insert and one commit per batch, instead of one commit per request.
+
+Durability: a row is in the database once its batch commits, at most
+flush_interval_ms after it was queued when the database keeps up. Rows
+still queued are written on a clean shutdown (close(), also registered
+with atexit) but lost if the process is killed. A batch whose insert fails
+is retried once and then dropped, and counted as failed.
+
+Overflow: the queue holds at most queue_size rows. With the "drop" policy
+rows that do not fit are discarded and counted as dropped, so a slow
+database never delays predictions; with "block" the request waits for room.
+"""
+
+import atexit
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from config.config import (
+    PREDICTION_LOG_QUEUE_SIZE,
+    PREDICTION_LOG_BATCH_SIZE,
+    PREDICTION_LOG_FLUSH_INTERVAL_MS,
+    PREDICTION_LOG_OVERFLOW
+)
+from module4_dashboard.database import prediction_log_rows, insert_prediction_logs
+
+# Queue marker that makes the worker flush and exit
+_STOP = object()
+
+# Pause before retrying a failed batch, e.g. while another writer holds the lock
+_RETRY_DELAY = 0.5
+
+
+class PredictionLogWriter:
+    """
+    Background writer for prediction logs with a bounded queue.
+    """
+    
+    def __init__(self, app, queue_size=None, batch_size=None, flush_interval_ms=None,
+                 overflow=None):
+        """
+        Args:
+            app: Flask application whose database the rows are written to
+            queue_size (int, optional): Most rows waiting to be written.
+                                        Defaults to config.PREDICTION_LOG_QUEUE_SIZE
+            batch_size (int, optional): Write once this many rows are queued.
+                                        Defaults to config.PREDICTION_LOG_BATCH_SIZE
+            flush_interval_ms (float, optional): Write this long after the first
+                                                 row of a batch was queued. Defaults
+                                                 to config.PREDICTION_LOG_FLUSH_INTERVAL_MS
+            overflow (str, optional): "drop" or "block" when the queue is full.
+                                      Defaults to config.PREDICTION_LOG_OVERFLOW
+        
+        Raises:
+            ValueError: If the overflow policy is unknown
+        """
+        self.app = app
+        self.queue_size = queue_size or PREDICTION_LOG_QUEUE_SIZE
+        self.batch_size = batch_size or PREDICTION_LOG_BATCH_SIZE
+        self.flush_interval = (PREDICTION_LOG_FLUSH_INTERVAL_MS if flush_interval_ms is None
+                               else flush_interval_ms) / 1000
+        self.overflow = overflow or PREDICTION_LOG_OVERFLOW
+        if self.overflow not in ('drop', 'block'):
+            raise ValueError(f"Unknown overflow policy: {self.overflow!r}")
+        
+        # Items are (time queued, row)
+        self._queue = queue.Queue(maxsize=self.queue_size)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._closed = False
+        # Callers inside log_many(); the put itself runs outside the lock, as
+        # the "block" policy waits there for the worker, which takes the lock
+        self._putting = 0
+        self._pending = 0
+        self._queued = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+        
+        self._thread = threading.Thread(target=self._run, name='prediction-log-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def log(self, job_description, requirements, benefits, prediction_result, ip_address=None):
+        """
+        Queue one prediction log row; same arguments as database.log_prediction().
+        
+        Returns:
+            bool: True if the row was queued, False if it was dropped
+        """
+        posting = {'job_description': job_description, 'requirements': requirements,
+                   'benefits': benefits}
+        return self.log_many([(posting, prediction_result)], ip_address) == 1
+    
+    def log_many(self, entries, ip_address=None):
+        """
+        Queue many prediction log rows; same arguments as database.log_predictions().
+        
+        Returns:
+            int: Number of rows queued; the rest were dropped
+        """
+        rows = prediction_log_rows(entries, ip_address)
+        now = time.monotonic()
+        queued = 0
+        # Checked and counted in flight under the lock, so close() queues its
+        # stop marker only after these rows; rows logged after close() are dropped
+        with self._lock:
+            if self._closed:
+                self._dropped += len(rows)
+                return 0
+            self._putting += 1
+        
+        try:
+            for row in rows:
+                with self._lock:
+                    self._pending += 1
+                try:
+                    self._queue.put((now, row), block=self.overflow == 'block')
+                except queue.Full:
+                    with self._lock:
+                        self._pending -= 1
+                    break
+                queued += 1
+        finally:
+            with self._lock:
+                self._putting -= 1
+                self._queued += queued
+                self._dropped += len(rows) - queued
+                self._idle.notify_all()
+        return queued
+    
+    def _collect(self):
+        """
+        Wait for a batch to fill or time out.
+        
+        Returns:
+            tuple: (list of (time queued, row), stop requested)
+        """
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+        
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+    
+    def _write(self, rows):
+        """Insert one batch, retrying once; returns whether it was written."""
+        for attempt in range(2):
+            try:
+                with self.app.app_context():
+                    insert_prediction_logs(rows)
+                return True
+            except Exception as e:
+                if attempt == 0:
+                    time.sleep(_RETRY_DELAY)
+                else:
+                    print(f"✗ Error: Dropped {len(rows)} prediction logs: {e}")
+        return False
+    
+    def _write_batch(self, batch):
+        """Write one batch of (time queued, row) items and record the outcome."""
+        written = self._write([row for _, row in batch])
+        lag = time.monotonic() - batch[0][0]
+        with self._lock:
+            if written:
+                self._written += len(batch)
+            else:
+                self._failed += len(batch)
+            self._batches += 1
+            self._last_lag = lag
+            self._max_lag = max(self._max_lag, lag)
+            self._pending -= len(batch)
+            self._idle.notify_all()
+    
+    def _run(self):
+        """Worker loop: collect and write batches until stopped."""
+        while True:
+            batch, stop = self._collect()
+            if batch:
+                self._write_batch(batch)
+            if stop:
+                break
+        
+        # Rows queued behind the stop marker, by callers still blocked on a full
+        # queue when close() stopped waiting for them
+        rest = []
+        while True:
+            try:
+                rest.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        for i in range(0, len(rest), self.batch_size):
+            self._write_batch(rest[i:i + self.batch_size])
+    
+    def flush(self, timeout=None):
+        """
+        Wait until every queued row has been written (or failed).
+        
+        Args:
+            timeout (float, optional): Seconds to wait
+        
+        Returns:
+            bool: True if the queue drained in time
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+    
+    def stats(self):
+        """
+        Queue and write metrics.
+        
+        Returns:
+            dict: Queue depth and bound, age of the oldest queued row, the
+                  queue-to-commit lag of the last and slowest batch, and
+                  counts of rows queued, written, dropped and failed
+        """
+        with self._queue.mutex:
+            oldest = self._queue.queue[0] if self._queue.queue else None
+        oldest_age = (time.monotonic() - oldest[0]) if isinstance(oldest, tuple) else 0.0
+        
+        with self._lock:
+            return {
+                'queue_depth': self._queue.qsize(),
+                'queue_size': self.queue_size,
+                'overflow': self.overflow,
+                'oldest_queued_ms': round(oldest_age * 1000, 1),
+                'last_lag_ms': round(self._last_lag * 1000, 1),
+                'max_lag_ms': round(self._max_lag * 1000, 1),
+                'queued': self._queued,
+                'written': self._written,
+                'dropped': self._dropped,
+                'failed': self._failed,
+                'batches': self._batches,
+            }
+    
+    def close(self, timeout=None):
+        """
+        Write everything already queued, then stop the worker.
+        
+        Args:
+            timeout (float, optional): Seconds to wait for the worker
+        """
+        with self._idle:
+            if self._closed:
+                return
+            self._closed = True
+            # Callers blocked on a full queue finish once the worker makes room
+            self._idle.wait_for(lambda: self._putting == 0, timeout)
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
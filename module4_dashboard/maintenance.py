@@ -0,0 +1,58 @@
+"""
+Database maintenance commands for the admin dashboard.
+
+Usage:
+    python module4_dashboard/maintenance.py rebuild-stats
+    python module4_dashboard/maintenance.py rebuild-daily [--since YYYY-MM-DD]
+"""
+
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+from flask import Flask
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from module4_dashboard.database import init_db, rebuild_prediction_stats, rebuild_daily_rollup
+
+
+def rebuild_stats(app, args):
+    """Recount the dashboard's prediction totals from the logs."""
+    with app.app_context():
+        counts = rebuild_prediction_stats()
+    print(f"✓ Prediction stats rebuilt: {counts['total']} total, {counts['fake']} fake, "
+          f"{counts['real']} real")
+
+
+def rebuild_daily(app, args):
+    """Recompute the daily rollup from the logs, from --since or for all history."""
+    with app.app_context():
+        days = rebuild_daily_rollup(since=args.since)
+    print(f"✓ Daily rollup rebuilt: {days} days" + (f" since {args.since}" if args.since else ""))
+
+
+COMMANDS = {
+    'rebuild-stats': rebuild_stats,
+    'rebuild-daily': rebuild_daily,
+}
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Module 4: Database maintenance")
+    parser.add_argument('command', choices=sorted(COMMANDS),
+                        help='rebuild-stats: recount prediction_stats from prediction_logs; '
+                             'rebuild-daily: recompute prediction_daily from prediction_logs')
+    parser.add_argument('--since', type=date.fromisoformat, default=None,
+                        help='first day (YYYY-MM-DD) to recompute with rebuild-daily')
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    app = Flask(__name__)
+    init_db(app)
+    COMMANDS[args.command](app, args)
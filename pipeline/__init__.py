@@ -0,0 +1,5 @@
+"""
+Incremental training pipeline shared by Module 1 and Module 2
+"""
+
+__version__ = "1.0.0"
@@ -0,0 +1,240 @@
+"""
+Incremental pipeline runner.
+Each stage is fingerprinted from its code version, the config values it
+reads and the fingerprints of its inputs. Cached stages store their output
+under that fingerprint and are only recomputed when it changes.
+"""
+
+import hashlib
+import json
+import os
+import time
+import joblib
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+from config.config import PIPELINE_CACHE_DIR, PIPELINE_CACHE_KEEP
+
+
+class Stage:
+    """
+    One step of the pipeline.
+    
+    Attributes:
+        name (str): Stage name, also used in artifact file names
+        func (callable): Called with the outputs of `inputs`, in order;
+                         returning None marks the stage as failed
+        inputs (tuple): Names of upstream stages
+        config (dict): Config values the output depends on
+        version (int): Bump when the stage's code changes its output
+        extra (callable): Returns extra fingerprint data computed at run time
+                          (e.g. the raw file's size and mtime)
+        cache (bool): Persist the output; uncached stages are recomputed
+                      whenever a downstream stage needs them
+        save, load (callable): Artifact writer (output, path) and reader (path);
+                               default to joblib
+        suffix (str): Artifact file extension
+    """
+    
+    def __init__(self, name, func, inputs=(), config=None, version=1, extra=None,
+                 cache=True, save=None, load=None, suffix='.joblib'):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.config = config or {}
+        self.version = version
+        self.extra = extra
+        self.cache = cache
+        self.save = save or joblib.dump
+        self.load = load or joblib.load
+        self.suffix = suffix
+
+
+class Pipeline:
+    """
+    Lazily evaluated DAG of stages.
+    
+    get() resolves a stage by loading its artifact when the fingerprint is
+    unchanged and only pulling (and running) upstream stages otherwise, so a
+    change that only affects late stages never touches the early ones.
+    """
+    
+    def __init__(self, stages, cache_dir=None, keep=None, force=(), use_cache=True):
+        """
+        Args:
+            stages (list): Stage objects; inputs must be defined before use
+            cache_dir (str, optional): Artifact directory. Defaults to config.PIPELINE_CACHE_DIR
+            keep (int, optional): Artifacts kept per stage. Defaults to config.PIPELINE_CACHE_KEEP
+            force (iterable): Stage names to recompute even if cached, along
+                              with every stage downstream of them
+            use_cache (bool): False recomputes every stage and writes nothing
+        """
+        if cache_dir is None:
+            cache_dir = PIPELINE_CACHE_DIR
+        if keep is None:
+            keep = PIPELINE_CACHE_KEEP
+        
+        self.stages = {}
+        for stage in stages:
+            unknown = [name for name in stage.inputs if name not in self.stages]
+            if unknown:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {unknown}")
+            self.stages[stage.name] = stage
+        
+        unknown = [name for name in force if name not in self.stages]
+        if unknown:
+            raise ValueError(f"Unknown stages: {unknown}")
+        
+        self.cache_dir = Path(cache_dir)
+        self.keep = keep
+        # Forcing a stage only matters if its dependents are recomputed too
+        self.force = set(force)
+        for stage in self.stages.values():
+            if self.force.intersection(stage.inputs):
+                self.force.add(stage.name)
+        self.use_cache = use_cache
+        self._fingerprints = {}
+        self._outputs = {}
+    
+    def fingerprint(self, name):
+        """
+        Get a stage's fingerprint without running anything.
+        
+        Args:
+            name (str): Stage name
+        
+        Returns:
+            str: Hex digest over code version, config, extra data and inputs
+        """
+        if name not in self._fingerprints:
+            stage = self.stages[name]
+            payload = {
+                'stage': name,
+                'version': stage.version,
+                'config': stage.config,
+                'extra': stage.extra() if stage.extra else None,
+                'inputs': [self.fingerprint(upstream) for upstream in stage.inputs],
+            }
+            encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+            self._fingerprints[name] = hashlib.blake2b(encoded, digest_size=8).hexdigest()
+        return self._fingerprints[name]
+    
+    def artifact_path(self, name):
+        """Path of a stage's artifact for its current fingerprint."""
+        stage = self.stages[name]
+        return self.cache_dir / f"{name}-{self.fingerprint(name)}{stage.suffix}"
+    
+    def is_cached(self, name):
+        """Whether a stage's current output can be loaded instead of computed."""
+        stage = self.stages[name]
+        return (self.use_cache and stage.cache and name not in self.force
+                and self.artifact_path(name).exists())
+    
+    def plan(self, targets):
+        """
+        Work out which stages a run of `targets` will load, run or skip.
+        
+        Args:
+            targets (list): Stage names to resolve
+        
+        Returns:
+            list: (name, fingerprint, action) in pipeline order, where action is
+                  'cached', 'run' or 'skip'
+        """
+        needed = {}
+        
+        def visit(name):
+            if name in needed:
+                return
+            if self.is_cached(name):
+                needed[name] = 'cached'
+                return
+            needed[name] = 'run'
+            for upstream in self.stages[name].inputs:
+                visit(upstream)
+        
+        for target in targets:
+            visit(target)
+        return [(name, self.fingerprint(name), needed.get(name, 'skip')) for name in self.stages]
+    
+    def print_plan(self, targets):
+        """Print the plan for `targets`."""
+        print("Pipeline plan:")
+        for name, fingerprint, action in self.plan(targets):
+            print(f"  {name:<28} {fingerprint}  {action}")
+    
+    def get(self, name):
+        """
+        Resolve a stage's output, loading or computing it as needed.
+        
+        Args:
+            name (str): Stage name
+        
+        Returns:
+            Stage output, or None if it (or an upstream stage) failed
+        """
+        if name in self._outputs:
+            return self._outputs[name]
+        
+        stage = self.stages[name]
+        path = self.artifact_path(name)
+        if self.is_cached(name):
+            try:
+                output = stage.load(path)
+                print(f"✓ Stage '{name}' loaded from cache ({self.fingerprint(name)})")
+                self._outputs[name] = output
+                return output
+            except Exception as e:
+                print(f"⚠ Warning: Could not load cached '{name}', recomputing: {e}")
+        
+        inputs = []
+        for upstream in stage.inputs:
+            value = self.get(upstream)
+            if value is None:
+                print(f"✗ Error: Stage '{name}' skipped, '{upstream}' failed")
+                return None
+            inputs.append(value)
+        
+        start = time.perf_counter()
+        output = stage.func(*inputs)
+        if output is None:
+            print(f"✗ Error: Stage '{name}' failed")
+            return None
+        print(f"✓ Stage '{name}' computed in {time.perf_counter() - start:.2f}s "
+              f"({self.fingerprint(name)})")
+        
+        if self.use_cache and stage.cache:
+            self._store(stage, output, path)
+        self._outputs[name] = output
+        return output
+    
+    def run(self, targets):
+        """
+        Resolve several stages.
+        
+        Args:
+            targets (list): Stage names
+        
+        Returns:
+            dict: Stage name -> output
+        """
+        return {name: self.get(name) for name in targets}
+    
+    def _store(self, stage, output, path):
+        """Write an artifact atomically, then prune old ones for the stage."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            stage.save(output, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"⚠ Warning: Could not cache stage '{stage.name}': {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        
+        old = sorted(self.cache_dir.glob(f"{stage.name}-*{stage.suffix}"),
+                     key=lambda p: p.stat().st_mtime, reverse=True)
+        for stale in old[self.keep:]:
+            stale.unlink(missing_ok=True)
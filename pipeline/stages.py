@@ -0,0 +1,160 @@
+"""
+Stage definitions for the training pipeline.
+load -> merge -> clean -> vectorize -> split -> train -> evaluate, shared by
+module 1 and module 2 so neither recomputes work the other already cached.
+"""
+
+import hashlib
+import sys
+from pathlib import Path
+
+from sklearn.model_selection import train_test_split
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+from config.config import (
+    RAW_DATA_PATH,
+    TEXT_COLUMNS,
+    TARGET_COLUMN,
+    TEST_SIZE,
+    RANDOM_STATE,
+    LOGISTIC_REGRESSION_PARAMS,
+    RANDOM_FOREST_PARAMS
+)
+from module1_data_preprocessing.data_loader import load_dataset, merge_text_columns
+from module1_data_preprocessing.text_preprocessor import preprocess_dataframe, cleaning_key
+from module1_data_preprocessing.feature_extractor import (
+    extract_features, vectorizer_config, FEATURES_VERSION
+)
+from module1_data_preprocessing.feature_store import save_features, load_features
+from module1_data_preprocessing.processed_store import (
+    save_processed_data,
+    load_processed_data,
+    resolve_format
+)
+from module2_model_training.model_trainer import train_logistic_regression, train_random_forest
+from module2_model_training.model_evaluator import evaluate_model
+from pipeline.runner import Stage, Pipeline
+
+# Stages in dependency order
+STAGE_NAMES = [
+    'load', 'merge', 'clean', 'vectorize', 'split',
+    'train_logistic_regression', 'train_random_forest', 'evaluate'
+]
+
+
+def _source_digest(file_path=None):
+    """
+    Hash the raw dataset's contents, so touching or copying it keeps the cache.
+    
+    Returns:
+        str: Hex digest, or None if the file is missing
+    """
+    if file_path is None:
+        file_path = RAW_DATA_PATH
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def _vectorize(df, n_jobs=None):
+    """Fit the TF-IDF vectorizer and transform the cleaned text."""
+    if TARGET_COLUMN not in df.columns:
+        print(f"✗ Error: '{TARGET_COLUMN}' column not found in dataset")
+        return None
+    X, vectorizer = extract_features(df, text_column='text_cleaned', fit=True, n_jobs=n_jobs)
+    return {
+        'X': X,
+        'y': df[TARGET_COLUMN].values,
+        'row_ids': df.index.values,
+        'vectorizer': vectorizer,
+    }
+
+
+def _load_vectorized(path):
+    """Load the vectorize stage's memory-mapped features."""
+    features, _ = load_features(path)
+    if features is None:
+        raise ValueError(f"{path} has an unsupported layout")
+    return features
+
+
+def _split(vectorized):
+    """Stratified train/test split of the feature matrix."""
+    X_train, X_test, y_train, y_test = train_test_split(
+        vectorized['X'], vectorized['y'],
+        test_size=TEST_SIZE, random_state=RANDOM_STATE, stratify=vectorized['y']
+    )
+    print(f"  Training set: {X_train.shape[0]} samples")
+    print(f"  Test set: {X_test.shape[0]} samples")
+    return {'X_train': X_train, 'X_test': X_test, 'y_train': y_train, 'y_test': y_test}
+
+
+def _evaluate(split, lr_model, rf_model):
+    """Evaluate both models on the test split."""
+    return [
+        evaluate_model(lr_model, split['X_test'], split['y_test'], "Logistic Regression"),
+        evaluate_model(rf_model, split['X_test'], split['y_test'], "Random Forest"),
+    ]
+
+
+def build_pipeline(n_jobs=None, chunk_size=None, **kwargs):
+    """
+    Build the training pipeline.
+    
+    Args:
+        n_jobs (int, optional): Worker processes for text cleaning and sharded
+                                vectorizing (-1 for all CPUs)
+        chunk_size (int, optional): Rows per worker task
+        **kwargs: Passed to Pipeline (cache_dir, keep, force, use_cache)
+    
+    Returns:
+        Pipeline: Pipeline over STAGE_NAMES
+    """
+    def clean(df):
+        df = preprocess_dataframe(df, text_column='text', n_jobs=n_jobs, chunk_size=chunk_size)
+        return df[['text_cleaned', TARGET_COLUMN]] if TARGET_COLUMN in df.columns else df[['text_cleaned']]
+    
+    # Cleaned text is stored like module 1's processed data when pyarrow is available
+    if resolve_format('arrow') == 'arrow':
+        clean_store = {
+            'save': lambda df, path: save_processed_data(df, path, fmt='arrow'),
+            'load': lambda path: load_processed_data(path, fmt='arrow')[0],
+            'suffix': '.arrow',
+        }
+    else:
+        clean_store = {}
+    
+    stages = [
+        # Raw data is cheap to re-read and large to copy, so it is not cached
+        Stage('load', lambda: load_dataset(), extra=_source_digest, cache=False),
+        Stage('merge', lambda df: merge_text_columns(df, drop_columns=True), inputs=['load'],
+              config={'TEXT_COLUMNS': TEXT_COLUMNS}, cache=False),
+        Stage('clean', clean, inputs=['merge'], extra=lambda: {'cleaning_key': cleaning_key()},
+              **clean_store),
+        # Features are stored as raw CSR arrays and memory-mapped on load. Sharding
+        # does not change the output, so n_jobs is not part of the fingerprint
+        Stage('vectorize', lambda df: _vectorize(df, n_jobs), inputs=['clean'],
+              version=FEATURES_VERSION, config=vectorizer_config(),
+              save=lambda features, path: save_features(features, path),
+              load=_load_vectorized, suffix='.npz'),
+        # Splitting is a cheap index shuffle; caching it would duplicate the matrix
+        Stage('split', _split, inputs=['vectorize'],
+              config={'TEST_SIZE': TEST_SIZE, 'RANDOM_STATE': RANDOM_STATE}, cache=False),
+        Stage('train_logistic_regression',
+              lambda split: train_logistic_regression(split['X_train'], split['y_train']),
+              inputs=['split'],
+              config={'RANDOM_STATE': RANDOM_STATE, 'PARAMS': LOGISTIC_REGRESSION_PARAMS}),
+        Stage('train_random_forest',
+              lambda split: train_random_forest(split['X_train'], split['y_train']),
+              inputs=['split'],
+              config={'RANDOM_STATE': RANDOM_STATE, 'PARAMS': RANDOM_FOREST_PARAMS}),
+        Stage('evaluate', _evaluate,
+              inputs=['split', 'train_logistic_regression', 'train_random_forest']),
+    ]
+    return Pipeline(stages, **kwargs)
@@ -63,8 +63,10 @@ def download_nltk_data():
     try:
         import nltk
         print("\nDownloading NLTK data...")
+        # Only the reference clean_text() and remove_punctuation=False need
+        # punkt; stopwords are bundled with the code
         nltk.download('punkt', quiet=True)
-        nltk.download('stopwords', quiet=True)
+        nltk.download('punkt_tab', quiet=True)
         print("✓ NLTK data downloaded")
     except Exception as e:
         print(f"⚠ Warning: Could not download NLTK data: {e}")
@@ -0,0 +1,10 @@
+"""
+Shared pytest setup.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root and the web app directory to path, as the apps' entry points do
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / 'module3_web_interface'))
@@ -0,0 +1,68 @@
+"""
+Import-time budgets for the modules the web app and CLIs import first.
+
+Each module is imported in a fresh interpreter, so nothing already loaded
+by pytest hides its cost, and the test fails if the best of a few imports
+exceeds the budget or if a heavy dependency is imported eagerly. NLTK data
+lookups point at an unreachable path, so a lookup or download at import
+time fails loudly.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+RUNS = 3
+
+# Generous for slow CI machines. Warm imports take ~30 ms and ~320 ms (mostly
+# numpy/scipy); importing scikit-learn alone takes over a second
+BUDGETS = [
+    ('module1_data_preprocessing.text_preprocessor', 150,
+     ['nltk', 'bs4', 'pandas', 'sklearn', 'pyarrow']),
+    ('module3_web_interface.prediction_service', 800,
+     ['sklearn', 'pandas', 'nltk', 'bs4', 'pyarrow', 'joblib']),
+]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'ms': elapsed * 1000, 'modules': sorted(sys.modules)}}))
+"""
+
+
+def import_profile(module):
+    """
+    Import a module in a fresh interpreter.
+    
+    Args:
+        module (str): Dotted module name
+    
+    Returns:
+        tuple: (import time in ms, set of names in sys.modules afterwards)
+    """
+    env = dict(os.environ, NLTK_DATA=os.devnull)
+    result = subprocess.run(
+        [sys.executable, '-c', _PROBE.format(module=module)],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    profile = json.loads(result.stdout.strip().splitlines()[-1])
+    return profile['ms'], set(profile['modules'])
+
+
+@pytest.mark.parametrize('module, budget_ms, lazy_modules', BUDGETS,
+                         ids=[module for module, _, _ in BUDGETS])
+def test_import_budget(module, budget_ms, lazy_modules):
+    runs = [import_profile(module) for _ in range(RUNS)]
+    best_ms = min(ms for ms, _ in runs)
+    eager = [name for name in lazy_modules if name in runs[0][1]]
+    
+    assert not eager, f"{module} imports {', '.join(eager)} eagerly"
+    assert best_ms <= budget_ms, f"{module} took {best_ms:.0f} ms to import (budget {budget_ms} ms)"
@@ -0,0 +1,144 @@
+"""
+PredictionService must score a posting the way the sklearn artifacts do.
+
+predict() with the compact vectorizer and a linear model takes the fused
+path (CompactVectorizer.transform_row + LinearScorer.score_row), and
+predict_batch() goes through CompactVectorizer.transform and
+LinearScorer.predict_proba; both are checked against the fitted
+TfidfVectorizer.transform + LogisticRegression.predict_proba they were
+exported from.
+"""
+
+import numpy as np
+import pytest
+
+from test_text_cleaner import _has_punkt
+
+pytestmark = pytest.mark.skipif(not _has_punkt(), reason="NLTK punkt data not installed")
+
+# Float64 weights agree with sklearn to rounding error (~1e-15)
+TOLERANCE = 1e-9
+
+
+def _postings(n, seed):
+    """Synthetic postings as predict_batch() request dicts."""
+    from benchmarks.synthetic_data import make_postings
+    
+    frame = make_postings(n, seed=seed).fillna('')
+    return [{'job_description': d, 'requirements': r, 'benefits': b}
+            for d, r, b in zip(frame['description'], frame['requirements'], frame['benefits'])]
+
+
+@pytest.fixture(scope='module')
+def artifacts(tmp_path_factory):
+    """Fitted sklearn vectorizer and model, and their exported serving artifacts."""
+    from sklearn.linear_model import LogisticRegression
+    import config.config as config
+    from benchmarks.synthetic_data import make_postings
+    from module1_data_preprocessing.data_loader import merge_text_columns
+    from module1_data_preprocessing.text_preprocessor import preprocess_dataframe
+    from module1_data_preprocessing.feature_extractor import create_tfidf_vectorizer
+    from module1_data_preprocessing.vectorizer_store import export_vectorizer, load_compact_vectorizer
+    from module2_model_training.linear_model_store import export_linear_model, load_linear_model
+    
+    train = merge_text_columns(make_postings(1000), verbose=False, drop_columns=True)
+    train = preprocess_dataframe(train, text_column='text', cache=False, verbose=False)
+    vectorizer = create_tfidf_vectorizer()
+    model = LogisticRegression(max_iter=1000).fit(vectorizer.fit_transform(train['text_cleaned']),
+                                                  train[config.TARGET_COLUMN])
+    
+    tmp = tmp_path_factory.mktemp('artifacts')
+    export_vectorizer(vectorizer, tmp / 'vectorizer.npz')
+    export_linear_model(model, tmp / 'linear_model.npz', dtype='float64')
+    return {
+        'vectorizer': vectorizer,
+        'model': model,
+        'compact': load_compact_vectorizer(tmp / 'vectorizer.npz'),
+        'scorer': load_linear_model(tmp / 'linear_model.npz'),
+    }
+
+
+@pytest.fixture(scope='module')
+def service(artifacts):
+    """Service on the exported artifacts, without the result cache."""
+    from prediction_service import PredictionService
+    
+    return PredictionService(artifacts['scorer'], artifacts['compact'], cache=False)
+
+
+@pytest.fixture(scope='module')
+def postings():
+    """Held-out postings, plus ones that fail before scoring."""
+    return _postings(200, seed=7) + [
+        {'job_description': ''},
+        {'job_description': 'the and of', 'requirements': 'a an'},
+    ]
+
+
+def _reference(service, artifacts, posting):
+    """Class probabilities from sklearn's transform + predict_proba."""
+    tokens, error = service._tokens(posting.get('job_description', ''),
+                                    posting.get('requirements', ''),
+                                    posting.get('benefits', ''))
+    if error:
+        return None
+    X = artifacts['vectorizer'].transform([tokens])
+    return artifacts['model'].predict_proba(X)[0]
+
+
+def _assert_matches(result, probabilities):
+    """A service result agrees with reference probabilities (rounded to 2 dp)."""
+    assert result['prediction'] == int(np.argmax(probabilities))
+    assert result['probabilities']['real'] == pytest.approx(probabilities[0] * 100, abs=0.005 + TOLERANCE)
+    assert result['probabilities']['fake'] == pytest.approx(probabilities[1] * 100, abs=0.005 + TOLERANCE)
+
+
+def test_fused_score_matches_sklearn(service, artifacts, postings):
+    from module1_data_preprocessing.vectorizer_store import CompactVectorizer
+    from module2_model_training.linear_model_store import LinearScorer
+    
+    assert isinstance(service.vectorizer, CompactVectorizer)
+    assert isinstance(service.model, LinearScorer)
+    
+    for posting in postings:
+        expected = _reference(service, artifacts, posting)
+        if expected is None:
+            continue
+        tokens, _ = service._tokens(posting['job_description'], posting['requirements'],
+                                    posting['benefits'])
+        classes, probabilities = service._score(tokens, service.model, service.vectorizer)
+        assert list(classes) == list(artifacts['model'].classes_)
+        assert np.asarray(probabilities) == pytest.approx(expected, abs=TOLERANCE)
+
+
+def test_predict_matches_sklearn(service, artifacts, postings):
+    for posting in postings:
+        expected = _reference(service, artifacts, posting)
+        result = service.predict(**posting)
+        if expected is None:
+            assert 'error' in result
+            continue
+        _assert_matches(result, expected)
+
+
+def test_predict_batch_matches_sklearn(service, artifacts, postings):
+    results = service.predict_batch(postings)
+    
+    assert len(results) == len(postings)
+    for posting, result in zip(postings, results):
+        expected = _reference(service, artifacts, posting)
+        if expected is None:
+            assert 'error' in result
+            continue
+        _assert_matches(result, expected)
+
+
+def test_predict_batch_matches_predict(service, postings):
+    singles = [service.predict(**posting) for posting in postings]
+    
+    for single, batched in zip(singles, service.predict_batch(postings)):
+        if 'error' in single:
+            assert batched == single
+            continue
+        assert batched['prediction'] == single['prediction']
+        assert batched['probabilities']['fake'] == pytest.approx(single['probabilities']['fake'], abs=0.01)
@@ -0,0 +1,99 @@
+"""
+TextCleaner must produce exactly what clean_text() produces.
+
+The batch engine skips BeautifulSoup and NLTK's tokenizer unless an input
+needs them (fast_remove_html_tags, _needs_word_tokenizer); these cases
+exercise the inputs where those shortcuts and their fallbacks matter.
+"""
+
+import pytest
+
+from module1_data_preprocessing.text_preprocessor import TextCleaner, clean_text
+
+
+def _has_punkt():
+    """NLTK's punkt data, which clean_text() needs for stopword removal."""
+    nltk = pytest.importorskip('nltk')
+    for resource in ('tokenizers/punkt_tab', 'tokenizers/punkt'):
+        try:
+            nltk.data.find(resource)
+            return True
+        except LookupError:
+            pass
+    return False
+
+
+pytestmark = pytest.mark.skipif(not _has_punkt(), reason="NLTK punkt data not installed")
+
+HTML_ENTITIES = [
+    "Salary &amp; benefits",
+    "&nbsp;Remote&nbsp;role&nbsp;",
+    "Caf&eacute; staff &#169; 2024 &#x2014; apply",
+    "AT&T and R&D roles",
+    "Fish &chips &copy &notit; &amp",
+    "<p>Hello&nbsp;<b>world</b></p>",
+    "<script>alert(1)</script>Job posting",
+    "<!-- comment -->Hiring <?xml version='1.0'?> now",
+    "<pre>  keep   spacing  </pre> done",
+    "a < b and c > d",
+    "<br/>Line<br>break<p>   </p>end",
+    "</>text <a href='x'>link</a> <unclosed",
+    "<div class=\"job\"><ul><li>One</li><li>Two</li></ul></div>",
+]
+
+CONTRACTIONS = [
+    "We cannot accept late applications",
+    "You're gonna love it here",
+    "gotta go, wanna join?",
+    "Lemme know; gimme a call",
+    "CANNOT WANNA GONNA",
+    "wannabe developers and gonnabe managers",
+    "don't won't can't shouldn't",
+    "I'd we'll they've it's",
+]
+
+PUNCTUATION_RUNS = [
+    "Wow!!! ... really???",
+    "--- Apply now --- !!!",
+    "e-mail: jobs@company.com, tel: +1 (555) 010-9999",
+    "$$$ Earn $5,000/week!!!",
+    "(((nested))) [[brackets]] {{braces}}",
+    "...",
+    "'quoted' \"double\" ``backticks''",
+    "end of sentence.Next sentence!Another?",
+]
+
+NON_ASCII = [
+    "Café résumé naïve façade",
+    "“Smart quotes” and ‘single’ quotes",
+    "em—dash – en dash ‒ figure dash ― bar",
+    "İstanbul office cannot wait",
+    "ınvalid gonna",
+    "日本語 テキスト 求人",
+    "Straße GROSS ǅ titlecase",
+    "emoji 🚀 launch ✨",
+    "non\u00a0breaking\u2003spaces\u3000wide",
+    "«guillemets» „low quotes“",
+    "ﬁ ligature ﬀ",
+]
+
+MISSING = [None, float('nan'), "", "   \t\n ", 12345]
+
+OPTIONS = [
+    {},
+    {'remove_punctuation': False},
+    {'remove_stopwords': False},
+    {'remove_html': False},
+    {'lowercase': False},
+]
+
+
+@pytest.mark.parametrize('options', OPTIONS, ids=lambda options: ','.join(options) or 'default')
+@pytest.mark.parametrize('text', HTML_ENTITIES + CONTRACTIONS + PUNCTUATION_RUNS + NON_ASCII + MISSING)
+def test_clean_matches_clean_text(text, options):
+    assert TextCleaner(**options).clean(text) == clean_text(text, **options)
+
+
+def test_clean_many_matches_clean_text():
+    texts = HTML_ENTITIES + CONTRACTIONS + PUNCTUATION_RUNS + NON_ASCII + MISSING
+    assert TextCleaner().clean_many(texts) == [clean_text(text) for text in texts]